@@ -25,5 +25,8 @@ setup(
         "requests>=2.22.0",
         "tqdm>=4.41.1",
         "pandas>=0.25.3"
-    ]
+    ],
+    extras_require={
+        "async": ["aiohttp>=3.8"],
+    }
 )
@@ -0,0 +1,90 @@
+import importlib.util
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from zipfile import ZipFile
+
+if importlib.util.find_spec("aiohttp") is not None:
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+    from xbrr.base.client.async_session import AsyncSession
+    from xbrr.edinet.client.async_client import AsyncDocumentClient, AsyncDocumentListClient, AsyncMetaDataClient
+
+
+def edinet_document(doc_id:str) -> dict:
+    return {
+        "seqNumber": 1, "docID": doc_id, "edinetCode": "E05739", "secCode": "39210", "JCN": "",
+        "filerName": "ネオジャパン", "fundCode": None, "ordinanceCode": "010", "formCode": "030000",
+        "docTypeCode": "120", "periodStart": "2022-02-01", "periodEnd": "2023-01-31",
+        "submitDateTime": "2023-04-26 15:00", "docDescription": "有価証券報告書", "issuerEdinetCode": None,
+        "subjectEdinetCode": None, "subsidiaryEdinetCode": None, "currentReportReason": None,
+        "parentDocID": None, "opeDateTime": None, "withdrawalStatus": "0", "docInfoEditStatus": "0",
+        "disclosureStatus": "0", "xbrlFlag": "1", "pdfFlag": "1", "attachDocFlag": "0", "englishDocFlag": "0",
+    }
+
+
+def xbrl_zip() -> bytes:
+    buffer = io.BytesIO()
+    with ZipFile(buffer, "w") as zip:
+        zip.writestr("XBRL/PublicDoc/sample.xbrl", "<xbrli:xbrl/>")
+        zip.writestr("XBRL/PublicDoc/sample.xsd", "<xsd:schema/>")
+    return buffer.getvalue()
+
+
+@unittest.skipIf(importlib.util.find_spec("aiohttp") is None, "aiohttp is not installed")
+class TestAsyncClient(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.requests = []
+
+        async def documents(request):
+            self.requests.append(dict(request.query))
+            if request.query["Subscription-Key"] != "key":
+                return web.json_response({"metadata": {"status": "401", "message": "Access denied"}}, status=401)
+            results = [edinet_document("S100QVOK"), edinet_document("S100QVOL")]
+            return web.json_response({"metadata": {"resultset": {"count": len(results)}}, "results": results})
+
+        async def document(request):
+            return web.Response(body=xbrl_zip(), content_type="application/octet-stream",
+                                headers={"content-disposition": f'attachment; filename="{request.match_info["doc_id"]}.zip"'})
+
+        app = web.Application()
+        app.router.add_get("/api/v2/documents.json", documents)
+        app.router.add_get("/api/v2/documents/{doc_id}", document)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.base_url = str(self.server.make_url("/api/")) + "{}/{}"
+        self.session = AsyncSession(max_concurrency=2, retries=0)
+        self._dir = tempfile.mkdtemp()
+
+    async def asyncTearDown(self):
+        await self.session.close()
+        await self.server.close()
+        shutil.rmtree(self._dir)
+
+    async def test_document_list(self):
+        client = AsyncDocumentListClient(apikey="key", base_url=self.base_url, session=self.session)
+        documents = await client.get("2023-04-26")
+        self.assertEqual(documents.metadata.count, 2)
+        self.assertEqual([d.document_id for d in documents.list], ["S100QVOK", "S100QVOL"])
+        self.assertEqual(self.requests[-1], {"date": "2023-04-26", "type": "2", "Subscription-Key": "key"})
+
+        metadata = await AsyncMetaDataClient(apikey="key", base_url=self.base_url, session=self.session).get("2023-04-26")
+        self.assertEqual(metadata.count, 2)
+
+    async def test_document_list_error(self):
+        client = AsyncDocumentListClient(apikey="wrong", base_url=self.base_url, session=self.session)
+        with self.assertRaises(Exception):
+            await client.get("2023-04-26")
+
+    async def test_get_xbrl(self):
+        client = AsyncDocumentClient(apikey="key", base_url=self.base_url, session=self.session)
+        path = await client.get_xbrl("S100QVOK", save_dir=self._dir)
+        self.assertEqual(path.name, "S100QVOK.xbrl")
+        self.assertTrue(os.path.isfile(path))
+
+        path = await client.get_xbrl_dir("S100QVOL", save_dir=self._dir)
+        self.assertTrue(os.path.isfile(os.path.join(path, "XBRL/PublicDoc/sample.xsd")))
+        self.assertFalse(os.path.exists(os.path.join(self._dir, "S100QVOL.zip")))
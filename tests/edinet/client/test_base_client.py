@@ -0,0 +1,46 @@
+import json
+import unittest
+
+import requests
+
+from xbrr.base.client.session import TimeoutHTTPAdapter, open_session
+from xbrr.edinet.client.document_client import DocumentClient
+from xbrr.edinet.client.document_list_client import DocumentListClient, MetaDataClient
+
+
+class RecordingSession():
+
+    def __init__(self, body:dict):
+        self.body = body
+        self.calls:list[tuple[str, dict]] = []
+
+    def get(self, url, params=None, **kwargs):
+        self.calls.append((url, params))
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(self.body).encode()
+        return response
+
+
+class TestBaseClient(unittest.TestCase):
+
+    def test_shared_session(self):
+        clients = [DocumentClient(apikey="key"), MetaDataClient(apikey="key"), DocumentListClient(apikey="key")]
+        self.assertEqual(len(set([id(c.session) for c in clients])), 1)
+
+        adapter = clients[0].session.get_adapter("https://api.edinet-fsa.go.jp/")
+        self.assertIsInstance(adapter, TimeoutHTTPAdapter)
+        self.assertIn(429, adapter.max_retries.status_forcelist)
+
+    def test_injected_session(self):
+        session = RecordingSession({"metadata": {"resultset": {"count": 0}}, "results": []})
+        client = DocumentListClient(apikey="key", session=session)  # type: ignore
+        documents = client.get("2023-04-14")
+        self.assertEqual(documents.metadata.count, 0)
+        self.assertEqual(session.calls[0][1], {"date": "2023-04-14", "type": "2", "Subscription-Key": "key"})
+
+    def test_open_session(self):
+        session = open_session(retries=1, timeout=5, status_forcelist=(503,))
+        adapter = session.get_adapter("http://localhost/")
+        self.assertEqual(adapter.timeout, 5)  # type: ignore
+        self.assertEqual(adapter.max_retries.total, 1)
@@ -1,10 +1,80 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
 import unittest
 from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from xbrr.base.client.response_cache import ResponseCache
 from xbrr.edinet.client.document_list_client import MetaDataClient
 from xbrr.edinet.client.document_list_client import DocumentListClient
+from tests.edinet.client.test_async_client import edinet_document
 from tests.utils import delay
 
 
+class DocumentsHandler(BaseHTTPRequestHandler):
+    requested:list[dict] = []
+
+    def do_GET(self):
+        query = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+        self.requested.append(query)
+        if query["Subscription-Key"] != "key":
+            # EDINET reports an invalid API key in the body with HTTP 200
+            body = {"StatusCode": 401, "message": "Access denied due to invalid subscription key."}
+        else:
+            results = [edinet_document("S100QVOK")]
+            body = {"metadata": {"status": "200", "message": "OK", "resultset": {"count": len(results)}},
+                    "results": results}
+        content = json.dumps(body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestDocumentListCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), DocumentsHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}/api/{{}}/{{}}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        DocumentsHandler.requested = []
+        self._dir = tempfile.mkdtemp()
+        self.cache = ResponseCache(self._dir, ttl=300)
+
+    def tearDown(self):
+        shutil.rmtree(self._dir)
+
+    def test_response_cache(self):
+        client = DocumentListClient(apikey="key", base_url=self.base_url, cache=self.cache)
+        self.assertEqual(client.get("2023-01-31").metadata.count, 1)
+        self.assertEqual(client.get("2023-01-31").metadata.count, 1)
+        self.assertEqual(len(DocumentsHandler.requested), 1)
+
+    def test_error_body_not_cached(self):
+        client = DocumentListClient(apikey="invalid", base_url=self.base_url, cache=self.cache)
+        self.assertEqual(client._get("2023-01-31")["StatusCode"], 401)
+        self.assertFalse(os.path.exists(os.path.join(self._dir, "2023-01-31")))
+        # the valid key is not served the cached error
+        client.apikey = "key"
+        self.assertEqual(client.get("2023-01-31").metadata.count, 1)
+        self.assertEqual(len(DocumentsHandler.requested), 2)
+
+
 class TestDocumentListClient(unittest.TestCase):
 
     @delay
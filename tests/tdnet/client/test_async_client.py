@@ -0,0 +1,103 @@
+import importlib.util
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from zipfile import ZipFile
+
+if importlib.util.find_spec("aiohttp") is not None:
+    import aiohttp
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+    from xbrr.base.client.async_session import AsyncSession
+    from xbrr.tdnet.client.async_client import AsyncDocumentClient, AsyncDocumentListClient
+
+
+def listing_page(rows:list[tuple[str,str,str]], pages:list[str]=[]) -> str:
+    pager = ''.join([f'<div class="pager-M" onclick="pagerLink(\'{page}\')">{i+2}</div>' for i, page in enumerate(pages)])
+    trs = ''.join([f'<tr><td class="kjTime">{time}</td><td class="kjCode">{code}</td><td class="kjName">会社</td>'
+                   f'<td class="kjTitle"><a href="{doc_id}.pdf">決算短信</a></td>'
+                   f'<td class="kjXbrl"><a href="{doc_id}.zip">XBRL</a></td><td class="kjPlace">東</td>'
+                   '<td class="kjHistroy"></td></tr>' for time, code, doc_id in rows])
+    return (f'<html><body><div id="pager-box-top">{pager}</div>'
+            f'<table id="main-list-table">{trs}</table></body></html>')
+
+
+@unittest.skipIf(importlib.util.find_spec("aiohttp") is None, "aiohttp is not installed")
+class TestAsyncClient(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        pages = {
+            "I_list_001_20230414.html": listing_page([("15:00", "39210", "081220230414000001")], ["I_list_002_20230414.html"]),
+            "I_list_002_20230414.html": listing_page([("15:30", "13010", "081220230414000002")]),
+            "limited.html": listing_page([]),
+            "I_list_001_20230417.html": listing_page([("15:00", "39210", "081220230417000001")], ["I_list_002_20230417.html"]),
+        }
+
+        self.limited = 0
+
+        async def page(request):
+            name = request.match_info["name"]
+            if name == "limited.html":
+                self.limited += 1
+                if self.limited == 1:
+                    raise web.HTTPTooManyRequests(headers={"Retry-After": "0"})
+            if name.endswith(".zip"):
+                buffer = io.BytesIO()
+                with ZipFile(buffer, "w") as zip:
+                    zip.writestr("XBRLData/Summary/tse-acedjpsm.xbrl", "<xbrli:xbrl/>")
+                return web.Response(body=buffer.getvalue())
+            if name not in pages:
+                raise web.HTTPNotFound()
+            return web.Response(text=pages[name], content_type="text/html")
+
+        app = web.Application()
+        app.router.add_get("/inbs/{name}", page)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.base_url = str(self.server.make_url("/inbs/")) + "{}"
+        self.session = AsyncSession(max_concurrency=2, retries=0)
+        self._dir = tempfile.mkdtemp()
+
+    async def asyncTearDown(self):
+        await self.session.close()
+        await self.server.close()
+        shutil.rmtree(self._dir)
+
+    async def test_document_list(self):
+        client = AsyncDocumentListClient(session=self.session)
+        client.TDNET_INFO_PAGE = self.base_url.format("I_list_001_{}.html")
+        client.TDNET_INFO_EACH_PAGE = self.base_url
+        documents = await client.get("2023-04-14")
+        self.assertEqual(documents.metadata.count, 2)
+        self.assertEqual([d.document_id for d in documents.list], ["081220230414000001", "081220230414000002"])
+        self.assertEqual(documents.list[1].submitted_date, "2023-04-14 15:30:00")
+
+        documents = await client.get("2023-04-15")
+        self.assertEqual(documents.metadata.count, 0)
+        self.assertIsNone(client.cache)
+
+        # the rows of the pages already read are returned with the status of the failed page
+        body = await client._get("2023-04-17")
+        self.assertEqual(body["metadata"], {"resultset": {"count": 1}, "status": "404"})
+        self.assertEqual(body["results"][0]["Tdnet"]["company_code"], "39210")
+
+    async def test_get_xbrl(self):
+        client = AsyncDocumentClient(base_url=self.base_url, session=self.session)
+        path = await client.get_xbrl("081220230414000001", save_dir=self._dir)
+        self.assertTrue(os.path.isfile(os.path.join(path, "XBRLData/Summary/tse-acedjpsm.xbrl")))
+        self.assertFalse(os.path.exists(os.path.join(self._dir, "081220230414000001.zip")))
+
+    async def test_retry(self):
+        async with AsyncSession(retries=2, backoff_factor=0) as session:
+            async with session.get(self.base_url.format("limited.html")) as response:
+                self.assertEqual(response.status, 200)
+            self.assertEqual(self.limited, 2)
+
+            # connection errors are retried, and raised after the last retry
+            url = self.base_url.format("limited.html")
+            await self.server.close()
+            with self.assertRaises(aiohttp.ClientConnectionError):
+                async with session.get(url):
+                    pass
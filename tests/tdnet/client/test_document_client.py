@@ -0,0 +1,163 @@
+import io
+import os
+import threading
+import unittest
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from xbrr.base.client.document_pipeline import run_pipeline
+from xbrr.base.client.session import shared_session
+from xbrr.base.reader.zip_archive import ZipArchive
+from xbrr.tdnet.client.document_client import DocumentClient
+from xbrr.tdnet.reader.doc import Doc
+
+
+def zip_dir(root_dir: str) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip:
+        for dirpath, _, files in os.walk(root_dir):
+            for file in files:
+                path = os.path.join(dirpath, file)
+                zip.write(path, os.path.relpath(path, root_dir))
+    return buffer.getvalue()
+
+
+class ZipHandler(BaseHTTPRequestHandler):
+    files:dict[str, bytes] = {}
+
+    def do_GET(self):
+        name = self.path.split("/")[-1]
+        if name not in self.files:
+            self.send_error(404)
+            return
+        body = self.files[name]
+        self.send_response(200)
+        self.send_header("Content-Type", "application/zip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestDocumentClient(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        _dir = os.path.join(os.path.dirname(__file__), "../data")
+        ZipHandler.files = {f"{name}.zip": zip_dir(os.path.join(_dir, name))
+                            for name in ["081220210818487667", "E24982"]}
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), ZipHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}/inbs/{{}}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def test_get_xbrl_archive(self):
+        client = DocumentClient(base_url=self.base_url)
+        with client.get_xbrl_archive("E24982") as archive:
+            doc = Doc(xbrl_kind="public", archive=archive)
+            self.assertEqual(doc.xbrl_file, "XBRLData/Attachment/tse-acedjpfr-36450-2021-05-31-01-2021-07-14.xbrl")
+            self.assertEqual(doc.company_code, "36450")
+            self.assertGreater(len(doc.xsd.find_all("element")), 0)
+
+    def test_get_buffer_spooled(self):
+        client = DocumentClient(base_url=self.base_url)
+        buffer = client.get_buffer("E24982.zip", max_size=1024)
+        self.assertEqual(buffer.read(), ZipHandler.files["E24982.zip"])
+        self.assertTrue(buffer._rolled)  # type: ignore
+        buffer.close()
+
+    def test_iter_xbrl(self):
+        client = DocumentClient(base_url=self.base_url)
+        ids = ["081220210818487667", "E24982", "081220210818487667"]
+        results = list(client.iter_xbrl(ids, lambda archive: Doc.find_report("", archive=archive).company_code))
+        self.assertEqual(results, [("081220210818487667", "59710"), ("E24982", "36450"), ("081220210818487667", "59710")])
+
+    def test_iter_xbrl_close(self):
+        client = DocumentClient(base_url=self.base_url)
+        archives:list[ZipArchive] = []
+        def parse(archive: ZipArchive) -> str:
+            archives.append(archive)
+            return archive.names[0]
+        results = list(client.iter_xbrl(["E24982", "081220210818487667"], parse))
+        self.assertEqual(len(results), 2)
+        self.assertTrue(all(archive.zip.fp is None and archive.file.closed for archive in archives))  # type: ignore
+
+    def test_shared_session(self):
+        self.assertIs(DocumentClient().session, DocumentClient().session)
+        self.assertIs(DocumentClient().session, shared_session("tdnet"))
+
+    def test_iter_xbrl_error(self):
+        client = DocumentClient(base_url=self.base_url)
+        results = client.iter_xbrl(["E24982", "missing"], lambda archive: archive.names[0])
+        self.assertEqual(next(results)[0], "E24982")
+        with self.assertRaises(Exception):
+            next(results)
+
+
+class TestZipArchive(unittest.TestCase):
+
+    def test_read_in_place(self):
+        _dir = os.path.join(os.path.dirname(__file__), "../data")
+        archive = ZipArchive(io.BytesIO(zip_dir(os.path.join(_dir, "081220210818487667"))))
+        self.assertEqual(archive.glob("XBRLData/Summary/*.xsd"), ["XBRLData/Summary/tse-qcedjpsm-59710-20210818487667.xsd"])
+        self.assertTrue(archive.isfile("XBRLData/Attachment/../Summary/tse-qcedjpsm-59710-20210818487667.xsd"))
+        loaded = archive.load("XBRLData/Attachment/*.xml")
+        self.assertEqual(len(loaded), 4)
+
+        doc = Doc(xbrl_kind="summary", archive=archive)
+        expected = Doc(root_dir=os.path.join(_dir, "081220210818487667"), xbrl_kind="summary")
+        self.assertEqual(str(doc.xbrl), str(expected.xbrl))
+        archive.close()
+
+    def test_close_invalid(self):
+        buffer = io.BytesIO(b"not a zip file")
+        with self.assertRaises(zipfile.BadZipFile):
+            ZipArchive(buffer)
+        self.assertTrue(buffer.closed)
+
+
+class TestPipeline(unittest.TestCase):
+
+    def test_order_and_overlap(self):
+        running:set[str] = set()
+        overlapped = threading.Event()
+        def stage(name):
+            def run(value):
+                running.add(name)
+                if len(running) > 1:
+                    overlapped.set()
+                overlapped.wait(0.5)
+                running.discard(name)
+                return value + [name]
+            return run
+        results = list(run_pipeline(range(4), [lambda i: [i], stage("a"), stage("b")]))
+        self.assertEqual([item for item, _ in results], [0, 1, 2, 3])
+        self.assertEqual(results[3][1], [3, "a", "b"])
+        self.assertTrue(overlapped.is_set())
+
+    def test_stop(self):
+        consumed = []
+        for item, _ in run_pipeline(range(100), [lambda i: i], buffer_size=1):
+            consumed.append(item)
+            if item == 2: break
+        self.assertEqual(consumed, [0, 1, 2])
+
+    def test_release(self):
+        released = []
+        ahead = threading.Event()
+        def first(i):
+            if i == 5: ahead.set()
+            return [i]
+        for item, _ in run_pipeline(range(100), [first, lambda value: value], buffer_size=1,
+                                    release=released.append):
+            if item == 2:
+                ahead.wait(1)
+                break
+        self.assertGreater(len(released), 0)
+        self.assertTrue(all(value[0] > 2 for value in released))
@@ -0,0 +1,144 @@
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from xbrr.base.client.document_range import RateLimiter
+from xbrr.base.client.response_cache import ResponseCache
+from xbrr.tdnet.client.document_list_client import DocumentListClient
+from tests.tdnet.client.test_async_client import listing_page
+
+
+PAGES = {
+    "I_list_001_20230413.html": listing_page([("15:00", "39210", "081220230413000001")]),
+    "I_list_001_20230414.html": listing_page([("15:00", "39210", "081220230414000001")],
+                                             ["I_list_002_20230414.html", "I_list_003_20230414.html"]),
+    "I_list_002_20230414.html": listing_page([("15:30", "13010", "081220230414000002")]),
+    "I_list_003_20230414.html": listing_page([("16:00", "72030", "081220230414000003")]),
+    "I_list_001_20230417.html": listing_page([("15:00", "39210", "081220230417000001")],
+                                             ["I_list_002_20230417.html"]),
+}
+# rate limited pages
+LIMITED = {"I_list_002_20230417.html"}
+
+
+class ListingHandler(BaseHTTPRequestHandler):
+    requested:list[str] = []
+
+    def do_GET(self):
+        name = self.path.split("/")[-1]
+        self.requested.append(name)
+        if name in LIMITED:
+            self.send_response(429)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if name not in PAGES:
+            self.send_error(404)
+            return
+        etag = f'"{hash(PAGES[name])}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = PAGES[name].encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestDocumentListClient(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), ListingHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}/inbs/{{}}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        ListingHandler.requested = []
+        self.client = DocumentListClient()
+        self.client.TDNET_INFO_PAGE = self.base_url.format("I_list_001_{}.html")
+        self.client.TDNET_INFO_EACH_PAGE = self.base_url
+        self._dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self._dir)
+
+    def test_get_range(self):
+        documents = self.client.get_range("2023-04-12", "2023-04-14", max_workers=3, rate=0)
+        self.assertEqual(documents.metadata.count, 4)
+        self.assertEqual([d.document_id for d in documents.list],
+                         ["081220230413000001", "081220230414000001", "081220230414000002", "081220230414000003"])
+
+    def test_get_range_cache(self):
+        self.client.get_range("2023-04-13", "2023-04-14", rate=0, cache_dir=self._dir)
+        self.assertEqual(sorted(os.listdir(self._dir)), ["2023-04-13", "2023-04-14"])
+        self.assertEqual(len(os.listdir(os.path.join(self._dir, "2023-04-14"))), 3 * 2)  # body and meta of the pages
+        ListingHandler.requested = []
+        documents = self.client.get_range("2023-04-13", "2023-04-14", rate=0, cache_dir=self._dir)
+        self.assertEqual(documents.metadata.count, 4)
+        self.assertEqual(ListingHandler.requested, [])
+
+    def test_get_range_failed_page(self):
+        documents = self.client.get_range("2023-04-14", "2023-04-17", rate=0, cache_dir=self._dir)
+        # the first page of 2023-04-17 is kept, but the failed pages are not cached
+        self.assertEqual(documents.metadata.count, 4)
+        self.assertEqual(sorted(os.listdir(self._dir)), ["2023-04-14", "2023-04-17"])
+        ListingHandler.requested = []
+        body = self.client._get(datetime(2023, 4, 17), cache=ResponseCache(self._dir))
+        self.assertEqual(body["metadata"]["status"], "429")
+        self.assertEqual(set(ListingHandler.requested), {"I_list_002_20230417.html"})  # retried after Retry-After
+
+    def test_iter_documents(self):
+        documents = self.client.iter_documents("2023-04-14")
+        self.assertEqual(next(documents).document_id, "081220230414000001")
+        self.assertEqual(ListingHandler.requested, ["I_list_001_20230414.html"])
+        self.assertEqual([d.document_id for d in documents], ["081220230414000002", "081220230414000003"])
+
+    def test_response_cache(self):
+        cache = ResponseCache(self._dir, immutable_days=100000, ttl=0)  # 2023-04-14 is not final yet
+        self.client.cache = cache
+        self.assertEqual(self.client.get("2023-04-14").metadata.count, 3)
+        self.assertEqual(self.client.get("2023-04-14").metadata.count, 3)
+        self.assertEqual(cache.statistics["miss"], 3)
+        self.assertEqual(cache.statistics["revalidated"], 3)
+
+        cache.ttl = 300
+        ListingHandler.requested = []
+        self.assertEqual(self.client.get("2023-04-14").metadata.count, 3)
+        self.assertEqual(ListingHandler.requested, [])
+        self.assertEqual(cache.statistics["hit"], 3)
+        self.assertEqual(cache.statistics["hit_ratio"], 6 / 9)
+
+    def test_response_cache_freshness(self):
+        cache = ResponseCache(self._dir, immutable_days=2, ttl=300)
+        date = datetime(2023, 4, 14)
+        now = datetime(2023, 4, 14, 12, 0)
+        self.assertTrue(cache.is_fresh({"fetched_at": "2023-04-14T11:58:00"}, date, now))
+        self.assertFalse(cache.is_fresh({"fetched_at": "2023-04-14T11:50:00"}, date, now))
+        self.assertTrue(cache.is_fresh({"fetched_at": "2023-04-16T09:00:00"}, date, datetime(2024, 1, 1)))
+        self.assertFalse(cache.is_fresh({"fetched_at": "2023-04-15T09:00:00"}, date, datetime(2024, 1, 1)))
+
+    def test_rate_limiter(self):
+        limiter = RateLimiter(rate=50)
+        start = time.monotonic()
+        for _ in range(5):
+            limiter.wait()
+        self.assertGreaterEqual(time.monotonic() - start, 4 / 50 - 0.01)
@@ -0,0 +1,74 @@
+import asyncio
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from xbrr.tdnet.client.document_list_client import DocumentListClient
+from xbrr.tdnet.client.document_list_poller import DocumentListPoller
+from tests.tdnet.client.test_async_client import listing_page
+
+
+class PollingHandler(BaseHTTPRequestHandler):
+    pages:dict[str,str] = {}
+    requested:list[str] = []
+
+    def do_GET(self):
+        name = self.path.split("/")[-1]
+        self.requested.append(name)
+        if name not in self.pages:
+            self.send_error(404)
+            return
+        body = self.pages[name].encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestDocumentListPoller(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), PollingHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_address[1]}/inbs/{{}}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        PollingHandler.requested = []
+        PollingHandler.pages = {
+            "I_list_001_20230414.html": listing_page([("15:00", "39210", "081220230414000003")], ["I_list_002_20230414.html"]),
+            "I_list_002_20230414.html": listing_page([("14:00", "13010", "081220230414000002"), ("13:00", "72030", "081220230414000001")]),
+        }
+        client = DocumentListClient()
+        client.TDNET_INFO_PAGE = self.base_url.format("I_list_001_{}.html")
+        client.TDNET_INFO_EACH_PAGE = self.base_url
+        self.poller = DocumentListPoller(client)
+
+    def test_poll(self):
+        documents = list(self.poller.poll("2023-04-14"))
+        self.assertEqual([d.document_id for d in documents], ["081220230414000003", "081220230414000002", "081220230414000001"])
+
+        # two new rows push the known row to the 2nd page
+        PollingHandler.requested = []
+        PollingHandler.pages["I_list_001_20230414.html"] = listing_page(
+            [("15:30", "39211", "081220230414000005"), ("15:10", "39212", "081220230414000004"), ("15:00", "39210", "081220230414000003")],
+            ["I_list_002_20230414.html"])
+        documents = list(self.poller.poll("2023-04-14"))
+        self.assertEqual([d.document_id for d in documents], ["081220230414000005", "081220230414000004"])
+        self.assertEqual(PollingHandler.requested, ["I_list_001_20230414.html"])
+
+        self.assertEqual(list(self.poller.poll("2023-04-14")), [])
+
+    def test_stream(self):
+        async def collect():
+            return [d.document_id async for d in self.poller.stream("2023-04-14", interval=0, max_polls=2)]
+        self.assertEqual(asyncio.run(collect()), ["081220230414000003", "081220230414000002", "081220230414000001"])
@@ -0,0 +1,48 @@
+import os
+import unittest
+from datetime import datetime
+
+from xbrr.tdnet.client import listing_parser
+from xbrr.tdnet.models import Document
+
+
+class TestListingParser(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        path = os.path.join(os.path.dirname(__file__), "../data/listing/I_list_001_20230414.html")
+        with open(path, "rb") as f:
+            cls.page = listing_parser.parse_page(f.read())
+
+    def test_iter_entries(self):
+        entries = list(listing_parser.iter_entries(datetime(2023, 4, 14), self.page))
+        self.assertEqual(len(entries), 2)
+        self.assertDictEqual(entries[0]['Tdnet'], {
+            'pubdate': '2023-04-14 15:30:00',
+            'company_code': '39210',
+            'company_name': 'ネオジャパン',
+            'title': '2023年1月期　決算短信〔日本基準〕(連結)',
+            'document_url': 'https://www.release.tdnet.info/inbs/140120230414528931.pdf',
+            'url_xbrl': 'https://www.release.tdnet.info/inbs/081220230414528931.zip',
+            'markets_string': '東',
+            'update_history': '',
+        })
+        self.assertIsNone(entries[1]['Tdnet']['url_xbrl'])
+        self.assertEqual(entries[1]['Tdnet']['update_history'], '2023/04/14 17:00更新')
+
+        document = Document.create(entries[0])
+        self.assertEqual(document.document_id, '081220230414528931')
+        self.assertTrue(document.has_xbrl)
+
+    def test_page_urls(self):
+        self.assertEqual(listing_parser.page_urls(self.page), ['I_list_002_20230414.html', 'I_list_003_20230414.html'])
+
+    def test_parse_page(self):
+        path = os.path.join(os.path.dirname(__file__), "../data/listing/I_list_001_20230414.html")
+        with open(path, "rb") as f:
+            content = f.read()
+        declared = b'<?xml version="1.0" encoding="UTF-8"?>\n' + content
+        for page in [listing_parser.parse_page(declared), listing_parser.parse_page(declared.decode("utf-8")),
+                     listing_parser.parse_page(content.replace(b"charset=UTF-8", b"charset=Shift_JIS").decode("utf-8").encode("cp932"))]:
+            entries = list(listing_parser.iter_entries(datetime(2023, 4, 14), page))
+            self.assertEqual(entries[0]['Tdnet']['company_name'], 'ネオジャパン')
@@ -0,0 +1,89 @@
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+from typing import Optional
+
+from xbrr.base.reader.xbrl_doc import XbrlDoc
+from xbrr.xbrl.reader.analysis_cache import AnalysisCache
+from xbrr.xbrl.reader.element_schema import ElementSchema
+from xbrr.xbrl.reader.element_value import ElementValue
+
+
+class StateReader():
+
+    def __init__(self, xbrl_doc:XbrlDoc, state:Optional[dict]=None):
+        self.xbrl_doc = xbrl_doc
+        self.state = state if state is not None else {}
+
+    def analysis_state(self) -> dict:
+        return self.state
+
+    def restore_analysis(self, state:dict):
+        self.state = state
+
+
+class TestAnalysisCache(unittest.TestCase):
+
+    def setUp(self):
+        self._dir = tempfile.mkdtemp()
+        self.xbrl_file = os.path.join(self._dir, "filing.xbrl")
+        with open(self.xbrl_file, "w") as f:
+            f.write("<xbrli:xbrl/>")
+        with open(os.path.join(self._dir, "filing.xsd"), "w") as f:
+            f.write("<xsd:schema/>")
+        self.cache = AnalysisCache(os.path.join(self._dir, "cache"))
+
+    def tearDown(self):
+        shutil.rmtree(self._dir)
+
+    def test_save_load(self):
+        xbrl_doc = XbrlDoc("edinet", root_dir=self._dir, xbrl_file=self.xbrl_file)
+        reader = StateReader(xbrl_doc)
+        self.assertFalse(self.cache.load(reader))  # type: ignore
+
+        self.cache.save(StateReader(xbrl_doc, {'namespace_dic': {'jppfs_cor': 'ns'}}))  # type: ignore
+        self.assertTrue(self.cache.load(reader))  # type: ignore
+        self.assertDictEqual(reader.state, {'namespace_dic': {'jppfs_cor': 'ns'}})
+
+    def test_save_entry(self):
+        xbrl_doc = XbrlDoc("edinet", root_dir=self._dir, xbrl_file=self.xbrl_file)
+        reader = StateReader(xbrl_doc, {'namespace_dic': {}, 'role_decision_info': None})
+        self.cache.save(reader)  # type: ignore
+        self.cache.save_entry(reader, 'role_decision_info', [{'table': ''}])  # type: ignore
+        self.assertEqual(sorted(os.listdir(self.cache.cache_dir)),
+                         sorted([os.path.basename(self.cache.cache_path(xbrl_doc)),
+                                 os.path.basename(self.cache.cache_path(xbrl_doc, 'role_decision_info'))]))
+
+        restored = StateReader(XbrlDoc("edinet", root_dir=self._dir, xbrl_file=self.xbrl_file))
+        self.assertTrue(self.cache.load(restored))  # type: ignore
+        self.assertEqual(restored.state, {'namespace_dic': {}, 'role_decision_info': [{'table': ''}]})
+
+    def test_pickle(self):
+        xbrl_doc = XbrlDoc("edinet", root_dir=self._dir, xbrl_file=self.xbrl_file)
+        path = self.cache.cache_path(xbrl_doc)
+        restored = pickle.loads(pickle.dumps(self.cache))
+        self.assertEqual(restored.cache_dir, self.cache.cache_dir)
+        self.assertEqual(len(restored._keys), 0)
+        self.assertEqual(restored.cache_path(xbrl_doc), path)
+
+    def test_document_key(self):
+        xbrl_doc = XbrlDoc("edinet", root_dir=self._dir, xbrl_file=self.xbrl_file)
+        key = self.cache.document_key(xbrl_doc)
+        self.assertEqual(key, self.cache.document_key(xbrl_doc))
+        with open(os.path.join(self._dir, "filing.xsd"), "w") as f:
+            f.write("<xsd:schema><xsd:import/></xsd:schema>")
+        self.assertNotEqual(key, self.cache.document_key(xbrl_doc))
+
+    def test_pickle_element_value(self):
+        context_ref = {'id': 'CurrentYearDuration', 'period': '2021-03-31'}
+        value = ElementValue("NetSales", reference="ns#jppfs_cor_NetSales", value="100",
+                             context_ref=context_ref, lazy_schema=lambda: ElementSchema(label="売上高"))
+        restored = pickle.loads(pickle.dumps(value))
+        self.assertEqual(restored.value, "100")
+        self.assertDictEqual(restored.context_ref, context_ref)
+        self.assertFalse(restored.has_schema)
+
+        value.set_schema(ElementSchema(label="売上高"))
+        self.assertEqual(pickle.loads(pickle.dumps(value)).label, "売上高")
@@ -0,0 +1,45 @@
+import unittest
+
+from xbrr.xbrl.reader.context_index import ContextIndex
+from xbrr.xbrl.reader.context_table import ContextTable
+from xbrr.xbrl.reader.element_value import ElementValue
+
+
+class TestContextIndex(unittest.TestCase):
+
+    context_dic = {
+        'CurrentYearInstant': {'id': 'CurrentYearInstant', 'period': '2021-03-31'},
+        'CurrentYearInstant_NonConsolidatedMember': {'id': 'CurrentYearInstant_NonConsolidatedMember', 'period': '2021-03-31',
+                                                     'ConsolidatedOrNonConsolidatedAxis': 'NonConsolidatedMember'},
+        'CurrentQuarterDuration': {'id': 'CurrentQuarterDuration', 'period': '2021-03-31', 'period_start': '2021-01-01'},
+        'CurrentYTDDuration': {'id': 'CurrentYTDDuration', 'period': '2021-03-31', 'period_start': '2020-04-01'},
+        'CurrentYearInstant_ReportableSegmentMember': {'id': 'CurrentYearInstant_ReportableSegmentMember', 'period': '2021-03-31',
+                                                       'OperatingSegmentsAxis': 'ReportableSegmentMember'},
+    }
+
+    def test_select(self):
+        index = ContextIndex(ContextTable(self.context_dic))
+        self.assertEqual(index.select({}, "http://x/role/BalanceSheet"),
+                         {'CurrentYearInstant', 'CurrentQuarterDuration', 'CurrentYTDDuration'})
+        self.assertEqual(index.select({}, "http://x/role/QuarterPeriodIncomeStatement"), {'CurrentYearInstant'})
+        self.assertEqual(index.select({}, "http://x/role/YearToQuarterEndIncomeStatement"),
+                         {'CurrentYearInstant', 'CurrentYTDDuration'})
+        # cons-noncons axis is assigned to the contexts without it
+        self.assertEqual(index.select({'ConsolidatedOrNonConsolidatedAxis': ['NonConsolidatedMember']}, "http://x/role/BS"),
+                         {'CurrentYearInstant_NonConsolidatedMember'})
+        self.assertEqual(index.select({'OperatingSegmentsAxis': ['ReportableSegmentMember']}, "http://x/role/Segment"),
+                         {'CurrentYearInstant_ReportableSegmentMember'})
+
+    def test_select_memoized(self):
+        index = ContextIndex(ContextTable(self.context_dic))
+        selection = index.select({'ConsolidatedOrNonConsolidatedAxis': ['ConsolidatedMember']}, "http://x/role/BS")
+        self.assertIs(index.select({'ConsolidatedOrNonConsolidatedAxis': ['ConsolidatedMember']}, "http://x/role/BS"), selection)
+        self.assertEqual(len(index._selections), 1)
+
+    def test_dedupe(self):
+        index = ContextIndex(ContextTable(self.context_dic))
+        values = [ElementValue("NetSales", value=v, context_ref=self.context_dic[id])
+                  for v, id in [("1", 'CurrentYearInstant'), ("2", 'CurrentYearInstant'),
+                                ("3", 'CurrentYearInstant_NonConsolidatedMember'), ("4", 'CurrentYTDDuration')]]
+        selected = index.dedupe(values, index.select({}, "http://x/role/BS"))
+        self.assertEqual([v.value for v in selected], ["1", "4"])
@@ -0,0 +1,71 @@
+import unittest
+from datetime import date
+
+import pandas as pd
+
+from xbrr.xbrl.reader.context_table import ContextTable
+from xbrr.xbrl.reader.element_value import ElementValue
+
+CONTEXTS = {
+    "CurrentYTDDuration": {"id": "CurrentYTDDuration", "period": "2021-06-30", "period_start": "2021-04-01"},
+    "Prior1YTDDuration": {"id": "Prior1YTDDuration", "period": "2020-06-30", "period_start": "2020-04-01"},
+    "Prior2YearDuration": {"id": "Prior2YearDuration", "period": "2020-03-31", "period_start": "2019-04-01"},
+    "CurrentQuarterInstant_NonConsolidatedMember": {"id": "CurrentQuarterInstant_NonConsolidatedMember", "period": "2021-06-30",
+                                                    "ConsolidatedOrNonConsolidatedAxis": "NonConsolidatedMember"},
+    "Prior1QuarterInstant": {"id": "Prior1QuarterInstant", "period": "2020-06-30"},
+    "FilingDateInstant": {"id": "FilingDateInstant", "period": "2021-08-10"},
+}
+
+
+class TestContextTable(unittest.TestCase):
+
+    def test_frame(self):
+        table = ContextTable(CONTEXTS)
+        self.assertEqual(len(table), 6)
+        self.assertEqual(table.code("Prior1YTDDuration"), 1)
+        row = table.frame.iloc[table.code("CurrentQuarterInstant_NonConsolidatedMember")]
+        self.assertEqual((row['context'], row['relative'], row['span']), ("CurrentQuarterInstant", "Current", "Quarter"))
+        self.assertTrue(row['instant'])
+        self.assertEqual(table.axes["CurrentQuarterInstant_NonConsolidatedMember"],
+                         {"ConsolidatedOrNonConsolidatedAxis": "NonConsolidatedMember"})
+        self.assertTrue(pd.isna(row['period_start']))
+        self.assertEqual(table.frame.iloc[0]['period'], pd.Timestamp(2021, 6, 30))
+        self.assertEqual(ContextTable.classify("FilingDateInstant"), ("", "FilingDate", "Instant"))
+
+    def test_fields(self):
+        table = ContextTable(CONTEXTS)
+        value = ElementValue("jppfs_cor:Assets", value="100", context_ref=CONTEXTS["CurrentQuarterInstant_NonConsolidatedMember"])
+        fields = table.fields["CurrentQuarterInstant_NonConsolidatedMember"]
+        self.assertEqual(fields, ElementValue.context_fields(value.context_ref))
+        self.assertEqual(fields['member'], "")
+        self.assertEqual(list(table.periods(["Prior2YearDuration", "Prior1QuarterInstant"])['id']),
+                         ["Prior2YearDuration", "Prior1QuarterInstant"])
+
+    def test_filter(self):
+        table = ContextTable(CONTEXTS)
+        df = pd.DataFrame([ElementValue.context_fields(c) for c in CONTEXTS.values()])
+        self.assertEqual(list(table.filter(df, 'Duration', start=date(2018, 4, 1))['context']),
+                         ["CurrentYTDDuration", "Prior1YTDDuration", "Prior2YearDuration"])
+        self.assertEqual(list(table.filter(df, 'Duration', start=date(2018, 4, 1), excluded=['Prior2'])['context']),
+                         ["CurrentYTDDuration", "Prior1YTDDuration"])
+        self.assertEqual(list(table.filter(df, 'Duration', start=date(2018, 7, 1))['context']), [])
+        self.assertEqual(list(table.filter(df, 'Instant', excluded=['Prior1Quarter'])['context']),
+                         ["CurrentQuarterInstant", "FilingDateInstant"])
+
+    def test_filter_rows(self):
+        # each row is tested by its own context name and period_start, for duplicate and odd context ids
+        df = pd.DataFrame([
+            {"context": "CurrentYTDDuration", "period_start": "2021-04-01"},
+            {"context": "CurrentYTDDuration", "period_start": "2021-01-01"},
+            {"context": "CurrentYTDDuration", "period_start": "2021-04-01T00:00:00"},
+            {"context": "CurrentYTD", "period_start": "2021-04-01"},
+            {"context": "Prior1QuarterInstant", "period_start": None},
+            {"context": "CurrentQuarterInstant", "period_start": None},
+            {"context": "FilingDateInstant", "period_start": "unknown"},
+        ])
+        table = ContextTable({})
+        self.assertEqual(list(table.filter(df, 'Duration', start=date(2018, 4, 1)).index), [0, 2])
+        self.assertEqual(list(table.filter(df, 'Instant', excluded=['Prior1Quarter']).index), [5, 6])
+        self.assertTrue(table.filter(df.iloc[0:0], 'Instant').empty)
+        self.assertEqual(ContextTable.parse_date("2021-03-31T00:00:00"), date(2021, 3, 31))
+        self.assertIsNone(ContextTable.parse_date("unknown"))
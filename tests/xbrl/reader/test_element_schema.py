@@ -0,0 +1,63 @@
+import io
+import unittest
+
+from bs4 import BeautifulSoup
+
+from xbrr.xbrl.reader.element_schema import ElementSchema
+
+LABEL_LINKBASE = """<?xml version="1.0" encoding="UTF-8"?>
+<link:linkbase xmlns:link="http://www.xbrl.org/2003/linkbase" xmlns:xlink="http://www.w3.org/1999/xlink">
+  <link:labelLink xlink:type="extended" xlink:role="http://www.xbrl.org/2003/role/link">
+    <link:labelArc xlink:type="arc" xlink:from="Assets" xlink:to="label_Assets"/>
+    <link:loc xlink:type="locator" xlink:href="jppfs_cor.xsd#jppfs_cor_Assets" xlink:label="Assets"/>
+    <link:label xlink:type="resource" xlink:label="label_Assets" xlink:role="http://www.xbrl.org/2003/role/label" xml:lang="ja">資産</link:label>
+    <link:label xlink:type="resource" xlink:label="label_Assets" xlink:role="http://www.xbrl.org/2003/role/label" xml:lang="ja">資産（重複）</link:label>
+    <link:label xlink:type="resource" xlink:label="label_Assets_verbose" xlink:role="http://www.xbrl.org/2003/role/verboseLabel" xml:lang="en">Total assets</link:label>
+    <link:labelArc xlink:type="arc" xlink:from="Assets" xlink:to="label_Assets_verbose"/>
+    <link:loc xlink:type="locator" xlink:href="jppfs_cor.xsd#jppfs_cor_NetSales" xlink:label="NetSales"/>
+    <link:label xlink:type="resource" xlink:label="label_NetSales" xlink:role="http://www.xbrl.org/2003/role/label" xml:lang="ja"> 売上高 </link:label>
+    <link:label xlink:type="resource" xlink:label="label_NetSales_terse" xlink:role="http://www.xbrl.org/2003/role/terseLabel" xml:lang="ja">売上</link:label>
+    <link:labelArc xlink:type="arc" xlink:from="NetSales" xlink:to="label_NetSales"/>
+    <link:labelArc xlink:type="arc" xlink:from="NetSales" xlink:to="label_NetSales_terse"/>
+  </link:labelLink>
+</link:linkbase>
+"""
+
+
+class LabelReader():
+
+    def __init__(self, text:str, streaming:bool=True):
+        self.text = text
+        self.streaming = streaming
+
+    def read_uri(self, uri:str) -> BeautifulSoup:
+        return BeautifulSoup(self.text, "lxml-xml")
+
+    def open_uri(self, uri:str):
+        return io.BytesIO(self.text.encode()) if self.streaming else None
+
+
+def read_labels(reader, **kwargs) -> dict[str, tuple[str, str]]:
+    xsd_dic = {name: ElementSchema(name=name) for name in ["jppfs_cor_Assets", "jppfs_cor_NetSales", "jppfs_cor_Liabilities"]}
+    ElementSchema.read_label_taxonomy(reader, "jppfs_lab.xml", xsd_dic, **kwargs)  # type: ignore
+    return {name: (schema.label, schema.verbose_label) for name, schema in xsd_dic.items()}
+
+
+class TestElementSchema(unittest.TestCase):
+
+    def test_read_label_taxonomy(self):
+        labels = read_labels(LabelReader(LABEL_LINKBASE))
+        self.assertEqual(labels, {"jppfs_cor_Assets": ("資産", "Total assets"),
+                                  "jppfs_cor_NetSales": ("売上高", ""),
+                                  "jppfs_cor_Liabilities": ("", "")})
+        self.assertEqual(read_labels(LabelReader(LABEL_LINKBASE, streaming=False)), labels)
+        # malformed linkbase is read by BeautifulSoup
+        self.assertEqual(read_labels(LabelReader(LABEL_LINKBASE.replace("</link:linkbase>", ""))), labels)
+
+    def test_filters(self):
+        for streaming in [True, False]:
+            reader = LabelReader(LABEL_LINKBASE, streaming)
+            self.assertEqual(read_labels(reader, lang="ja")["jppfs_cor_Assets"], ("資産", ""))
+            self.assertEqual(read_labels(reader, roles=["http://www.xbrl.org/2003/role/verboseLabel"])["jppfs_cor_NetSales"], ("", ""))
+            labels = read_labels(reader, ids=["jppfs_cor_NetSales"])
+            self.assertEqual((labels["jppfs_cor_Assets"], labels["jppfs_cor_NetSales"]), (("", ""), ("売上高", "")))
@@ -0,0 +1,41 @@
+import unittest
+
+from xbrr.xbrl.reader.element_schema import ElementSchema
+from xbrr.xbrl.reader.element_value import ElementValue
+
+
+class SchemaDoc():
+    has_schema = True
+
+
+class BatchReader():
+
+    def __init__(self):
+        self.xbrl_doc = SchemaDoc()
+        self.requests:list[list[str]] = []
+
+    def get_schemas_by_links(self, links):
+        links = list(links)
+        self.requests.append(links)
+        return {link: ElementSchema(name=link.split('#')[-1], label=link.split('_')[-1], data_type="xbrli:monetaryItemType")
+                for link in links}
+
+
+class TestElementValue(unittest.TestCase):
+
+    def test_resolve_schemas(self):
+        reader = BatchReader()
+        lazy_calls = []
+        values = [ElementValue(name, reference=f"http://example.com/ns#jppfs_cor_{name}",
+                               lazy_schema=lambda: lazy_calls.append(1) or ElementSchema())
+                  for name in ["NetSales", "NetSales", "OperatingIncome"]]
+        ElementValue.resolve_schemas(reader, values)  # type: ignore
+
+        self.assertEqual(len(reader.requests), 1)
+        self.assertEqual(len(reader.requests[0]), 2)
+        self.assertEqual([v.label for v in values], ["NetSales", "NetSales", "OperatingIncome"])
+        self.assertEqual(values[0].data_type, "monetary")
+        self.assertEqual(lazy_calls, [])
+
+        ElementValue.resolve_schemas(reader, values)  # type: ignore
+        self.assertEqual(len(reader.requests), 1)
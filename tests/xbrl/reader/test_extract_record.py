@@ -0,0 +1,72 @@
+import unittest
+from datetime import date
+
+from xbrr.base.reader.base_parser import BaseParser, memoized_property
+from xbrr.base.reader.base_reader import BaseReader
+from xbrr.xbrl.reader.element_value import ElementValue
+
+OFFICERS = "<p><span>男性 13名 女性 1名 (役員のうち女性の比率 7.1%)</span></p>"
+
+
+class ValueReader(BaseReader):
+
+    def __init__(self, values:dict[str, str]):
+        super().__init__("edinet", None)  # type: ignore
+        self.values = {name: ElementValue(name, value=value) for name, value in values.items()}
+        self.finds:list[str] = []
+
+    def findv(self, name:str):
+        self.finds.append(name)
+        return self.values.get(name)
+
+
+class Periods(BaseParser):
+
+    def __init__(self, reader):
+        super().__init__(reader, ElementValue, {"fiscal_date_end": "jpdei_cor:CurrentFiscalYearEndDateDEI"})
+        self.reads = 0
+
+    @memoized_property
+    def fiscal_year_end_date(self) -> date:
+        self.reads += 1
+        return date.fromisoformat(self.fiscal_date_end.value)  # type: ignore
+
+
+class TestExtractRecord(unittest.TestCase):
+
+    def setUp(self):
+        self.reader = ValueReader({
+            "jpdei_cor:FilerNameInJapaneseDEI": "TIS株式会社",
+            "jpdei_cor:CurrentFiscalYearEndDateDEI": "2018-03-31",
+            "jpcrp_cor:InformationAboutOfficersTextBlock": OFFICERS,
+        })
+
+    def test_extract_record(self):
+        record = self.reader.extract_record([
+            "metadata.company_name", "metadata.fiscal_year_end_date",
+            "information.number_of_directors", "information.number_of_female_executives",
+        ])
+        self.assertEqual(record, {
+            "metadata.company_name": "TIS株式会社",
+            "metadata.fiscal_year_end_date": date(2018, 3, 31),
+            "information.number_of_directors": 14,
+            "information.number_of_female_executives": 1,
+        })
+        # tags of each aspect are resolved once by prefetch
+        self.assertEqual(self.reader.finds.count("jpcrp_cor:InformationAboutOfficersTextBlock"), 1)
+        self.assertEqual(self.reader.finds.count("jpdei_cor:CurrentFiscalYearEndDateDEI"), 1)
+
+    def test_columns_and_errors(self):
+        features = {"name": "metadata.company_name", "phone": "metadata.phone_number",
+                    "unknown": "metadata.unknown_property", "missing": "no_aspect.value"}
+        record = self.reader.extract_record(features, errors='ignore')
+        self.assertEqual(record, {"name": "TIS株式会社", "phone": None, "unknown": None, "missing": None})
+        with self.assertRaises(NameError):
+            self.reader.extract_record(["metadata.unknown_property"])
+
+    def test_memoized_property(self):
+        aspect = Periods(self.reader)
+        self.assertEqual(aspect.fiscal_year_end_date, date(2018, 3, 31))
+        self.assertEqual(aspect.fiscal_year_end_date, date(2018, 3, 31))
+        self.assertEqual(aspect.reads, 1)
+        self.assertEqual(Periods(self.reader).fiscal_year_end_date, date(2018, 3, 31))
@@ -0,0 +1,56 @@
+import pickle
+import unittest
+
+from bs4 import BeautifulSoup
+
+from xbrr.xbrl.reader.element_value import ElementValue
+from xbrr.xbrl.reader.html_cache import HtmlCache, html_to_text
+
+
+class CachingReader():
+
+    def __init__(self):
+        self.html_cache = HtmlCache(maxsize=2)
+
+
+class TestHtmlCache(unittest.TestCase):
+
+    def test_html_to_text(self):
+        texts = [
+            "plain text",
+            "<p>当期純利益 &amp; 配当</p>\n\n<p> 1,234 </p>",
+            "<div><!-- note --><span>a &lt; b</span>\n <br/>c < d</div>",
+            "&lt;p&gt;escaped&lt;/p&gt;",
+        ]
+        for text in texts:
+            value = ElementValue("jpcrp_cor:TextBlock", value=text)
+            self.assertEqual(value.text, BeautifulSoup(value.html_text, "html.parser").text)
+        self.assertEqual(html_to_text("<p>配当&nbsp;30円</p>"), "配当\xa030円")
+
+    def test_html_cached_per_reader(self):
+        reader = CachingReader()
+        values = [ElementValue.create_element_value(reader, BeautifulSoup(f"<v>&lt;p&gt;{i}&lt;/p&gt;</v>", "lxml-xml").v, {})  # type: ignore
+                  for i in range(3)]
+        html = values[0].html
+        self.assertIs(values[0].html, html)
+        self.assertEqual(html.p.text, "0")
+        self.assertEqual(values[1].normalized_text, "1")
+
+        values[1].html
+        values[2].html
+        self.assertEqual(len(reader.html_cache), 2)
+        self.assertIsNot(values[0].html, html)  # the least recently used one is dropped
+
+    def test_html_not_cached_without_reader(self):
+        value = ElementValue("jpcrp_cor:TextBlock", value="<p>text</p>")
+        self.assertIsNot(value.html, value.html)
+
+    def test_pickle(self):
+        reader = CachingReader()
+        value = ElementValue("jpcrp_cor:TextBlock", value="<p>text</p>", html_cache=reader.html_cache)
+        value.html
+        restored = pickle.loads(pickle.dumps(value))
+        self.assertIsNone(restored.html_cache)
+        restored.bind(reader)  # type: ignore
+        self.assertIs(restored.html_cache, reader.html_cache)
+        self.assertEqual(restored.html.text, "text")
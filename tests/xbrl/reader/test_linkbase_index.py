@@ -0,0 +1,68 @@
+import os
+import tempfile
+import unittest
+
+from bs4 import BeautifulSoup
+
+from xbrr.xbrl.reader.linkbase_index import LinkbaseIndex
+from xbrr.xbrl.reader.role_arcs import read_role_arcs
+
+LINKBASE = """<?xml version="1.0" encoding="UTF-8"?>
+<link:linkbase xmlns:link="http://www.xbrl.org/2003/linkbase" xmlns:xlink="http://www.w3.org/1999/xlink">
+  <link:roleRef roleURI="http://example.com/role/BS" xlink:type="simple" xlink:href="jppfs_rt.xsd#rol_BS"/>
+  <link:presentationLink xlink:type="extended" xlink:role="http://example.com/role/BS">
+    <link:loc xlink:type="locator" xlink:href="jppfs_cor.xsd#jppfs_cor_BalanceSheetAbstract" xlink:label="BalanceSheetAbstract"/>
+    <link:loc xlink:type="locator" xlink:href="jppfs_cor.xsd#jppfs_cor_Assets" xlink:label="Assets"/>
+    <link:loc xlink:type="locator" xlink:href="jppfs_cor.xsd#jppfs_cor_Liabilities" xlink:label="Liabilities"/>
+    <link:presentationArc xlink:type="arc" xlink:arcrole="http://www.xbrl.org/2003/arcrole/parent-child"
+                          xlink:from="BalanceSheetAbstract" xlink:to="Assets" order="1"/>
+    <link:presentationArc xlink:type="arc" xlink:arcrole="http://www.xbrl.org/2003/arcrole/parent-child"
+                          xlink:from="BalanceSheetAbstract" xlink:to="Liabilities" order="2" use="optional" priority="1"/>
+  </link:presentationLink>
+  <link:presentationLink xlink:type="extended" xlink:role="http://example.com/role/PL">
+    <link:loc xlink:type="locator" xlink:href="jppfs_cor.xsd#jppfs_cor_NetSales" xlink:label="NetSales"/>
+    <link:loc xlink:type="locator" xlink:href="jppfs_cor.xsd#jppfs_cor_IncomeStatementAbstract" xlink:label="IncomeStatementAbstract"/>
+    <link:presentationArc xlink:type="arc" xlink:arcrole="http://www.xbrl.org/2003/arcrole/parent-child"
+                          xlink:from="IncomeStatementAbstract" xlink:to="NetSales" order="1"/>
+  </link:presentationLink>
+</link:linkbase>
+"""
+DOCURI = "http://example.com/taxonomy/jppfs/jppfs_pre.xml"
+
+
+class TestLinkbaseIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "jppfs_pre.xml")
+        with open(self.path, "w") as f:
+            f.write(LINKBASE)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_parse(self):
+        index = LinkbaseIndex.parse(self.path, DOCURI)
+        self.assertEqual(len(index), 2)
+        doc = BeautifulSoup(LINKBASE, "lxml-xml")
+        for role in ["http://example.com/role/BS", "http://example.com/role/PL"]:
+            self.assertEqual(list(index.arcs(role, "link:presentationLink", "link:presentationArc")),
+                             read_role_arcs(doc, DOCURI, role, "presentationLink", "presentationArc"))
+        arc = index.arcs("http://example.com/role/BS", "presentationLink", "presentationArc")[1]
+        self.assertEqual(arc.child_href, "http://example.com/taxonomy/jppfs/jppfs_cor.xsd#jppfs_cor_Liabilities")
+        self.assertEqual((arc.use, arc.priority, arc.order), ("optional", "1", "2"))
+        self.assertEqual(index.arcs("http://example.com/role/CF", "presentationLink", "presentationArc"), ())
+
+    def test_stored_index(self):
+        index = LinkbaseIndex.of(self.path, DOCURI)
+        index_path = LinkbaseIndex.index_path(self.path)
+        self.assertTrue(os.path.isfile(index_path))
+        self.assertIs(LinkbaseIndex.of(self.path, DOCURI), index)
+        loaded = LinkbaseIndex.load(index_path)
+        assert loaded is not None
+        self.assertEqual(loaded.roles, index.roles)
+
+        with open(index_path, "wb") as f:
+            f.write(b"broken")
+        self.assertIsNone(LinkbaseIndex.load(index_path))
+        self.assertEqual(len(LinkbaseIndex.of(os.path.join(self.tmpdir.name, "missing.xml"), DOCURI)), 0)
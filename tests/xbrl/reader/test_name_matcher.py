@@ -0,0 +1,36 @@
+import unittest
+
+from xbrr.xbrl.reader.reader import NameMatcher, nmmatch, nmshortest_match
+
+
+class TestNameMatcher(unittest.TestCase):
+
+    fix_cal = ['<GrossProfit', 'OperatingGrossProfit', '~(?<!Non)(?<!Other)OperatingIncome',
+               '>OrdinaryProfitLoss', '~(Operating|Ordinary)[Ll]oss$', 'ProfitLoss']
+
+    def test_match(self):
+        matcher = NameMatcher(self.fix_cal)
+        self.assertEqual(len(matcher.regexes), 1)
+        for name, expected in [('jppfs_cor_GrossProfit', True), ('tse-ed-t_GrossProfitOnSales', True),
+                               ('jppfs_cor_OperatingGrossProfit', True), ('jppfs_cor_OperatingIncome', True),
+                               ('jppfs_cor_NonOperatingIncome', False), ('jppfs_cor_OtherOperatingIncome', False),
+                               ('jpigp_cor_OrdinaryProfitLoss', True), ('jppfs_cor_OrdinaryLoss', True),
+                               ('jppfs_cor_ProfitLoss', True), ('jppfs_cor_NetSales', False)]:
+            self.assertEqual(matcher.match(name), expected, name)
+            self.assertEqual(nmmatch(name, self.fix_cal), expected, name)
+        self.assertEqual(len(matcher._results), 10)
+
+    def test_backreference(self):
+        matcher = NameMatcher(['~(Net)\\1', '~Loss$'])
+        self.assertEqual(len(matcher.regexes), 2)
+        self.assertTrue(matcher.match('x_NetNetSales'))
+        self.assertTrue(matcher.match('x_OrdinaryLoss'))
+        self.assertFalse(matcher.match('x_NetSales'))
+
+    def test_shortest_match(self):
+        names = ['jppfs_cor_GrossProfit', 'jppfs_cor_GrossProfitOnSales', 'jppfs_cor_OrdinaryLoss',
+                 'jppfs_cor_OperatingLoss', 'jppfs_cor_NetSales']
+        matcher = NameMatcher(self.fix_cal)
+        self.assertEqual(sorted(nmshortest_match(names, matcher)), ['jppfs_cor_GrossProfit', 'jppfs_cor_OrdinaryLoss'])
+        self.assertEqual(sorted(nmshortest_match(names, self.fix_cal)), ['jppfs_cor_GrossProfit', 'jppfs_cor_OrdinaryLoss'])
+        self.assertFalse(NameMatcher([]))
@@ -0,0 +1,65 @@
+import unittest
+from datetime import date, datetime
+from typing import Optional
+
+from xbrr.xbrl.reader.context_table import ContextTable
+from xbrr.xbrl.reader.element_value import ElementValue
+from xbrr.xbrl.reader.period_model import PeriodModel
+
+
+class ContextReader():
+
+    def __init__(self, context_dic:dict[str,dict[str,str]], values:Optional[dict[str,str]]=None):
+        self.context_dic = context_dic
+        self.values = {name: ElementValue(name, value=value) for name, value in (values or {}).items()}
+
+    def findv(self, name:str):
+        return self.values.get(name)
+
+    def findvs(self, names):
+        return {name: self.findv(name) for name in names}
+
+
+CONTEXTS = {
+    "CurrentYTDDuration": {"id": "CurrentYTDDuration", "period": "2021-06-30", "period_start": "2021-04-01"},
+    "CurrentQuarterDuration": {"id": "CurrentQuarterDuration", "period": "2021-06-30", "period_start": "2021-04-01"},
+    "Prior1YearDuration": {"id": "Prior1YearDuration", "period": "2021-03-31", "period_start": "2020-04-01"},
+    "Prior1YTDDuration": {"id": "Prior1YTDDuration", "period": "2020-06-30", "period_start": "2020-04-01"},
+    "CurrentQuarterInstant": {"id": "CurrentQuarterInstant", "period": "2021-06-30"},
+    "NextYearDuration_ForecastMember": {"id": "NextYearDuration_ForecastMember", "period": "2022-03-31", "period_start": "2021-04-01"},
+    "Axis": {"ConsolidatedOrNonConsolidatedAxis": "NonConsolidatedMember"},
+}
+
+
+def period_model(context_dic:dict[str,dict[str,str]], values:Optional[dict[str,str]]=None) -> PeriodModel:
+    return PeriodModel(ContextReader(context_dic, values), ContextTable(context_dic))  # type: ignore
+
+
+class TestPeriodModel(unittest.TestCase):
+
+    def test_contexts(self):
+        model = period_model(CONTEXTS)
+        self.assertEqual(len(model.contexts), 6)
+        self.assertEqual(model.contexts["CurrentYTDDuration"].start, date(2021, 4, 1))
+        self.assertEqual(model.contexts["Prior1YearDuration"].months, 12)
+        self.assertIsNone(model.contexts["CurrentQuarterInstant"].start)
+        self.assertEqual(model.durations[0].id, "NextYearDuration_ForecastMember")
+
+    def test_fiscal_year_start_date(self):
+        model = period_model(CONTEXTS)
+        self.assertEqual(model.fiscal_year_start_date(date(2022, 3, 31)), date(2021, 4, 1))
+        self.assertEqual(model.fiscal_year_start_date(date(2021, 3, 31)), date(2020, 4, 1))
+        self.assertEqual(model.fiscal_year_start_date(datetime(2021, 3, 31)), date(2020, 4, 1))
+        self.assertIsNone(model.fiscal_year_start_date(date(2019, 3, 31)))
+
+    def test_quarter_kind(self):
+        self.assertEqual(period_model({}, {"jpdei_cor:TypeOfCurrentPeriodDEI": "Q1"}).quarter_kind, "Q1")
+        flags = {"tse-o-di:TypeOfReports-Annual": "false", "tse-o-di:TypeOfReports-SecondQuarter": "true"}
+        self.assertEqual(period_model({}, flags).quarter_kind, "Q2")
+        self.assertIsNone(period_model({}).quarter_kind)
+
+    def test_quarter_kind_precedence(self):
+        flags = {"tse-o-di:TypeOfReports-Annual": "true", "tse-o-di:TypeOfReports-SecondQuarter": "true"}
+        self.assertEqual(period_model({}, flags).quarter_kind, "Q2")
+        flags = {"tse-o-di:TypeOfReports-Annual": "true", "tse-o-di:TypeOfReports-ThirdQuarter": "false"}
+        self.assertEqual(period_model({}, flags).quarter_kind, "FY")
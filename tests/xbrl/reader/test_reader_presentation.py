@@ -0,0 +1,29 @@
+import unittest
+
+from bs4 import BeautifulSoup
+
+from xbrr.xbrl.reader.reader import Reader
+
+
+PRESENTATION = """<?xml version="1.0" encoding="UTF-8"?>
+<link:linkbase xmlns:link="http://www.xbrl.org/2003/linkbase" xmlns:xlink="http://www.w3.org/1999/xlink">
+<link:presentationLink xlink:type="extended" xlink:role="http://disclosure.edinet-fsa.go.jp/role/jpcrp/rol_CabinetOfficeOrdinance">
+<link:loc xlink:type="locator" xlink:href="jpcrp_cor.xsd#jpcrp_cor_BusinessResultsOfGroupHeading" xlink:label="Heading"/>
+<link:loc xlink:type="locator" xlink:href="jpcrp_cor.xsd#jpcrp_cor_BusinessResultsOfGroupTextBlock" xlink:label="TextBlock"/>
+<link:loc xlink:type="locator" xlink:href="jpcrp_cor.xsd#jpcrp_cor_Other" xlink:label="TextBlock"/>
+<link:presentationArc xlink:type="arc" xlink:arcrole="http://www.xbrl.org/2003/arcrole/parent-child" xlink:from="Heading" xlink:to="TextBlock"/>
+<link:presentationArc xlink:type="arc" xlink:arcrole="http://www.xbrl.org/2003/arcrole/parent-child" xlink:from="Other" xlink:to="TextBlock"/>
+</link:presentationLink>
+</link:linkbase>"""
+
+
+class TestReaderPresentation(unittest.TestCase):
+
+    def test_index_presentation_link(self):
+        xml = BeautifulSoup(PRESENTATION, "lxml-xml")
+        link = xml.find("link:presentationLink")
+        label_locs, to_arcs = Reader.index_presentation_link(link, "link:presentationArc")  # type: ignore
+        self.assertEqual(list(label_locs.keys()), ["Heading", "TextBlock"])
+        self.assertTrue(label_locs["TextBlock"]["xlink:href"].endswith("TextBlock"))
+        self.assertEqual(list(to_arcs.keys()), ["TextBlock"])
+        self.assertEqual(to_arcs["TextBlock"]["xlink:from"], "Heading")
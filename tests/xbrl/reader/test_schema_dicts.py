@@ -0,0 +1,33 @@
+import unittest
+
+from xbrr.xbrl.reader.element_schema import ElementSchema
+from xbrr.xbrl.reader.schema_dicts import SchemaDicts
+
+
+class TestSchemaDicts(unittest.TestCase):
+
+    def test_get_dict(self):
+        dicts = SchemaDicts()
+        jppfs:dict[str, ElementSchema] = {}
+        dicts.add("jppfs/2020-11-01", jppfs)
+        xsduri = "http://disclosure.edinet-fsa.go.jp/taxonomy/jppfs/2020-11-01/jppfs_cor_2020-11-01.xsd"
+
+        self.assertIs(dicts.get_dict(xsduri, "jppfs_cor_NetSales"), jppfs)
+        self.assertIs(dicts.get_dict(xsduri, "jppfs_cor_OperatingIncome"), jppfs)
+        self.assertIs(dicts.get_dict("jpcrp030000-asr-001_E05739-000.xsd", "jpcrp030000-asr_E05739-000_Custom"), dicts.custom_dict)
+        self.assertIs(dicts.get_dict("tse-acedjpfr-36450.xsd", "tse-acedjpfr-36450_Custom"), dicts.custom_dict)
+        with self.assertRaises(Exception):
+            dicts.get_dict("http://example.com/unknown.xsd", "unknown_Element")
+
+        stats = dicts.statistics
+        self.assertEqual(stats['route_hit'], 1)
+        self.assertEqual(stats['route_miss'], 4)
+
+    def test_lookup(self):
+        dicts = SchemaDicts()
+        link = "http://disclosure.edinet-fsa.go.jp/taxonomy/jppfs/2020-11-01/jppfs_cor_2020-11-01.xsd#jppfs_cor_NetSales"
+        self.assertIsNone(dicts.lookup(link))
+        schema = ElementSchema(name="jppfs_cor_NetSales", reference=link)
+        dicts.register(link, schema)
+        self.assertIs(dicts.lookup(link), schema)
+        self.assertEqual(dicts.statistics['link_hit_ratio'], 0.5)
@@ -0,0 +1,83 @@
+import os
+import pickle
+import tempfile
+import unittest
+
+from xbrr.xbrl.reader.element_schema import ElementSchema
+from xbrr.xbrl.reader.schema_dicts import SchemaDicts
+from xbrr.xbrl.reader.schema_store import SchemaStore
+from xbrr.xbrl.reader.taxonomy_repository import TaxonomyRepository
+
+
+def schemas() -> dict[str, ElementSchema]:
+    assets = ElementSchema(name="jppfs_cor_Assets", label="資産", alias="Assets", abstract="false",
+                           data_type="xbrli:monetaryItemType", period_type="instant", balance="debit")
+    assets.verbose_label = "資産合計"
+    sales = ElementSchema(name="jppfs_cor_NetSales", label="売上高", alias="NetSales", abstract="false",
+                          data_type="xbrli:monetaryItemType", period_type="duration", balance="credit")
+    return {"jppfs_cor_NetSales": sales, "jppfs_cor_Assets": assets}
+
+
+class TestSchemaStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "2020-11-01.schemas")
+        SchemaStore.write(self.path, schemas())
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_lookup(self):
+        store = SchemaStore(self.path)
+        self.assertEqual(len(store), 2)
+        self.assertEqual(list(store), ["jppfs_cor_Assets", "jppfs_cor_NetSales"])
+        self.assertIn("jppfs_cor_Assets", store)
+        self.assertNotIn("jppfs_cor_Liabilities", store)
+        self.assertIsNone(store.get("jppfs_cor_Liabilities"))
+
+        assets = store["jppfs_cor_Assets"]
+        self.assertEqual(assets.to_dict(), schemas()["jppfs_cor_Assets"].to_dict())
+        self.assertEqual((assets.alias, assets.verbose_label), ("Assets", "資産合計"))
+        self.assertIs(store["jppfs_cor_Assets"], assets)
+
+        routes = SchemaDicts()
+        routes.add("2020-11-01", store)
+        self.assertIs(routes.get_dict("http://disclosure.edinet-fsa.go.jp/taxonomy/jppfs/2020-11-01/jppfs_cor_2020-11-01.xsd",
+                                      "jppfs_cor_Assets"), store)
+        store.close()
+
+    def test_none(self):
+        schema = ElementSchema(name="jppfs_cor_Assets", balance=None)  # type: ignore
+        SchemaStore.write(self.path, {"jppfs_cor_Assets": schema})
+        store = SchemaStore(self.path)
+        self.assertIsNone(store["jppfs_cor_Assets"].balance)
+        self.assertEqual(store["jppfs_cor_Assets"].label, "")
+        store.close()
+
+    def test_overlay(self):
+        store = SchemaStore(self.path)
+        store.update({"jppfs_cor_Liabilities": ElementSchema(name="jppfs_cor_Liabilities", label="負債")})
+        self.assertEqual(len(store), 3)
+        self.assertEqual(store["jppfs_cor_Liabilities"].label, "負債")
+        del store["jppfs_cor_NetSales"]
+        self.assertNotIn("jppfs_cor_NetSales", store)
+        self.assertEqual(list(store), ["jppfs_cor_Assets", "jppfs_cor_Liabilities"])
+
+        attached = pickle.loads(pickle.dumps(store))
+        self.assertEqual(len(attached), 2)
+        self.assertIn("jppfs_cor_NetSales", attached)
+
+    def test_repository(self):
+        repo = TaxonomyRepository(self.tmpdir.name)
+        repo.taxonomy_repo["2020-11-01"] = schemas()
+        paths = repo.export_schemas()
+        self.assertEqual(paths, [repo.schema_store_path("2020-11-01")])
+
+        worker = TaxonomyRepository(self.tmpdir.name)
+        worker.taxonomy_repo["2020-11-01"] = {"jppfs_cor_Liabilities": ElementSchema(name="jppfs_cor_Liabilities")}
+        self.assertEqual(worker.attach_schemas(), ["2020-11-01"])
+        store = worker.taxonomy_repo["2020-11-01"]
+        self.assertIsInstance(store, SchemaStore)
+        self.assertEqual(len(store), 3)
+        self.assertEqual(worker.attach_schemas(["2019-11-01"]), [])
@@ -0,0 +1,103 @@
+import os
+import pickle
+import shutil
+import tempfile
+import time
+import unittest
+
+from bs4 import BeautifulSoup
+
+from xbrr.xbrl.reader.schema_tree import SchemaTree
+
+
+def xsd(namespace:str, imports:list[tuple[str,str]], linkbases:list[str]=[]) -> str:
+    refs = ''.join([f'<xsd:import namespace="{ns}" schemaLocation="{loc}"/>' for ns, loc in imports])
+    links = ''.join([f'<link:linkbaseRef xlink:type="simple" xlink:href="{href}" xlink:role="http://www.xbrl.org/2003/role/presentationLinkbaseRef"/>' for href in linkbases])
+    return ('<?xml version="1.0" encoding="UTF-8"?>'
+            '<xsd:schema xmlns:xsd="http://www.w3.org/2001/XMLSchema" xmlns:link="http://www.xbrl.org/2003/linkbase" '
+            f'xmlns:xlink="http://www.w3.org/1999/xlink" targetNamespace="{namespace}">'
+            f'<xsd:annotation><xsd:appinfo>{links}</xsd:appinfo></xsd:annotation>{refs}</xsd:schema>')
+
+
+class FileReader():
+
+    def __init__(self, root:str):
+        self.root = root
+        self.reads:list[str] = []
+
+    def read_uri(self, uri:str) -> BeautifulSoup:
+        self.reads.append(uri)
+        with open(os.path.join(self.root, uri), encoding="utf-8") as f:
+            return BeautifulSoup(f, "lxml-xml")
+
+
+class ConcurrencyReader(FileReader):
+
+    def __init__(self, root:str):
+        super().__init__(root)
+        self.active = 0
+        self.max_active = 0
+
+    def read_uri(self, uri:str) -> BeautifulSoup:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        time.sleep(0.01)
+        try:
+            return super().read_uri(uri)
+        finally:
+            self.active -= 1
+
+
+class TestSchemaTree(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # base imports a and b, both of them import common, common imports a (cycle)
+        cls._dir = tempfile.mkdtemp()
+        files = {
+            "base.xsd": xsd("ns:base", [("ns:a", "a.xsd"), ("ns:b", "b.xsd")], ["base_pre.xml"]),
+            "a.xsd": xsd("ns:a", [("ns:common", "common.xsd")], ["a_pre.xml"]),
+            "b.xsd": xsd("ns:b", [("ns:common", "common.xsd")], ["b_pre.xml"]),
+            "common.xsd": xsd("ns:common", [("ns:a", "a.xsd")], ["common_pre.xml"]),
+        }
+        for name, content in files.items():
+            with open(os.path.join(cls._dir, name), "w", encoding="utf-8") as f:
+                f.write(content)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._dir)
+
+    def test_read_import_tree(self):
+        reader = FileReader(self._dir)
+        tree = SchemaTree(reader, "base.xsd")  # type: ignore
+        self.assertEqual(list(tree.linkbaseRef_iterator('pre')), ["base_pre.xml", "a_pre.xml", "common_pre.xml", "b_pre.xml"])
+        self.assertDictEqual(tree.import_graph, {
+            "base.xsd": ["a.xsd", "b.xsd"], "a.xsd": ["common.xsd"],
+            "common.xsd": ["a.xsd"], "b.xsd": ["common.xsd"]})
+        self.assertEqual(tree.find_xsduri("ns:common"), "common.xsd")
+        self.assertEqual(sorted(tree.import_timings.keys()), ["a.xsd", "b.xsd", "base.xsd", "common.xsd"])
+        self.assertEqual(reader.reads.count("common.xsd"), 1)
+
+    def test_read_import_tree_bfs(self):
+        reader = FileReader(self._dir)
+        tree = SchemaTree(reader, "base.xsd", breadth_first=True, max_workers=2)  # type: ignore
+        dfs = SchemaTree(FileReader(self._dir), "base.xsd")  # type: ignore
+        self.assertEqual(tree.linkbaseRefs, dfs.linkbaseRefs)
+        self.assertEqual(list(tree.import_graph.items()), list(dfs.import_graph.items()))
+        self.assertDictEqual(tree.namespace_uri, dfs.namespace_uri)
+        self.assertEqual(reader.reads.count("common.xsd"), 1)
+
+    def test_read_import_tree_bfs_serialized(self):
+        reader = ConcurrencyReader(self._dir)
+        SchemaTree(reader, "base.xsd", breadth_first=True, max_workers=4)  # type: ignore
+        self.assertEqual(reader.max_active, 1)
+
+    def test_pickle(self):
+        reader = FileReader(self._dir)
+        tree = SchemaTree(reader, "base.xsd")  # type: ignore
+        restored = pickle.loads(pickle.dumps(tree))
+        self.assertFalse(hasattr(restored, 'reader'))
+        restored.bind(reader)  # type: ignore
+        self.assertEqual(restored.linkbaseRefs, tree.linkbaseRefs)
+        self.assertEqual(restored.get_targetNamespace("a.xsd"), "ns:a")
@@ -0,0 +1,66 @@
+import threading
+import unittest
+
+from xbrr.base.reader.base_parser import BaseParser
+from xbrr.xbrl.reader.element_value import ElementValue
+from xbrr.xbrl.reader.reader import Reader
+
+
+class RoleReader(Reader):
+
+    def __init__(self):
+        # only the per role state, without reading any document
+        self._role_state = threading.local()
+        self._lock = threading.RLock()
+        self._context_dic = {"CurrentYearInstant": {"id": "CurrentYearInstant", "period": "2021-03-31"}}
+        self._context_table = self._context_index = self._period_model = None
+        self.scans = 0
+
+    @property
+    def role_decision_info(self):
+        self.scans += 1
+        return []
+
+
+class Statements(BaseParser):
+
+    def __init__(self, reader:RoleReader):
+        super().__init__(reader, ElementValue)
+        self.barrier = threading.Barrier(3, timeout=5)
+        self.context_indexes = []
+
+    def read(self, kind:str, latest2year:bool):
+        reader:RoleReader = self.reader  # type: ignore
+        reader.context_value_dic = {kind: []}
+        reader.epsilon_value = len(kind)
+        self.barrier.wait()  # every role is being read at the same time
+        self.context_indexes.append(reader.context_index)
+        return (list(reader.context_value_dic.keys())[0], reader.epsilon_value, latest2year)
+
+    def bs(self, latest2year=False):
+        return self.read('bs', latest2year)
+
+    def pl(self, latest2year=False):
+        return self.read('pl', latest2year)
+
+    def fc_dividends(self, latest2year=False):
+        return self.read('fc_dividends', latest2year)
+
+
+class TestStatements(unittest.TestCase):
+
+    def test_statements(self):
+        reader = RoleReader()
+        parser = Statements(reader)
+        statements = parser.statements(['bs', 'pl', 'fc_dividends'], latest2year=True)
+        self.assertDictEqual(statements, {
+            'bs': ('bs', 2, True), 'pl': ('pl', 2, True),
+            'fc_dividends': ('fc_dividends', 12, True)})
+        self.assertEqual(reader.scans, 1)
+        # the context index shared by the threads is built once
+        self.assertEqual(len(set(map(id, parser.context_indexes))), 1)
+        self.assertEqual(reader.epsilon_value, 0)  # nothing is read on this thread
+
+    def test_unknown_statement(self):
+        with self.assertRaises(NameError):
+            Statements(RoleReader()).statements(['bs', 'unknown'])
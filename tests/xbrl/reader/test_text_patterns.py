@@ -0,0 +1,61 @@
+import re
+import unittest
+
+from xbrr.base.reader.base_parser import BaseParser
+from xbrr.base.reader.text_patterns import TextPatterns
+from xbrr.xbrl.reader.element_value import ElementValue
+
+OFFICERS = ("<p>役員一覧</p>"
+            "<p><span>男性 13名 女性 1名 (役員のうち女性の比率 7.1%)</span></p>"
+            "<p>取締役 13名</p>")
+
+
+class ValueReader():
+
+    def __init__(self, values:dict[str, ElementValue]):
+        self.values = values
+
+    def findv(self, tag:str):
+        return self.values.get(tag)
+
+
+class TestTextPatterns(unittest.TestCase):
+
+    def test_search_same_as_re(self):
+        patterns = {
+            "overlapped": r"ab+", "inner": r"b+c", "head": r"^x", "behind": r"(?<=c)d",
+            "backref": r"(\w)\1", "tail": r"c$", "groups": r"(b|c)(d)?",
+        }
+        text_patterns = TextPatterns(patterns)
+        for text in ["", "xabbcd", "abcbcc", "bbd", "xxaab", "dcdc"]:
+            found = text_patterns.search(text)
+            for name, pattern in patterns.items():
+                expected, m = re.search(pattern, text), found[name]
+                self.assertEqual(expected and (expected.span(), expected.groups()),
+                                 m and (m.span(), m.groups()), (text, name))
+
+    def test_search_texts(self):
+        patterns = TextPatterns({"officers": "^(男性).+(名).+(女性).+(名)", "directors": "取締役", "none": "監査役"})
+        texts = ["役員一覧", "男性 13名 女性 1名", "取締役 13名"]
+        self.assertEqual(patterns.search_texts(texts),
+                         {"officers": texts[1], "directors": texts[2], "none": ""})
+        self.assertEqual(patterns.search_texts(texts, ["directors"]), {"directors": texts[2]})
+
+    def test_extract(self):
+        patterns = TextPatterns.value_patterns(male=("男性", "名"), female=("女性", "名"), ratio=("女性の比率", "%"), none=("監査役", "名"))
+        self.assertIs(patterns, TextPatterns.value_patterns(male=("男性", "名"), female=("女性", "名"), ratio=("女性の比率", "%"), none=("監査役", "名")))
+        self.assertEqual(patterns.extract("男性 13名 女性 1名 (役員のうち女性の比率 7.1%)"),
+                         {"male": 13, "female": 1, "ratio": 7.1, "none": ""})
+
+    def test_parser(self):
+        reader = ValueReader({"jpcrp_cor:InformationAboutOfficersTextBlock":
+                              ElementValue("jpcrp_cor:InformationAboutOfficersTextBlock", value=OFFICERS)})
+        parser = BaseParser(reader, ElementValue, {"directors": "jpcrp_cor:InformationAboutOfficersTextBlock", "none": "jpcrp_cor:None"})  # type: ignore
+        pattern = "^(男性).+(名).+(女性).+(名)"
+        self.assertEqual(parser.search("directors", pattern), "男性 13名 女性 1名 (役員のうち女性の比率 7.1%)")
+        self.assertEqual(parser.extract_value("directors", "女性", "名", filter_pattern=pattern), 1)
+        self.assertEqual(parser.extract_value("directors", "取締役", "名"), 13)
+        self.assertEqual(parser.extract_values("directors", TextPatterns.value_patterns(male=("男性", "名"), ratio=("比率", "%"))),
+                         {"male": 13, "ratio": 7.1})
+        self.assertEqual(parser.search("none", pattern), "")
+        self.assertEqual(parser.extract_value("none", "男性", "名"), "")
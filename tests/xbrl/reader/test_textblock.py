@@ -0,0 +1,56 @@
+import pickle
+import unittest
+
+from xbrr.xbrl.reader.element_value import ElementValue
+from xbrr.xbrl.reader.textblock import TextBlock
+
+
+STATEMENT = '''<?xml version="1.0" encoding="UTF-8"?>
+<html><body>
+<p>（単位：千円）</p>
+<table>
+<thead><tr><td><p>科目</p></td><td colspan="2"><p>前連結会計年度</p></td><td><p>当連結会計年度</p></td></tr></thead>
+<tbody>
+<tr><td><p style="margin-left: 11pt">現金及び預金</p></td><td colspan="2"><p>1,000</p></td><td><p>△2,000</p></td></tr>
+<tr><td colspan="2"><table><tr><td><p>nested</p></td></tr></table></td><td><p>3</p></td></tr>
+</tbody>
+</table>
+<!-- comment -->
+<p>百万円</p>
+</body></html>'''
+
+
+class TestTextBlock(unittest.TestCase):
+
+    def test_grid(self):
+        textblock = TextBlock(STATEMENT)
+        self.assertEqual([e.text for e in textblock.leading][-1], "（単位：千円）")
+        self.assertEqual(len(textblock.leading), 2)  # whole document and p
+        self.assertIn("百万円", textblock.leading[0].text)
+
+        self.assertEqual(len(textblock.tables), 2)
+        table, nested = textblock.tables
+        self.assertFalse(table.nested)
+        self.assertTrue(nested.nested)
+        self.assertIsNone(nested.head)
+        assert table.head is not None
+        self.assertEqual([c.get('colspan', '1') for c in table.head[0]], ['1', '2', '1'])
+        row = table.body[0]
+        self.assertEqual(row[0].paragraphs, ["現金及び預金"])
+        self.assertEqual(row[0].paragraph_style, "margin-left: 11pt")
+        self.assertEqual(row[2].text, "△2,000")
+        self.assertEqual(table.body[1][0].text, "nested")
+        self.assertEqual(nested.body[0][0].paragraphs, ["nested"])
+
+    def test_fragment(self):
+        textblock = TextBlock('単位：円<table><tr><td>1</td><th>x</th></tr></table>')
+        self.assertEqual(textblock.leading, [])
+        self.assertEqual([[c.text for c in row] for row in textblock.tables[0].body], [["1"]])
+        self.assertEqual(TextBlock('').tables, [])
+
+    def test_cached_by_element_value(self):
+        value = ElementValue("BalanceSheetTextBlock", value=STATEMENT.replace("<", "&lt;").replace(">", "&gt;"))
+        self.assertIs(value.textblock, value.textblock)
+        self.assertEqual(len(value.textblock.tables), 2)
+        restored = pickle.loads(pickle.dumps(value))
+        self.assertFalse(hasattr(restored, '_textblock'))
@@ -0,0 +1,129 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import pandas as pd
+from bs4 import BeautifulSoup
+
+from xbrr.xbrl.reader import time_series
+from xbrr.xbrl.reader.analysis_cache import AnalysisCache
+from xbrr.xbrl.reader.element_schema import ElementSchema
+from xbrr.xbrl.reader.role_arcs import RoleArc, read_role_arcs
+from xbrr.xbrl.reader.schema_store import SchemaStore
+from xbrr.xbrl.reader.taxonomy_repository import TaxonomyRepository
+from xbrr.xbrl.reader.time_series import TimeSeries
+
+LINKBASE = """<?xml version="1.0" encoding="UTF-8"?>
+<link:linkbase xmlns:link="http://www.xbrl.org/2003/linkbase" xmlns:xlink="http://www.w3.org/1999/xlink">
+  <link:calculationLink xlink:type="extended" xlink:role="http://example.com/role/BS">
+    <link:loc xlink:type="locator" xlink:href="jppfs_cor.xsd#jppfs_cor_Assets" xlink:label="Assets"/>
+    <link:loc xlink:type="locator" xlink:href="http://example.com/jppfs_cor.xsd#jppfs_cor_CurrentAssets" xlink:label="CurrentAssets"/>
+    <link:calculationArc xlink:type="arc" xlink:arcrole="http://www.xbrl.org/2003/arcrole/summation-item"
+                         xlink:from="Assets" xlink:to="CurrentAssets" order="1" weight="1"/>
+  </link:calculationLink>
+  <link:calculationLink xlink:type="extended" xlink:role="http://example.com/role/PL"/>
+</link:linkbase>
+"""
+
+
+class Filing():
+
+    def __init__(self, xbrl_file:str, published:datetime):
+        self.xbrl_file = xbrl_file
+        self.published_date = (published, "")
+
+
+class FilingSeries(TimeSeries):
+    """values of the filings are given without reading them"""
+
+    def __init__(self, rows:dict[str, list[dict]]):
+        super().__init__(taxonomy_repo=TaxonomyRepository(), statements=['bs'])
+        self.rows = rows
+
+    def read_filing(self, xbrl_doc, issuer=""):
+        df = pd.DataFrame(self.rows[xbrl_doc.xbrl_file]).reindex(columns=self.COLUMNS)
+        df['issuer'] = issuer
+        df['statement'] = 'bs'
+        df['published_date'] = xbrl_doc.published_date[0]
+        df['filing'] = xbrl_doc.xbrl_file
+        return df
+
+
+class TestTimeSeries(unittest.TestCase):
+
+    def test_read_role_arcs(self):
+        doc = BeautifulSoup(LINKBASE, "lxml-xml")
+        arcs = read_role_arcs(doc, "http://example.com/jppfs_cal.xml", "http://example.com/role/BS", "calculationLink", "calculationArc")
+        self.assertEqual(arcs, [RoleArc("http://example.com/jppfs_cor.xsd#jppfs_cor_Assets",
+                                        "http://example.com/jppfs_cor.xsd#jppfs_cor_CurrentAssets", "", "0", "1", "1")])
+        self.assertEqual(read_role_arcs(doc, "", "http://example.com/role/PL", "calculationLink", "calculationArc"), [])
+
+    def test_shared_role_arcs(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "jppfs_cal.xml")
+            with open(path, "w") as f:
+                f.write(LINKBASE)
+            repo = TaxonomyRepository()
+            repo.uri_to_path = lambda uri: [path]
+            arcs = repo.read_role_arcs("http://example.com/jppfs_cal.xml", "http://example.com/role/BS", "link:calculationLink", "link:calculationArc")
+            self.assertEqual(len(arcs), 1)
+            self.assertIs(repo.read_linkbase_index("http://example.com/jppfs_cal.xml"),
+                          repo.read_linkbase_index("http://example.com/jppfs_cal.xml"))
+
+    def test_build(self):
+        rows = {
+            "2021.xbrl": [{"name": "jppfs_cor:Assets", "consolidated": True, "member": "", "period": "2021-03-31", "value": "100"},
+                          {"name": "jppfs_cor:Assets", "consolidated": True, "member": "", "period": "2020-03-31", "value": "90"}],
+            "2020.xbrl": [{"name": "jppfs_cor:Assets", "consolidated": True, "member": "", "period": "2020-03-31", "value": "80"},
+                          {"name": "jppfs_cor:Assets", "consolidated": True, "member": "", "period": "2019-03-31", "value": "70"},
+                          {"name": "jppfs_cor:Assets", "consolidated": True, "member": "", "period": None, "value": "0"}],
+        }
+        series = FilingSeries(rows)
+        panel = series.build([Filing("2021.xbrl", datetime(2021, 6, 25)), Filing("2020.xbrl", datetime(2020, 6, 26))], issuer="E00001")
+        self.assertEqual(list(panel.columns), TimeSeries.COLUMNS)
+        self.assertEqual(list(panel['period']), [pd.Timestamp(2019, 3, 31), pd.Timestamp(2020, 3, 31), pd.Timestamp(2021, 3, 31)])
+        # restated value of the latest filing
+        self.assertEqual(list(panel['value']), ["70", "90", "100"])
+        self.assertEqual(list(panel['filing']), ["2020.xbrl", "2021.xbrl", "2021.xbrl"])
+
+        issuers = series.build_issuers({"E00001": [Filing("2020.xbrl", datetime(2020, 6, 26))],
+                                        "E00002": [Filing("2021.xbrl", datetime(2021, 6, 25))]})
+        self.assertEqual(list(issuers['issuer']), ["E00001", "E00001", "E00002", "E00002"])
+        self.assertTrue(TimeSeries.align([]).empty)
+
+    def test_shared_schemas(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            series = TimeSeries(save_dir=tmpdir, errors='ignore')
+            repos = []
+            def build_batch(self, items):
+                repos.append((self.taxonomy_repo, [issuer for issuer, _ in items]))
+                if self is series:
+                    # reading a filing loads the schemas of its taxonomy version
+                    self.taxonomy_repo.taxonomy_repo["jppfs_2021"] = {"jppfs_cor_Assets": ElementSchema(name="Assets")}
+                return pd.DataFrame(columns=TimeSeries.COLUMNS)
+            # joblib runs the batches in this process
+            def parallel(n_jobs):
+                return lambda tasks: [func(*args, **kwargs) for func, args, kwargs in tasks]
+
+            with mock.patch.object(time_series, "Parallel", parallel), mock.patch.object(TimeSeries, "build_batch", build_batch):
+                series.build_issuers({"E00001": [], "E00002": [], "E00003": []}, n_jobs=2)
+            # the first issuer is built in this process, and the schemas it loaded are exported for the workers
+            self.assertEqual(repos[0], (series.taxonomy_repo, ["E00001"]))
+            self.assertEqual(sorted([issuers for _, issuers in repos[1:]]), [["E00002"], ["E00003"]])
+            for repo, _ in repos[1:]:
+                self.assertIsNot(repo, series.taxonomy_repo)
+                self.assertIsInstance(repo.taxonomy_repo["jppfs_2021"], SchemaStore)
+                self.assertEqual(repo.taxonomy_repo["jppfs_2021"]["jppfs_cor_Assets"].name, "Assets")
+                repo.taxonomy_repo["jppfs_2021"].close()
+
+    @unittest.skipIf(time_series.Parallel is None, "joblib is not installed")
+    def test_build_issuers_parallel(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # the tasks are pickled to the worker processes, the filings which can't be read are skipped
+            series = TimeSeries(save_dir=tmpdir, cache=AnalysisCache(os.path.join(tmpdir, "cache")), errors='ignore')
+            panel = series.build_issuers({issuer: [Filing(os.path.join(tmpdir, f"{issuer}.xbrl"), datetime(2021, 6, 25))]
+                                          for issuer in ["E00001", "E00002", "E00003"]}, n_jobs=2)
+            self.assertEqual(list(panel.columns), TimeSeries.COLUMNS)
+            self.assertTrue(panel.empty)
@@ -0,0 +1,108 @@
+import asyncio
+import importlib.util
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import AsyncIterator
+
+if importlib.util.find_spec("aiohttp") is not None:
+    import aiohttp
+
+
+class AsyncSession():
+    """
+    Pooled aiohttp session shared by the async clients.
+
+    The number of simultaneous requests is limited by max_concurrency,
+    and server errors, rate limits (429), connection errors and timeouts are retried
+    with exponential backoff or after the Retry-After of the response, as open_session() does.
+    """
+    RETRY_STATUS = (429, 500, 502, 503, 504)
+
+    def __init__(self, max_concurrency: int = 4, timeout: float = 60,
+                 retries: int = 3, backoff_factor: float = 1,
+                 session: "aiohttp.ClientSession|None" = None):
+        """
+        Keyword Arguments:
+            max_concurrency {int} -- Maximum number of simultaneous requests (default: {4}).
+            timeout {float} -- Total timeout of a request in seconds (default: {60}).
+            retries {int} -- Retry count for server errors, rate limits, connection errors and timeouts (default: {3}).
+            backoff_factor {float} -- Sleep seconds before the first retry (default: {1}).
+            session {aiohttp.ClientSession} -- Session to use instead of the own one (default: {None}).
+        """
+        if importlib.util.find_spec("aiohttp") is None:
+            raise ImportError("aiohttp is required for async clients: pip install xbrr[async]")
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self._session = session
+        self._own_session = session is None
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency),
+                timeout=aiohttp.ClientTimeout(total=self.timeout))
+        return self._session
+
+    async def close(self):
+        if self._own_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncSession":
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    @asynccontextmanager
+    async def get(self, url: str, params: dict|None = None) -> AsyncIterator["aiohttp.ClientResponse"]:
+        async with self.semaphore:
+            for attempt in range(self.retries + 1):
+                try:
+                    response = await self.session.get(url, params=params)
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                    if attempt == self.retries:
+                        raise
+                    await asyncio.sleep(self.backoff(attempt))
+                    continue
+                if response.status not in self.RETRY_STATUS or attempt == self.retries:
+                    break
+                delay = self.retry_after(response)
+                response.release()
+                await asyncio.sleep(delay if delay is not None else self.backoff(attempt))
+            try:
+                yield response
+            finally:
+                response.release()
+
+    def backoff(self, attempt: int) -> float:
+        return self.backoff_factor * (2 ** attempt)
+
+    @staticmethod
+    def retry_after(response: "aiohttp.ClientResponse") -> float|None:
+        """seconds of the Retry-After header (seconds or http date), None if not given"""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        if value.strip().isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    @staticmethod
+    async def download(response: "aiohttp.ClientResponse", save_path: Path, chunk_size: int = 1 << 16) -> Path:
+        with save_path.open(mode="wb") as f:
+            async for chunk in response.content.iter_chunked(chunk_size):
+                f.write(chunk)
+        return save_path
@@ -0,0 +1,107 @@
+import queue
+import threading
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+K = TypeVar("K")
+
+_DONE = object()
+
+
+class _Failure():
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def run_pipeline(items: Iterable[K], stages: list[Callable[[Any], Any]],
+                 buffer_size: int = 2,
+                 release: Callable[[Any], None]|None = None) -> Iterator[tuple[K, Any]]:
+    """Run the stages over the items in a producer/consumer pipeline.
+
+    Each stage runs in its own thread and passes its result to the next stage
+    through a bounded queue, so that the stages of consecutive items
+    (ex. download, decompression and parse of documents) overlap.
+    The first stage is called with the item, the others with the result of the previous stage.
+
+    Arguments:
+        items {Iterable} -- Items to process (ex. document ids).
+        stages {list[Callable]} -- Functions applied in order.
+
+    Keyword Arguments:
+        buffer_size {int} -- Number of results waiting between two stages (default: {2}).
+        release {Callable} -- Called with the intermediate results which are not passed to
+                              the next stage because the pipeline is stopped (ex. close buffers)
+                              (default: {None}).
+
+    Returns:
+        Iterator[tuple] -- (item, result of the last stage) in the order of items.
+                           The error of a stage is raised when its item is reached.
+    """
+    assert len(stages) > 0
+    stop = threading.Event()
+    queues: list[queue.Queue] = [queue.Queue(maxsize=max(1, buffer_size)) for _ in stages]
+
+    def put(q: queue.Queue, entry) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def get(q: queue.Queue):
+        while not stop.is_set():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def inbox(index: int) -> Iterator[tuple[Any, Any]]:
+        if index == 0:
+            for item in items:
+                if stop.is_set(): return
+                yield item, item
+            return
+        while (entry:=get(queues[index - 1])) is not _DONE:
+            yield entry
+
+    def discard(value):
+        if release is not None and not isinstance(value, _Failure):
+            release(value)
+
+    def work(index: int):
+        stage = stages[index]
+        last = index == len(stages) - 1
+        try:
+            for item, value in inbox(index):
+                if not isinstance(value, _Failure):
+                    try:
+                        value = stage(value)
+                    except Exception as e:
+                        value = _Failure(e)
+                if not put(queues[index], (item, value)):
+                    if not last: discard(value)
+                    return
+        except Exception as e:  # failure of items iteration
+            put(queues[index], (None, _Failure(e)))
+        put(queues[index], _DONE)
+
+    threads = [threading.Thread(target=work, args=(i,), daemon=True) for i in range(len(stages))]
+    for thread in threads:
+        thread.start()
+    try:
+        while (entry:=get(queues[-1])) is not _DONE:
+            item, value = entry
+            if isinstance(value, _Failure):
+                raise value.error
+            yield item, value
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+        for q in queues[:-1]:
+            while not q.empty():
+                if (entry:=q.get_nowait()) is not _DONE:
+                    discard(entry[1])
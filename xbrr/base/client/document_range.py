@@ -0,0 +1,77 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from typing import Callable, Iterator
+
+
+class RateLimiter():
+    """Thread safe limiter which spaces requests at least 1/rate seconds apart."""
+
+    def __init__(self, rate: float):
+        """
+        Arguments:
+            rate {float} -- Requests per second, no limit if rate <= 0.
+        """
+        self.interval = 1 / rate if rate > 0 else 0
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self):
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next, now)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def is_complete(body: dict) -> bool:
+    """whether body is a successful and complete document list, which may be cached.
+
+    EDINET reports an error in the body (ex. invalid API key) with HTTP 200,
+    and the TDnet clients set the status of a day whose pages are not all read.
+    """
+    if "StatusCode" in body:
+        return str(body["StatusCode"]) == "200"
+    metadata = body.get("metadata", {})
+    return "resultset" in metadata and str(metadata.get("status", "200")) == "200"
+
+
+def date_range(start: str|datetime, end: str|datetime) -> list[datetime]:
+    """dates from start to end (both inclusive)"""
+    def to_datetime(date: str|datetime) -> datetime:
+        try:
+            return date if isinstance(date, datetime) else datetime.strptime(date, "%Y-%m-%d")
+        except ValueError:
+            raise Exception("Date format should be yyyy-mm-dd.")
+    _start, _end = to_datetime(start), to_datetime(end)
+    return [_start + timedelta(days=i) for i in range((_end - _start).days + 1)]
+
+
+def fetch_days(fetch: Callable[[datetime], dict], dates: list[datetime],
+               max_workers: int = 4) -> Iterator[tuple[datetime, dict]]:
+    """Fetch the response of each date in parallel, yielding (date, response) as the days complete.
+
+    The responses are cached by the ResponseCache of the client, if any.
+
+    Arguments:
+        fetch {Callable[[datetime], dict]} -- Function to get the response of a date.
+        dates {list[datetime]} -- Dates to fetch.
+
+    Keyword Arguments:
+        max_workers {int} -- Number of days fetched at the same time (default: {4}).
+    """
+    if not dates:
+        return
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {executor.submit(fetch, date): date for date in dates}
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            for future in futures:
+                future.cancel()
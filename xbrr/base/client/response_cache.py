@@ -0,0 +1,155 @@
+import hashlib
+import json
+import os
+import threading
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Callable
+from urllib.parse import urlencode
+
+import requests
+
+
+class CachedResponse():
+    """Response restored from ResponseCache, compatible with the part of requests.Response the clients use."""
+
+    def __init__(self, url:str, status_code:int, content:bytes, headers:dict[str,str]):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = requests.structures.CaseInsensitiveDict(headers)
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self):
+        pass
+
+
+class ResponseCache():
+    """
+    On-disk cache of raw responses per date with a freshness policy.
+
+    A response fetched immutable_days or more after its date is final and
+    served without any request. Other responses (ex. today's list) are fresh
+    for ttl seconds, then revalidated with If-None-Match/If-Modified-Since.
+    """
+    IGNORE_PARAMS = ("Subscription-Key",)
+
+    def __init__(self, cache_dir:str, immutable_days:int=2, ttl:float=300):
+        """
+        Arguments:
+            cache_dir {str} -- Directory to store responses.
+
+        Keyword Arguments:
+            immutable_days {int} -- Days after which the response of a date does not change (default: {2}).
+            ttl {float} -- Seconds a response which may change is fresh (default: {300}).
+        """
+        self.cache_dir = cache_dir
+        self.immutable_days = immutable_days
+        self.ttl = ttl
+        self._stats:Counter = Counter()
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def key(self, url:str, params:dict|None=None) -> str:
+        _params = sorted([(k, str(v)) for k, v in (params or {}).items() if k not in self.IGNORE_PARAMS])
+        return hashlib.sha1(f"{url}?{urlencode(_params)}".encode()).hexdigest()
+
+    def path(self, key:str, date:datetime|None=None) -> str:
+        return os.path.join(self.cache_dir, date.strftime("%Y-%m-%d") if date is not None else "undated", key)
+
+    def is_fresh(self, meta:dict, date:datetime|None=None, now:datetime|None=None) -> bool:
+        now = now if now is not None else datetime.now()
+        fetched_at = datetime.fromisoformat(meta["fetched_at"])
+        if date is not None and (fetched_at.date() - date.date()) >= timedelta(days=self.immutable_days):
+            return True
+        return (now - fetched_at).total_seconds() < self.ttl
+
+    def fetch(self, request:Callable[..., requests.Response], url:str, params:dict|None=None,
+              date:datetime|None=None, validate:Callable[[requests.Response], bool]|None=None) -> CachedResponse|requests.Response:
+        """Get url through the cache.
+
+        Arguments:
+            request {Callable} -- Function to send the request like requests.get or Session.get.
+            url {str} -- Request url.
+
+        Keyword Arguments:
+            params {dict} -- Query parameters (default: {None}).
+            date {datetime} -- Date the response is about, None if it is not dated (default: {None}).
+            validate {Callable} -- Whether a 200 response is valid to cache, ex. its body has no error (default: {None}).
+
+        Returns:
+            CachedResponse|requests.Response -- Cached response, or the response as is if it is an error.
+        """
+        path = self.path(self.key(url, params), date)
+        meta = self._load_meta(path)
+        if meta is not None and self.is_fresh(meta, date):
+            self._count("hit")
+            return self._load(path, meta)
+
+        headers = {}
+        if meta is not None:
+            if meta["headers"].get("etag"):
+                headers["If-None-Match"] = meta["headers"]["etag"]
+            if meta["headers"].get("last-modified"):
+                headers["If-Modified-Since"] = meta["headers"]["last-modified"]
+        r = request(url, params=params, headers=headers)
+
+        if r.status_code == 304 and meta is not None:
+            self._count("revalidated")
+            meta["fetched_at"] = datetime.now().isoformat()
+            self._write(path + ".json", json.dumps(meta).encode())
+            return self._load(path, meta)
+
+        self._count("miss")
+        if r.status_code != 200 or (validate is not None and not validate(r)):
+            return r
+        meta = {
+            "url": url,
+            "status_code": r.status_code,
+            "fetched_at": datetime.now().isoformat(),
+            "headers": {k.lower(): v for k, v in r.headers.items()
+                        if k.lower() in ("content-type", "etag", "last-modified")},
+        }
+        self._write(path + ".body", r.content)
+        self._write(path + ".json", json.dumps(meta).encode())
+        return CachedResponse(url, r.status_code, r.content, meta["headers"])
+
+    @property
+    def statistics(self) -> dict[str, int|float]:
+        """hit (fresh), revalidated (304) and miss counts and hit ratio"""
+        with self._lock:
+            stats:dict[str, int|float] = {key: self._stats[key] for key in ["hit", "revalidated", "miss"]}
+        total = sum(stats.values())
+        stats["hit_ratio"] = (stats["hit"] + stats["revalidated"]) / total if total else 0.0
+        return stats
+
+    def _count(self, kind:str):
+        with self._lock:
+            self._stats[kind] += 1
+
+    def _load_meta(self, path:str) -> dict|None:
+        if not os.path.isfile(path + ".json") or not os.path.isfile(path + ".body"):
+            return None
+        with open(path + ".json", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _load(self, path:str, meta:dict) -> CachedResponse:
+        with open(path + ".body", "rb") as f:
+            return CachedResponse(meta["url"], meta["status_code"], f.read(), meta["headers"])
+
+    def _write(self, path:str, content:bytes):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
@@ -0,0 +1,58 @@
+import threading
+
+import requests
+import requests.adapters
+import urllib3.util
+
+
+class TimeoutHTTPAdapter(requests.adapters.HTTPAdapter):
+    """HTTPAdapter which applies a default timeout to the requests without timeout."""
+
+    def __init__(self, *args, timeout: float|tuple[float, float]|None = None, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+        return super().send(request, **kwargs)
+
+
+def open_session(retries: int = 3, backoff_factor: float = 1,
+                 status_forcelist: tuple[int, ...] = (429, 500, 502, 503, 504),
+                 timeout: float|tuple[float, float]|None = (10, 60),
+                 pool_maxsize: int = 10) -> requests.Session:
+    """Open a keep-alive session with retry/backoff and default timeout.
+
+    Keyword Arguments:
+        retries {int} -- Retry count (default: {3}).
+        backoff_factor {float} -- Sleep seconds before the first retry (default: {1}).
+        status_forcelist {tuple[int]} -- Status codes to retry other than timeout (default: {(429, 500, 502, 503, 504)}).
+        timeout {(float, tuple[float, float])} -- Default connect/read timeout (default: {(10, 60)}).
+        pool_maxsize {int} -- Connections kept per host (default: {10}).
+
+    Returns:
+        requests.Session -- Configured session.
+    """
+    session = requests.session()
+    retry = urllib3.util.Retry(total=retries,
+                               backoff_factor=backoff_factor,
+                               status_forcelist=status_forcelist,
+                               respect_retry_after_header=True)
+    adapter = TimeoutHTTPAdapter(max_retries=retry, timeout=timeout,
+                                 pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_shared_sessions: dict[str, requests.Session] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_session(name: str) -> requests.Session:
+    """session shared by the clients of the same service (ex. 'edinet')"""
+    with _shared_lock:
+        if name not in _shared_sessions:
+            _shared_sessions[name] = open_session()
+        return _shared_sessions[name]
@@ -1,14 +1,36 @@
-from typing import Optional
+from typing import Any, Optional
 
-import re
 import unicodedata
-from datetime import datetime, date, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 from logging import getLogger
 
 from xbrr.base.reader.base_reader import BaseReader
+from xbrr.base.reader.text_patterns import TextPatterns
 from xbrr.xbrl.reader.element_value import ElementValue
 
 
+class memoized_property():
+    """
+    Property computed once for each aspect, as the filing read by an aspect doesn't change.
+    It is used for the intermediate values shared by the features, ex. fiscal dates.
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name:str):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = self.func(instance)
+        instance.__dict__[self.name] = value    # found before this descriptor from now on
+        return value
+
+
 class BaseParser():
     """
     Element to Value
@@ -20,6 +42,7 @@ class BaseParser():
         self.tags = {}
         if len(tags) > 0:
             self.tags = tags
+        self._values:dict[str, Optional[ElementValue]] = {}
 
         self.logger = getLogger(__name__)
             
@@ -36,49 +59,88 @@ class BaseParser():
         return _text
 
     def get_value(self, name:str) -> Optional[ElementValue]:
-        value = self.reader.findv(self.tags[name])
-        return value
+        if name not in self._values:
+            self._values[name] = self.reader.findv(self.tags[name])
+        return self._values[name]
+
+    def prefetch(self):
+        """resolve the values of all tags at once, which are used by get_value()"""
+        values = self.reader.findvs(self.tags.values())
+        self._values.update({name: values[tag] for name, tag in self.tags.items()})
 
     def search(self, name:str, pattern:str) -> str:
-        value = self.reader.findv(self.tags[name])
+        return self.search_texts(name, TextPatterns.of(text=pattern))['text']
+
+    def search_texts(self, name:str, patterns:TextPatterns) -> dict[str, str]:
+        """
+        Search the paragraphs (p, span) of the html of a value for the patterns in one pass.
+
+        Arguments:
+            name {str} -- name of the tag.
+            patterns {TextPatterns} -- patterns to search.
+
+        Returns:
+            dict[str, str] -- first normalized paragraph matching each pattern, '' if not found.
+        """
+        value = self.get_value(name)
         if not value:
-            return ''
-        ptn = re.compile(pattern)
+            return dict.fromkeys(patterns, '')
         tags = value.html.find_all(["p", "span"])
-        text = ""
-        if tags and len(tags) > 0:
-            for e in tags:
-                _text = self.normalize(e.text)
-                match = re.search(ptn, _text)
-                if match:
-                    text = _text
-                    break
-
-        return text
+        return patterns.search_texts(self.normalize(e.text) for e in tags)
 
     def extract_value(self, name, prefix:str="", suffix:str="",
                       filter_pattern:str="") -> int|float|str:
-        value = self.reader.findv(self.tags[name])
+        return self.extract_values(name, TextPatterns.value_patterns(value=(prefix, suffix)),
+                                   filter_pattern=filter_pattern).get('value', '')
+
+    def extract_values(self, name:str, patterns:TextPatterns, filter_pattern:str="") -> dict[str, int|float|str]:
+        """
+        Extract the values of the patterns from the text of a value in one pass,
+        ex. self.extract_values("directors", TextPatterns.value_patterns(male=("男性", "名"), female=("女性", "名"))).
+
+        Arguments:
+            name {str} -- name of the tag.
+            patterns {TextPatterns} -- patterns of the values, which are created by TextPatterns.value_patterns().
+
+        Keyword Arguments:
+            filter_pattern {str} -- pattern of the paragraph to extract the values from (default: {""}, whole text).
+
+        Returns:
+            dict[str, int|float|str] -- value of each pattern, '' if not found.
+        """
+        value = self.get_value(name)
         if not value:
-            return ''
-        text = value.html.text
+            return {}
         if filter_pattern:
             text = self.search(name, filter_pattern)
+        else:
+            text = value.text
+        return patterns.extract(text)
 
-        pattern = re.compile(f"({prefix}).+?({suffix})")
-        match = re.search(pattern, text)
-        value = ""
+    def statements(self, kinds:list[str], max_workers:int=0, **kwargs) -> dict[str, Any]:
+        """
+        Read the statements of kinds concurrently, ex. Finance.statements(['bs','pl','cf']).
+        The instance and linkbases already loaded by the reader are shared by the threads.
 
-        if match:
-            matched = match[0]
-            value = matched.replace(prefix, "").replace(suffix, "")
-            value = value.strip()
-            if value.isdigit():
-                value = int(value)
-            elif value.replace(".", "").replace("．", "").isdigit():
-                value = float(value)
+        Arguments:
+            kinds {list[str]} -- names of the statement methods of this aspect.
 
-        return value
+        Keyword Arguments:
+            max_workers {int} -- number of threads (default: {0}, a thread per kind).
+            kwargs -- arguments of the statement methods, ex. latest2year=True.
+
+        Returns:
+            dict[str, Any] -- statement (DataFrame) of each kind.
+        """
+        methods = {kind: getattr(self, kind) for kind in kinds}
+        if len(methods) <= 1:
+            return {kind: method(**kwargs) for kind, method in methods.items()}
+
+        # scan the presentation shared by every role before threads start
+        self.reader.role_decision_info
+        with ThreadPoolExecutor(max_workers=max_workers or len(methods)) as executor:
+            futures = {kind: executor.submit(method, **kwargs) for kind, method in methods.items()}
+            return {kind: future.result() for kind, future in futures.items()}
 
     @property
     def fiscal_year_end_date(self) -> date:
@@ -92,19 +154,9 @@ class BaseParser():
         """
         Get fiscal year start date from context information
         """
-        def get_start_days(d) -> tuple[date, int, date]:
-            start = datetime.strptime(d['period_start'], "%Y-%m-%d").date()
-            end = datetime.strptime(d['period'], "%Y-%m-%d").date()
-            duration = end - start
-            months = min(round(duration.days / 30.44), 12)
-            return start, months, end
         fyed = self.fiscal_year_end_date
-        durations = [get_start_days(duration) for duration in self.reader.context_dic.values()
-                     if 'period_start' in duration and duration['period']<=fyed.isoformat()]
-        if not durations:
+        fysd = self.reader.period_model.fiscal_year_start_date(fyed)
+        if fysd is None:
             self.logger.warning("No duration contexts found.")
             return fyed
-        fysd = sorted(durations, key=lambda x: (x[2],x[1],x[0]), reverse=True)[0][0]
         return fysd
-
-
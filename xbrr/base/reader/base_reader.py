@@ -1,16 +1,18 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Callable, Literal, Optional, TypedDict
+from typing import IO, TYPE_CHECKING, Any, Callable, Iterable, Literal, Optional, TypedDict
 
 import importlib
 from bs4 import BeautifulSoup, Tag
 import pandas as pd
 from datetime import date
 
+from xbrr.base.reader.base_element_value import BaseElementValue
 from xbrr.base.reader.xbrl_doc import XbrlDoc
 
 if TYPE_CHECKING:
     from xbrr.xbrl.reader.element_value import ElementValue
     from xbrr.xbrl.reader.element_schema import ElementSchema
+    from xbrr.xbrl.reader.period_model import PeriodModel
     from xbrr.xbrl.reader.role_schema import RoleSchema
 
 class BaseReader():
@@ -26,6 +28,10 @@ class BaseReader():
     def context_dic(self) -> dict[str,dict[str,str]]:
         raise NotImplementedError("You have to implement context_dic property.")
     
+    @property
+    def period_model(self) -> PeriodModel:
+        raise NotImplementedError("You have to implement period_model property.")
+
     @property
     def custom_roles(self):
         raise NotImplementedError("You have to implement custom_roles property.")
@@ -42,12 +48,18 @@ class BaseReader():
     def findv(self, name:str) -> ElementValue | None:
         raise NotImplementedError("You have to implement findv method.")
 
+    def findvs(self, names:Iterable[str]) -> dict[str, ElementValue | None]:
+        return {name: self.findv(name) for name in names}
+
     def get_label_uri(self, xsduri:str) -> str:
         raise NotImplementedError("You have to implement get_label_uri.")
 
     def get_schema_by_link(self, link:str) -> ElementSchema:
         raise NotImplementedError("You have to implement get_schema_by_link.")
 
+    def get_schemas_by_links(self, links:Iterable[str]) -> dict[str, ElementSchema]:
+        raise NotImplementedError("You have to implement get_schemas_by_links.")
+
     def get_role(self, role_name) -> RoleSchema:
         raise NotImplementedError("You have to implement get_role method.")
     
@@ -58,6 +70,10 @@ class BaseReader():
         "read xsd or xml specifed by uri"
         raise NotImplementedError("You have to implement read_uri method.")
 
+    def open_uri(self, uri:str) -> IO[bytes] | None:
+        "open xsd or xml specified by uri as a binary file for streaming parsers, None if it's not available"
+        return None
+
     def read_value_by_role(self, role_link:str, fix_cal_node:list = [], scope:str = "", report_start:Optional[date]=None, report_end:Optional[date]=None) -> pd.DataFrame:
         raise NotImplementedError("You have to implement read_value_by_role method.")
 
@@ -74,12 +90,7 @@ class BaseReader():
     def role_decision_info(self) -> list[PreTable|PreHeading]:
         raise NotImplementedError("You have to implement scan method.")
 
-    def extract(self, aspect_cls_or_str, property=""):
-        if not isinstance(aspect_cls_or_str, str):
-            aspect_cls = aspect_cls_or_str
-            return aspect_cls(self)
-
-        aspect_str = aspect_cls_or_str
+    def aspect_class(self, aspect_str:str) -> type:
         imports = (
             "xbrr",
             self.package,
@@ -101,8 +112,58 @@ class BaseReader():
 
         except Exception as ex:
             raise Exception(f"Can't load class that matches {aspect_str} \n {ex}.")
+        return _class
+
+    def extract(self, aspect_cls_or_str, property=""):
+        if not isinstance(aspect_cls_or_str, str):
+            aspect_cls = aspect_cls_or_str
+            return aspect_cls(self)
 
-        aspect = _class(self)
+        aspect = self.aspect_class(aspect_cls_or_str)(self)
         feature = getattr(aspect, property)
 
         return feature
+
+    def extract_record(self, features:list[str]|dict[str,str], errors:Literal['raise','ignore']='raise') -> dict[str, Any]:
+        """
+        Extract the features of aspects into one flat record, which is a row of a cross-sectional dataset.
+        ex. reader.extract_record(["metadata.company_name", "forecast.fiscal_year_end_date"])
+
+        Each aspect is created once, the values of all its tags are resolved at once,
+        and the intermediate values (ex. fiscal dates) are shared by the features of the aspect.
+
+        Arguments:
+            features -- "aspect.property" names, or column name to "aspect.property".
+                        A method of the aspect (ex. "forecast.get_security_code") is called without arguments.
+
+        Keyword Arguments:
+            errors {str} -- 'raise' the error of a feature, or 'ignore' it and set None (default: {'raise'}).
+
+        Returns:
+            dict[str, Any] -- column name to the value, ElementValue is replaced with its value.
+        """
+        if not isinstance(features, dict):
+            features = {feature: feature for feature in features}
+
+        aspects:dict[str, Any] = {}
+        record:dict[str, Any] = {}
+        for column, feature in features.items():
+            aspect_str, property = feature.split(".", 1)
+            try:
+                if aspect_str not in aspects:
+                    aspects[aspect_str] = None  # an aspect which can't be created is not retried
+                    aspect = self.aspect_class(aspect_str)(self)
+                    if hasattr(aspect, 'prefetch'):
+                        aspect.prefetch()
+                    aspects[aspect_str] = aspect
+                if (aspect:=aspects[aspect_str]) is None:
+                    raise LookupError(f"{aspect_str} is not available.")
+                value = getattr(aspect, property)
+                if callable(value):
+                    value = value()
+                record[column] = getattr(value, 'value') if isinstance(value, BaseElementValue) else value
+            except Exception:
+                if errors == 'raise':
+                    raise
+                record[column] = None
+        return record
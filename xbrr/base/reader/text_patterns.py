@@ -0,0 +1,119 @@
+import functools
+import re
+from typing import Iterable, Optional
+
+# a pattern which refers to its own groups or sets global flags can not be a part of an alternation
+UNSCANNABLE = re.compile(r'\\[1-9]|\(\?P[<=]|\(\?\(|^\(\?[aiLmsux]+\)')
+
+
+class TextPatterns():
+    """
+    Named regular expressions, which are compiled once and searched over a text in one scan.
+
+    The patterns are joined into an alternation, and the search resumes from the position
+    of the last match with the patterns not found yet, so that the text is scanned once
+    and each pattern finds the same match as its own search.
+    """
+
+    def __init__(self, patterns:dict[str,str], flags:int=0,
+                 affixes:dict[str,tuple[str,str]]={}):
+        """
+        Arguments:
+            patterns -- name to regular expression.
+
+        Keyword Arguments:
+            flags {int} -- flags of re.compile (default: {0}).
+            affixes -- name to (prefix, suffix) stripped from the match by extract().
+        """
+        self.patterns = {name: re.compile(pattern, flags) for name, pattern in patterns.items()}
+        self.flags = flags
+        self.affixes = affixes
+        self._scannable = [name for name, pattern in patterns.items() if not UNSCANNABLE.search(pattern)]
+        self._scanners:dict[frozenset[str], re.Pattern] = {}
+
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def of(cls, **patterns:str) -> 'TextPatterns':
+        """patterns compiled once for the same arguments, ex. TextPatterns.of(text='^(男性).+(名)')"""
+        return cls(patterns)
+
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def value_patterns(cls, **affixes:tuple[str,str]) -> 'TextPatterns':
+        """patterns of the values between prefix and suffix, ex. TextPatterns.value_patterns(male=('男性','名'))"""
+        return cls({name: f"({prefix}).+?({suffix})" for name, (prefix, suffix) in affixes.items()},
+                   affixes=affixes)
+
+    def __getitem__(self, name:str) -> re.Pattern:
+        return self.patterns[name]
+
+    def __iter__(self):
+        return iter(self.patterns)
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def _scanner(self, names:frozenset[str]) -> re.Pattern:
+        if (scanner:=self._scanners.get(names)) is None:
+            groups = [f"(?P<_{i}>{self.patterns[name].pattern})" for i, name in enumerate(self._scannable) if name in names]
+            scanner = re.compile("|".join(groups), self.flags)
+            self._scanners[names] = scanner
+        return scanner
+
+    def search(self, text:str, names:Optional[Iterable[str]]=None) -> dict[str, Optional[re.Match]]:
+        """
+        first match of each pattern in text, same as re.search of the pattern.
+
+        Keyword Arguments:
+            names -- names of the patterns to search (default: {None}, all of them).
+
+        Returns:
+            dict[str, Optional[re.Match]] -- name to the match by the pattern itself or None.
+        """
+        names = list(self.patterns) if names is None else list(names)
+        found:dict[str, Optional[re.Match]] = dict.fromkeys(names)
+        remaining = set(names) & set(self._scannable)
+        pos = 0
+        while remaining:
+            m = self._scanner(frozenset(remaining)).search(text, pos)
+            if m is None:
+                break
+            # the leftmost match of the remaining patterns, no other one matches before it
+            name = self._scannable[int((m.lastgroup or '')[1:])]
+            pos = m.start()
+            found[name] = self.patterns[name].match(text, pos)
+            remaining.discard(name)
+        for name in names:
+            if name not in self._scannable:
+                found[name] = self.patterns[name].search(text)
+        return found
+
+    def search_texts(self, texts:Iterable[str], names:Optional[Iterable[str]]=None) -> dict[str, str]:
+        """first text of texts (ex. paragraphs) matching each pattern, '' if no text matches"""
+        found = dict.fromkeys(self.patterns if names is None else names, '')
+        remaining = list(found)
+        for text in texts:
+            if not remaining:
+                break
+            matches = self.search(text, remaining)
+            for name, m in matches.items():
+                if m is not None:
+                    found[name] = text
+            remaining = [name for name in remaining if matches[name] is None]
+        return found
+
+    def extract(self, text:str) -> dict[str, int|float|str]:
+        """values between the prefix and suffix of each pattern, which are converted to number if possible"""
+        values:dict[str, int|float|str] = {}
+        for name, m in self.search(text).items():
+            value:int|float|str = ""
+            if m:
+                prefix, suffix = self.affixes.get(name, ("", ""))
+                value = m[0].replace(prefix, "").replace(suffix, "").strip()
+                if value.isdigit():
+                    value = int(value)
+                elif value.replace(".", "").replace("．", "").isdigit():
+                    value = float(value)
+            values[name] = value
+        return values
+
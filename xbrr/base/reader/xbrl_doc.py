@@ -1,27 +1,66 @@
+import glob
 import os
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import IO
 
 from bs4 import BeautifulSoup
 
 from xbrr.base.reader.base_doc import BaseDoc
+from xbrr.base.reader.zip_archive import ZipArchive
 
 
 class XbrlDoc(BaseDoc):
 
-    def __init__(self, package, root_dir:str|Path="", xbrl_file=""):
+    def __init__(self, package, root_dir:str|Path="", xbrl_file="", archive:ZipArchive|None=None):
         super().__init__(package, root_dir=root_dir, xbrl_file=xbrl_file)
+        self.archive = archive
         self._cache = {}
+        self._uri_cache:dict[str, BeautifulSoup] = {}
 
     def read_file(self, kind:str) -> BeautifulSoup:
         path = self.find_path(kind)
-        if (not os.path.isfile(path)):
+        if (not self.isfile(path)):
             return BeautifulSoup()  # no content
         if kind not in self._cache:
-            with open(path, encoding="utf-8-sig") as f:
+            with self.open(path) as f:
                 self._cache[kind] = BeautifulSoup(f, "lxml-xml")
         return self._cache[kind]
 
+    def read_uri(self, path:str) -> BeautifulSoup:
+        "read a local xsd or xml of the archived document"
+        assert self.archive is not None
+        if path not in self._uri_cache:
+            if not self.isfile(path):
+                return BeautifulSoup()  # no content
+            with self.open(path) as f:
+                self._uri_cache[path] = BeautifulSoup(f, "lxml-xml")
+        return self._uri_cache[path]
+
+    # file access of the document, which is served by the archive if any
+
+    def glob(self, pattern:str) -> list[str]:
+        if self.archive is not None:
+            return self.archive.glob(pattern)
+        return glob.glob(pattern, recursive=True)
+
+    def isfile(self, path:str) -> bool:
+        if self.archive is not None:
+            return self.archive.isfile(path)
+        return os.path.isfile(path)
+
+    def getsize(self, path:str) -> int:
+        if self.archive is not None:
+            return self.archive.getsize(path)
+        return os.path.getsize(path)
+
+    def open(self, path:str, mode:str="r") -> IO:
+        if self.archive is not None:
+            return self.archive.open(path, mode)
+        if mode == "rb":
+            return open(path, mode)
+        return open(path, encoding="utf-8-sig")
+
     @property
     def published_date(self) -> tuple[datetime, str]:
         raise NotImplementedError("You have to implement published_date.")
@@ -0,0 +1,79 @@
+import fnmatch
+import io
+import posixpath
+import threading
+from pathlib import Path
+from typing import IO
+from zipfile import ZipFile
+
+
+class ZipArchive():
+    """
+    Submitted ZIP file read in place.
+
+    The members are located by the central directory of the ZIP file,
+    and only the members actually read are decompressed.
+    """
+
+    def __init__(self, file:str|Path|IO[bytes]):
+        """
+        Arguments:
+            file -- path or binary file object (ex. spooled download buffer) of the ZIP file,
+                    which is closed with the archive (also when it is not a ZIP file).
+        """
+        self.file = file
+        try:
+            self.zip = ZipFile(file, "r")
+        except Exception:
+            if not isinstance(file, (str, Path)):
+                file.close()
+            raise
+        self.names = [info.filename for info in self.zip.infolist() if not info.is_dir()]
+        self._members:dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.zip.close()
+        self._members.clear()
+        if not isinstance(self.file, (str, Path)):
+            self.file.close()
+
+    @staticmethod
+    def normpath(path:str) -> str:
+        return posixpath.normpath(path.replace("\\", "/")).lstrip("/")
+
+    def glob(self, pattern:str) -> list[str]:
+        pattern = self.normpath(pattern)
+        return [name for name in self.names if fnmatch.fnmatchcase(name, pattern)]
+
+    def isfile(self, path:str) -> bool:
+        return self.normpath(path) in self.names
+
+    def getsize(self, path:str) -> int:
+        return self.zip.getinfo(self.normpath(path)).file_size
+
+    def read(self, path:str) -> bytes:
+        name = self.normpath(path)
+        if (data:=self._members.get(name)) is None:
+            with self._lock:  # ZipFile over a file object is not thread safe
+                data = self.zip.read(name)
+        return data
+
+    def load(self, pattern:str) -> list[str]:
+        """decompress the members matching pattern into memory in advance"""
+        names = self.glob(pattern)
+        for name in names:
+            self._members[name] = self.read(name)
+        return names
+
+    def open(self, path:str, mode:str="r") -> IO:
+        data = io.BytesIO(self.read(path))
+        if mode == "rb":
+            return data
+        return io.TextIOWrapper(data, encoding="utf-8-sig")
@@ -0,0 +1,139 @@
+import asyncio
+from datetime import datetime
+from pathlib import Path
+
+from xbrr.base.client.async_session import AsyncSession
+from xbrr.edinet.client.base_client import BaseClient
+from xbrr.edinet.client.document_client import DocumentClient
+from xbrr.edinet.client.document_list_client import BaseDocumentListClient
+from xbrr.edinet.models import Documents, MetaData
+from xbrr.xbrl.models.error_response import ErrorResponse
+
+
+class AsyncBaseDocumentListClient(BaseDocumentListClient):
+    """Async client to handle Document List API."""
+
+    def __init__(self, response_type: str, apikey: str = "", base_url: str = BaseClient.BASE_URL,
+                 session: AsyncSession|None = None):
+        """
+        Arguments:
+            response_type {str} -- Response type of document list api.
+
+        Keyword Arguments:
+            apikey {str} -- EDINET API key (default: {""}).
+            base_url {str} -- API url template (default: {BaseClient.BASE_URL}).
+            session {AsyncSession} -- Session shared with other clients (default: {None}).
+        """
+        super().__init__(response_type, apikey=apikey, base_url=base_url)
+        self.session = session if session is not None else AsyncSession()
+
+    async def _get(self, date:str|datetime) -> dict:
+        """Get Document List API response.
+
+        Arguments:
+            date {(str, datetime)} -- Request date.
+
+        Returns:
+            dict -- EDINET Response (JSON).
+        """
+        async with self.session.get(self.endpoint, params=self._params(date)) as r:
+            if not r.ok:
+                ErrorResponse(str(r.status), str(r.reason)).raise_for_status(r)
+            body = await r.json(content_type=None)
+        return body
+
+    async def close(self):
+        await self.session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+class AsyncMetaDataClient(AsyncBaseDocumentListClient):
+    """Async client to get metadata of document list."""
+
+    def __init__(self, apikey: str = "", base_url: str = BaseClient.BASE_URL, session: AsyncSession|None = None):
+        super().__init__(response_type="1", apikey=apikey, base_url=base_url, session=session)
+
+    async def get(self, date:str|datetime) -> MetaData:
+        body = await self._get(date)
+        return MetaData.create(body)
+
+
+class AsyncDocumentListClient(AsyncBaseDocumentListClient):
+    """Async client to get document list."""
+
+    def __init__(self, apikey: str = "", base_url: str = BaseClient.BASE_URL, session: AsyncSession|None = None):
+        super().__init__(response_type="2", apikey=apikey, base_url=base_url, session=session)
+
+    async def get(self, date:str|datetime) -> Documents:
+        body = await self._get(date)
+        return Documents.create(body)
+
+
+class AsyncDocumentClient(DocumentClient):
+    """Async client to get file."""
+
+    def __init__(self, apikey: str = "", base_url: str = BaseClient.BASE_URL, session: AsyncSession|None = None):
+        super().__init__(apikey=apikey, base_url=base_url)
+        self.session = session if session is not None else AsyncSession()
+
+    async def get(self, document_id: str, response_type: str,
+                  save_dir: str = "", file_name: str = "") -> Path:
+        """Get file of document_id and write it to save_dir/file_name while receiving.
+
+        Arguments:
+            document_id {str} -- Document id of EDINET.
+            response_type {str} -- Response type of document get API.
+
+        Keyword Arguments:
+            save_dir {str} -- Directory to save file (default: {""}).
+            file_name {str} -- Filename of the document (default: {""}).
+
+        Returns:
+            Path -- Path to saved file.
+        """
+        url = self.endpoint.format(document_id)
+        async with self.session.get(url, params=self._params(response_type)) as r:
+            content_type = r.headers.get("content-type", "")
+            if not r.ok:
+                ErrorResponse(str(r.status), str(r.reason)).raise_for_status(r)
+            elif content_type.startswith("application/json"):
+                error = ErrorResponse.create(await r.json())
+                error.raise_for_status(r)
+            elif content_type.startswith("text/html"):
+                error = ErrorResponse(str(r.status), await r.text())
+                error.raise_for_status(r)
+
+            _file_name = self._file_name(r.headers, document_id, response_type, file_name)
+            save_path = self._save_path(_file_name, save_dir)
+            return await self.session.download(r, save_path)
+
+    async def get_pdf(self, document_id: str,
+                      save_dir: str = "", file_name: str = "") -> Path:
+        return await self.get(document_id, "2", save_dir, file_name)
+
+    async def get_xbrl(self, document_id: str,
+                       save_dir: str = "", file_name: str = "", lang: str = "ja",
+                       expand_level: str = "file") -> Path:
+        response_type = self._xbrl_response_type(lang)
+        path = await self.get(document_id, response_type, save_dir, file_name)
+        return await asyncio.to_thread(self._expand_xbrl, path, document_id, expand_level)
+
+    async def get_xbrl_dir(self, document_id: str,
+                           save_dir: str = "",
+                           file_name: str = "",
+                           lang: str = "ja") -> Path:
+        return await self.get_xbrl(document_id, save_dir, file_name, lang, expand_level="dir")
+
+    async def close(self):
+        await self.session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
@@ -1,5 +1,8 @@
+import requests
 from pit import Pit
 
+from xbrr.base.client.session import shared_session
+
 class BaseClient():
     """"Base API Client.
 
@@ -7,21 +10,30 @@ class BaseClient():
     """
     BASE_URL = "https://api.edinet-fsa.go.jp/api/{}/{}"
 
-    def __init__(self, target: str, version: str = "v2"):
+    def __init__(self, target: str, version: str = "v2", apikey: str = "", base_url: str = BASE_URL,
+                 session: requests.Session|None = None):
         """
         Arguments:
             target -- API destination (set by subclass).
 
         Keyword Arguments:
             version {str} -- API version. (default: {"v1"}).
+            apikey {str} -- EDINET API key, read from Pit if not given (default: {""}).
+            base_url {str} -- API url template (default: {BASE_URL}).
+            session {requests.Session} -- Session to send requests, the pooled session
+                                          shared by EDINET clients if not given (default: {None}).
         """
         self.version = version
         self.target = target
-        pitdata = Pit.get('editnet_apikey', {
-            'require': {'edinet_apikey': 'edinet apikey'}
-        })
-        self.apikey = pitdata['edinet_apikey']
+        self.base_url = base_url
+        self.session = session if session is not None else shared_session("edinet")
+        if not apikey:
+            pitdata = Pit.get('editnet_apikey', {
+                'require': {'edinet_apikey': 'edinet apikey'}
+            })
+            apikey = pitdata['edinet_apikey']
+        self.apikey = apikey
 
     @property
     def endpoint(self) -> str:
-        return self.BASE_URL.format(self.version, self.target)
+        return self.base_url.format(self.version, self.target)
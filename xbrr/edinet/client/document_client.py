@@ -1,19 +1,28 @@
 import re
 import tempfile
 from pathlib import Path
+from typing import IO, Callable, Iterable, Iterator, TypeVar, cast
 from zipfile import ZipFile
 
 import requests
 
+from xbrr.base.client.document_pipeline import run_pipeline
+from xbrr.base.reader.zip_archive import ZipArchive
 from xbrr.edinet.client.base_client import BaseClient
 from xbrr.xbrl.models.error_response import ErrorResponse
 
+T = TypeVar("T")
+
 
 class DocumentClient(BaseClient):
     """Client to get file."""
 
-    def __init__(self):
-        super().__init__(target="documents/{}")
+    SPOOL_SIZE = 16 * 1024 * 1024
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, apikey: str = "", base_url: str = BaseClient.BASE_URL,
+                 session: requests.Session|None = None):
+        super().__init__(target="documents/{}", apikey=apikey, base_url=base_url, session=session)
 
     def get(self, document_id: str, response_type: str,
             save_dir: str = "", file_name: str = "") -> Path:
@@ -34,13 +43,50 @@ class DocumentClient(BaseClient):
         Returns:
             str -- Path to saved file.
         """
-        url = self.endpoint.format(document_id)
-        params = {
-            "type": response_type,
-            "Subscription-Key": self.apikey
-        }
+        r = self._request(document_id, response_type)
+
+        _file_name = self._file_name(r.headers, document_id, response_type, file_name)
+        chunk_size = 1024
+        save_path = self._save_path(_file_name, save_dir)
+
+        with r, save_path.open(mode="wb") as f:
+            for chunk in r.iter_content(chunk_size):
+                f.write(chunk)
+
+        return save_path
+
+    def get_buffer(self, document_id: str, response_type: str,
+                   max_size: int = 0) -> IO[bytes]:
+        """Get file of document_id into a buffer instead of a file.
+
+        Arguments:
+            document_id {str} -- Document id of EDINET.
+            response_type {str} -- Response type of document get API (see get).
+
+        Keyword Arguments:
+            max_size {int} -- The buffer is kept in memory up to max_size bytes,
+                              and rolled over to an anonymous temporary file beyond it
+                              (default: {0}, which means SPOOL_SIZE).
+
+        Returns:
+            IO[bytes] -- Buffer rewound to the beginning.
+        """
+        r = self._request(document_id, response_type)
+
+        buffer = tempfile.SpooledTemporaryFile(max_size=max_size or self.SPOOL_SIZE)
+        try:
+            with r:
+                for chunk in r.iter_content(self.CHUNK_SIZE):
+                    buffer.write(chunk)
+        except BaseException:
+            buffer.close()
+            raise
+        buffer.seek(0)
+        return cast(IO[bytes], buffer)
 
-        r = requests.get(url, params=params, stream=True)
+    def _request(self, document_id: str, response_type: str) -> requests.Response:
+        url = self.endpoint.format(document_id)
+        r = self.session.get(url, params=self._params(response_type), stream=True)
 
         if not r.ok:
             r.raise_for_status()
@@ -50,11 +96,21 @@ class DocumentClient(BaseClient):
         elif r.headers["content-type"].startswith("text/html"):
             error = ErrorResponse(str(r.status_code), r.text)
             error.raise_for_status(r)
+        return r
+
+    def _params(self, response_type: str) -> dict:
+        params = {
+            "type": response_type,
+            "Subscription-Key": self.apikey
+        }
+        return params
 
+    @staticmethod
+    def _file_name(headers, document_id: str, response_type: str, file_name: str = "") -> str:
         _file_name = file_name
         if not _file_name:
-            if "content-disposition" in r.headers:
-                d = r.headers["content-disposition"]
+            if "content-disposition" in headers:
+                d = headers["content-disposition"]
                 file_names = re.findall("filename=\"(.+)\"", d)
                 if len(file_names) > 0:
                     _file_name = file_names[0]
@@ -62,22 +118,19 @@ class DocumentClient(BaseClient):
             if not _file_name:
                 ext = ".pdf" if response_type == "2" else ".zip"
                 _file_name = document_id + ext
+        return _file_name
 
-        chunk_size = 1024
+    @staticmethod
+    def _save_path(file_name: str, save_dir: str = "") -> Path:
         if save_dir:
-            save_path = Path(save_dir).joinpath(_file_name)
+            save_path = Path(save_dir).joinpath(file_name)
         else:
-            _file_name = Path(_file_name)
+            _file_name = Path(file_name)
             tmpf = tempfile.NamedTemporaryFile(
                     prefix=_file_name.stem + "__",
                     suffix=_file_name.suffix,
                     delete=False)
             save_path = Path(tmpf.name)
-
-        with save_path.open(mode="wb") as f:
-            for chunk in r.iter_content(chunk_size):
-                f.write(chunk)
-
         return save_path
 
     def get_pdf(self, document_id: str,
@@ -118,19 +171,22 @@ class DocumentClient(BaseClient):
         Returns:
             str -- Saved file path.
         """
-        response_type = -1
-        xbrl_path = ""
+        response_type = self._xbrl_response_type(lang)
+        path = self.get(document_id, response_type, save_dir, file_name)
+        return self._expand_xbrl(path, document_id, expand_level)
+
+    @staticmethod
+    def _xbrl_response_type(lang: str) -> str:
         if lang == "ja":
             response_type = "1"
-            xbrl_path = "XBRL/PublicDoc/"
         elif lang == "en":
             response_type = "4"
-            xbrl_path = "XBRL/EnglishDoc/"
         else:
             raise Exception(f"Language {lang} is not supported on EDINET.")
+        return response_type
 
-        path = self.get(document_id, response_type, save_dir, file_name)
-
+    @staticmethod
+    def _expand_xbrl(path: Path, document_id: str, expand_level: str = "file") -> Path:
         if expand_level == "":
             return path
         elif expand_level == "dir":
@@ -171,3 +227,62 @@ class DocumentClient(BaseClient):
                 file_name=file_name,
                 lang=lang,
                 expand_level="dir")
+
+    def get_xbrl_archive(self, document_id: str, lang: str = "ja") -> ZipArchive:
+        """Get XBRL ZIP file without saving it.
+
+        Arguments:
+            document_id {str} -- Document id of EDINET.
+
+        Keyword Arguments:
+            lang {str} -- Language of document (default: {"ja"}).
+
+        Returns:
+            ZipArchive -- ZIP file in memory, which is given to Doc as archive.
+        """
+        response_type = self._xbrl_response_type(lang)
+        return ZipArchive(self.get_buffer(document_id, response_type))
+
+    def iter_xbrl(self, document_ids: Iterable[str], parse: Callable[[ZipArchive], T],
+                  lang: str = "ja", members: str = "XBRL/PublicDoc/*",
+                  buffer_size: int = 2) -> Iterator[tuple[str, T]]:
+        """Download, decompress and parse XBRL files of the documents in a pipeline.
+
+        While a document is parsed, the members of the next one are decompressed
+        and the one after is downloaded.
+
+        Arguments:
+            document_ids {Iterable[str]} -- Document ids of EDINET.
+            parse {Callable[[ZipArchive], T]} -- Function to parse a document,
+                                                 ex. lambda archive: Reader(Doc(xbrl_kind="public", archive=archive)).
+
+        Keyword Arguments:
+            lang {str} -- Language of document (default: {"ja"}).
+            members {str} -- Pattern of the members decompressed before parse (default: {"XBRL/PublicDoc/*"}).
+            buffer_size {int} -- Number of documents waiting between the stages (default: {2}).
+
+        Returns:
+            Iterator[tuple[str, T]] -- (document id, parse result) in the order of document_ids.
+                                       The archive is closed when parse returns, so parse has to
+                                       read what the result needs from it.
+        """
+        response_type = self._xbrl_response_type(lang)
+
+        def download(document_id: str) -> IO[bytes]:
+            return self.get_buffer(document_id, response_type)
+
+        def decompress(buffer: IO[bytes]) -> ZipArchive:
+            archive = ZipArchive(buffer)
+            try:
+                archive.load(members)
+            except Exception:
+                archive.close()
+                raise
+            return archive
+
+        def parse_archive(archive: ZipArchive) -> T:
+            with archive:
+                return parse(archive)
+
+        return run_pipeline(document_ids, [download, decompress, parse_archive], buffer_size,
+                            release=lambda value: value.close())
@@ -1,6 +1,9 @@
 from datetime import datetime
+from typing import Iterator
 import requests
 
+from xbrr.base.client.document_range import RateLimiter, date_range, fetch_days, is_complete
+from xbrr.base.client.response_cache import ResponseCache
 from xbrr.edinet.client.base_client import BaseClient
 from xbrr.edinet.models import Documents, MetaData
 
@@ -8,27 +11,67 @@ from xbrr.edinet.models import Documents, MetaData
 class BaseDocumentListClient(BaseClient):
     """Base client to handle Document List API."""
 
-    def __init__(self, response_type: str):
+    def __init__(self, response_type: str, apikey: str = "", base_url: str = BaseClient.BASE_URL,
+                 cache: ResponseCache|None = None, session: requests.Session|None = None):
         """
         Arguments:
             response_type {str} -- Response type of document list api.
+
+        Keyword Arguments:
+            apikey {str} -- EDINET API key (default: {""}).
+            base_url {str} -- API url template (default: {BaseClient.BASE_URL}).
+            cache {ResponseCache} -- Cache of the responses per date (default: {None}).
+            session {requests.Session} -- Session to send requests (default: {None}).
         """
-        super().__init__(target="documents.json")
+        super().__init__(target="documents.json", apikey=apikey, base_url=base_url, session=session)
         self.response_type = response_type
+        self.cache = cache
 
-    def _get(self, date:str|datetime) -> dict:
+    def _get(self, date:str|datetime, rate_limiter:RateLimiter|None=None,
+             cache:ResponseCache|None=None) -> dict:
         """Get Document List API response.
 
         Arguments:
             date {(str, datetime)} -- Request date.
 
+        Keyword Arguments:
+            rate_limiter {RateLimiter} -- Limiter shared by parallel requests (default: {None}).
+            cache {ResponseCache} -- Cache of the responses instead of the cache of the client (default: {None}).
+
         Raises:
             Exception: Date format exception.
 
         Returns:
             dict -- EDINET Response (JSON).
         """
-        url = self.endpoint
+        params = self._params(date)
+        def request(url, **kwargs):
+            if rate_limiter is not None:
+                rate_limiter.wait()
+            return self.session.get(url, **kwargs)
+
+        cache = cache if cache is not None else self.cache
+        if cache is not None:
+            r = cache.fetch(request, self.endpoint, params, datetime.strptime(params["date"], "%Y-%m-%d"),
+                                 validate=self._is_valid)
+        else:
+            r = request(self.endpoint, params=params)
+
+        if not r.ok:
+            r.raise_for_status()
+
+        body = r.json()
+        return body
+
+    @staticmethod
+    def _is_valid(r:requests.Response) -> bool:
+        """EDINET returns an error (ex. invalid API key) in the body with HTTP 200, which is not cached"""
+        try:
+            return is_complete(r.json())
+        except ValueError:
+            return False
+
+    def _params(self, date:str|datetime) -> dict:
         _date = date
         if isinstance(date, str):
             try:
@@ -43,21 +86,15 @@ class BaseDocumentListClient(BaseClient):
             "type": self.response_type,
             "Subscription-Key": self.apikey
         }
-
-        r = requests.get(url, params=params)
-
-        if not r.ok:
-            r.raise_for_status()
-
-        body = r.json()
-        return body
+        return params
 
 
 class MetaDataClient(BaseDocumentListClient):
     """Client to get metadata of document list."""
 
-    def __init__(self):
-        super().__init__(response_type="1")  # 1 = only metadata.
+    def __init__(self, apikey: str = "", base_url: str = BaseClient.BASE_URL, cache: ResponseCache|None = None,
+                 session: requests.Session|None = None):
+        super().__init__(response_type="1", apikey=apikey, base_url=base_url, cache=cache, session=session)  # 1 = only metadata.
 
     def get(self, date:str|datetime) -> MetaData:
         """Get metadeta response.
@@ -76,8 +113,9 @@ class MetaDataClient(BaseDocumentListClient):
 class DocumentListClient(BaseDocumentListClient):
     """Client to get document list."""
 
-    def __init__(self):
-        super().__init__(response_type="2")  # 2 = metadata and document list.
+    def __init__(self, apikey: str = "", base_url: str = BaseClient.BASE_URL, cache: ResponseCache|None = None,
+                 session: requests.Session|None = None):
+        super().__init__(response_type="2", apikey=apikey, base_url=base_url, cache=cache, session=session)  # 2 = metadata and document list.
 
     def get(self, date:str|datetime) -> Documents:
         """Get metadeta response.
@@ -91,3 +129,44 @@ class DocumentListClient(BaseDocumentListClient):
         body = self._get(date)
         instance = Documents.create(body)
         return instance
+
+    def iter_range(self, start:str|datetime, end:str|datetime, max_workers:int=4,
+                   rate:float=2, cache_dir:str="") -> Iterator[tuple[datetime, Documents]]:
+        """Get document lists from start to end, yielding them as the days complete.
+
+        Arguments:
+            start {(str, datetime)} -- First date.
+            end {(str, datetime)} -- Last date (inclusive).
+
+        Keyword Arguments:
+            max_workers {int} -- Number of days requested at the same time (default: {4}).
+            rate {float} -- Maximum requests per second, no limit if 0 (default: {2}).
+            cache_dir {str} -- Directory of a ResponseCache used instead of the cache of the client (default: {""}).
+
+        Returns:
+            Iterator[tuple[datetime, Documents]] -- Date and its documents in completion order.
+        """
+        rate_limiter = RateLimiter(rate)
+        cache = ResponseCache(cache_dir) if cache_dir else None
+        for date, body in fetch_days(lambda date: self._get(date, rate_limiter, cache),
+                                     date_range(start, end), max_workers):
+            yield date, Documents.create(body)
+
+    def get_range(self, start:str|datetime, end:str|datetime, max_workers:int=4,
+                  rate:float=2, cache_dir:str="") -> Documents:
+        """Get document lists from start to end merged in date order.
+
+        Arguments:
+            start {(str, datetime)} -- First date.
+            end {(str, datetime)} -- Last date (inclusive).
+
+        Keyword Arguments:
+            max_workers {int} -- Number of days requested at the same time (default: {4}).
+            rate {float} -- Maximum requests per second, no limit if 0 (default: {2}).
+            cache_dir {str} -- Directory of a ResponseCache used instead of the cache of the client (default: {""}).
+
+        Returns:
+            Documents -- Documents of all days and their metadata.
+        """
+        days = sorted(self.iter_range(start, end, max_workers, rate, cache_dir), key=lambda x: x[0])
+        return Documents.merge([documents for _, documents in days])
@@ -11,9 +11,10 @@ import pandas as pd
 if importlib.util.find_spec("pandas") is not None:
     import pandas as pd
 
-from xbrr.base.reader.base_parser import BaseParser
+from xbrr.base.reader.base_parser import BaseParser, memoized_property
 from xbrr.base.reader.base_reader import BaseReader
 from xbrr.xbrl.reader.element_value import ElementValue
+from xbrr.xbrl.reader.textblock import TextBlock
 
 
 class Finance(BaseParser):
@@ -29,7 +30,7 @@ class Finance(BaseParser):
 
         super().__init__(reader, ElementValue, tags)
 
-    @property
+    @memoized_property
     def consolidated(self):
         cons_noncons = set([x['cons_nocons'] for x in self.reader.role_decision_info if 'table' in x])
         if 'NonConsolidatedMember' in cons_noncons and all([x not in cons_noncons for x in ['ConsolidatedMember','ConsNonconsMember']]):
@@ -44,7 +45,7 @@ class Finance(BaseParser):
         role_uri = self.find_role_name('bs')
         if not role_uri:
             textblock = self.read_value_by_textblock('bs')
-            return self.__read_finance_statement(textblock.html) if textblock is not None\
+            return self.__read_finance_statement(textblock.textblock) if textblock is not None\
                 else pd.DataFrame(columns=['label', 'value', 'unit', 'context', 'data_type', 'name', 'depth', 'consolidated'])
 
         bs = self.reader.read_value_by_role(role_uri)
@@ -54,7 +55,7 @@ class Finance(BaseParser):
         role_uri = self.find_role_name('pl')
         if not role_uri:
             textblock = self.read_value_by_textblock('pl')
-            return self.__read_finance_statement(textblock.html) if textblock is not None\
+            return self.__read_finance_statement(textblock.textblock) if textblock is not None\
                 else pd.DataFrame(columns=['label', 'value', 'unit', 'context', 'data_type', 'name', 'depth', 'consolidated'])
 
         pl = self.reader.read_value_by_role(role_uri)
@@ -64,7 +65,7 @@ class Finance(BaseParser):
         role_uri = self.find_role_name('cf')
         if not role_uri:
             textblock = self.read_value_by_textblock('cf')
-            return self.__read_finance_statement(textblock.html) if textblock is not None\
+            return self.__read_finance_statement(textblock.textblock) if textblock is not None\
                 else pd.DataFrame(columns=['label', 'value', 'unit', 'context', 'data_type', 'name', 'depth', 'consolidated'])
 
         cf = self.reader.read_value_by_role(role_uri)
@@ -131,7 +132,7 @@ class Finance(BaseParser):
                     return textblock
         return None
 
-    def __read_finance_statement(self, statement_xml):
+    def __read_finance_statement(self, statement:TextBlock):
         def myen(vtext, unit):
             if vtext in ['－', '-', '―'] or len(vtext)==0:
                 return ''
@@ -145,15 +146,15 @@ class Finance(BaseParser):
             else:
                 return True
         def label_margin(columns):
-            label = ''.join([x.text.strip() for x in columns[0].select('p')])
+            label = ''.join([x.strip() for x in columns[0].paragraphs])
             if label != '' and columns[0].get('colspan',"") == '': # column0 has label
-                style_str = columns[0].find('p').get('style',"") if label != "" else ""
+                style_str = columns[0].paragraph_style if label != "" else ""
                 m = re.match(r'.*-left: *([0-9]*).?[0-9]*p[tx].*', style_str)
                 margin = m.groups()[0] if m is not None else "0"
             else: # columns construct the label structure
                 margin = 0
                 for margin in range(0,len(columns)+prevcol):
-                    label = ''.join([x.text.strip() for x in columns[margin].select('p')])
+                    label = ''.join([x.strip() for x in columns[margin].paragraphs])
                     if label!='': break
             return (label, margin)
         def get_value(column):
@@ -173,11 +174,9 @@ class Finance(BaseParser):
         thiscol, prevcol = -1, -2
         unit = '000000'
         values = []
-        for table in statement_xml.select('table'):
-            if table.find_parents('table'): continue
-            tbody = _tbody if (_tbody:=table.find('tbody', recursive=False)) else table
-            for record in tbody.find_all('tr', recursive=False):
-                columns = list(record.find_all('td', recursive=False))
+        for table in statement.tables:
+            if table.nested: continue
+            for columns in table.body:
                 label, margin = label_margin(columns)
                 value = get_value(columns[thiscol])
 
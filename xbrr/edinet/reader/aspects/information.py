@@ -1,6 +1,10 @@
 from xbrr.base.reader.base_parser import BaseParser
+from xbrr.base.reader.text_patterns import TextPatterns
 from xbrr.xbrl.reader.element_value import ElementValue
 
+DIRECTORS = TextPatterns({"directors": "^(男性).+(名).+(女性).+(名)"})
+NUMBER_OF_DIRECTORS = TextPatterns.value_patterns(male=("男性", "名"), female=("女性", "名"))
+
 
 class Information(BaseParser):
 
@@ -26,22 +30,16 @@ class Information(BaseParser):
         return numbers["female"]
 
     def _extract_number_of_directors(self):
-        text = self.search("directors", "^(男性).+(名).+(女性).+(名)")
+        text = self.search_texts("directors", DIRECTORS)["directors"]
         numbers = {
             "male": 0,
             "female": 0,
             "total": 0,
         }
 
-        total = 0
-        for p, s in [("男性", "名"), ("女性", "名")]:
-            value = self.extract_value("directors", p, s)
+        values = self.extract_values("directors", NUMBER_OF_DIRECTORS)
+        for key, value in values.items():
             if isinstance(value, int):
-                if p == "男性":
-                    numbers["male"] = value
-                elif p == "女性":
-                    numbers["female"] = value
-                total += value
-
-        numbers["total"] = total
+                numbers[key] = value
+                numbers["total"] += value
         return numbers, text
@@ -1,6 +1,6 @@
 from datetime import date, datetime
 
-from xbrr.base.reader.base_parser import BaseParser
+from xbrr.base.reader.base_parser import BaseParser, memoized_property
 from xbrr.base.reader.base_reader import BaseReader
 from xbrr.xbrl.reader.element_value import ElementValue
 
@@ -30,7 +30,7 @@ class Metadata(BaseParser):
         year = datetime.strptime(value.value, "%Y-%m-%d").year if value else None
         return year
 
-    @property
+    @memoized_property
     def fiscal_year_end_date(self) -> date:
         value = self.get_value("fiscal_date_end")
         assert value is not None
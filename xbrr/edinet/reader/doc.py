@@ -1,27 +1,34 @@
 import os
-import glob
 from datetime import datetime
 from pathlib import Path
 
 from xbrr.base.reader.xbrl_doc import XbrlDoc
+from xbrr.base.reader.zip_archive import ZipArchive
 from xbrr.edinet.reader.taxonomy import Taxonomy as EdinetTaxonomy
 from xbrr.base.reader.base_taxonomy import BaseTaxonomy
 
 class Doc(XbrlDoc):
 
-    def __init__(self, root_dir:str|Path="", xbrl_kind=""):
+    def __init__(self, root_dir:str|Path="", xbrl_kind="", archive:ZipArchive|None=None):
+        """
+        Keyword Arguments:
+            root_dir {str} -- directory of the expanded ZIP file (default: {""}).
+            xbrl_kind {str} -- 'public' or 'audit' (default: {""}).
+            archive {ZipArchive} -- ZIP file read in place instead of root_dir (default: {None}).
+        """
 
         def _xbrl_file(root_dir, kind):
             folder_dict = {'public': 'XBRL/PublicDoc', 'audit': 'XBRL/AuditDoc'}
-            xbrl_files = glob.glob(os.path.join(root_dir, folder_dict[kind]+"/*.xbrl"))
-            if not os.path.isfile(xbrl_files[0]):
+            xbrl_files = self.glob(os.path.join(root_dir, folder_dict[kind]+"/*.xbrl"))
+            if not xbrl_files or not self.isfile(xbrl_files[0]):
                 raise Exception(
                     f"XBRL file does not exist.")
             return xbrl_files[0]
 
+        self.archive = archive
         xbrl_file=_xbrl_file(root_dir, xbrl_kind)
         self.file_spec = os.path.splitext(xbrl_file)[0]
-        super().__init__("edinet", root_dir=root_dir, xbrl_file=xbrl_file)
+        super().__init__("edinet", root_dir=root_dir, xbrl_file=xbrl_file, archive=archive)
 
     def find_path(self, kind) -> str:
         # EDINET report file name spec.: https://www.fsa.go.jp/search/20170228/2a_1.pdf (4-3)
@@ -32,7 +39,7 @@ class Doc(XbrlDoc):
             }
 
         if kind == "man":
-            manifest = glob.glob(os.path.join(os.path.dirname(self.file_spec), "manifest_*.xml"))
+            manifest = self.glob(os.path.join(os.path.dirname(self.file_spec), "manifest_*.xml"))
             if len(manifest)==0:
                 raise Exception(f"manifest file does not exist.")
             path = manifest[0]
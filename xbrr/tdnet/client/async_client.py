@@ -0,0 +1,119 @@
+import asyncio
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from lxml import html
+
+from xbrr.base.client.async_session import AsyncSession
+from xbrr.tdnet.client import listing_parser
+from xbrr.tdnet.client.document_client import DocumentClient
+from xbrr.tdnet.client.document_list_client import BaseDocumentListClient
+from xbrr.tdnet.models import Documents
+from xbrr.xbrl.models.error_response import ErrorResponse
+
+
+class AsyncDocumentListClient(BaseDocumentListClient):
+    """Async client to get document list, the pages of a date are fetched concurrently."""
+
+    def __init__(self, session: AsyncSession|None = None):
+        """
+        Keyword Arguments:
+            session {AsyncSession} -- Session shared with other clients (default: {None}).
+        """
+        super().__init__(session=session if session is not None else AsyncSession())
+
+    async def _get(self, date:str|datetime) -> dict:
+        """Get scraped document list.
+
+        Arguments:
+            date {(str, datetime)} -- Request date.
+
+        Returns:
+            dict -- TDNET Response (JSON), whose metadata status is not "200" if a page failed.
+        """
+        _date = self._to_datetime(date)
+        status, page = await self._get_page(self.TDNET_INFO_PAGE.format(_date.strftime("%Y%m%d")))
+        if page is None:
+            return self._body([], status)
+
+        items_l = list(listing_parser.iter_entries(_date, page))
+        others = await asyncio.gather(*[self._get_page(self.TDNET_INFO_EACH_PAGE.format(other_page))
+                                        for other_page in listing_parser.page_urls(page)])
+        for status, other in others:
+            if other is None:
+                # the items read so far are returned, but the day is not complete
+                return self._body(items_l, status)
+            items_l.extend(listing_parser.iter_entries(_date, other))
+        return self._body(items_l)
+
+    async def _get_page(self, url: str) -> tuple[int, Optional[html.HtmlElement]]:
+        """status and the parsed page, None if the status is not 200"""
+        async with self.session.get(url) as r:
+            if r.status != 200:
+                return r.status, None
+            content = await r.read()
+        return r.status, listing_parser.parse_page(content)
+
+    async def get(self, date:str|datetime) -> Documents:
+        body = await self._get(date)
+        return Documents.create(body)
+
+    async def close(self):
+        await self.session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+class AsyncDocumentClient(DocumentClient):
+    """Async client to get file."""
+
+    def __init__(self, base_url=DocumentClient.BASE_URL, session: AsyncSession|None = None):
+        super().__init__(base_url)
+        self.session = session if session is not None else AsyncSession()
+
+    async def get(self, document_id: str, save_dir: str = "") -> Path:
+        """Get file of document_id and write it to save_dir while receiving.
+
+        Arguments:
+            document_id {str} -- Document id of TDNET.
+
+        Keyword Arguments:
+            save_dir {str} -- Directory to save file (default: {""}).
+
+        Returns:
+            Path -- Path to saved file.
+        """
+        url = self.endpoint.format(document_id)
+        async with self.session.get(url) as r:
+            if not r.ok:
+                ErrorResponse(str(r.status), str(r.reason)).raise_for_status(r)
+            save_path = self._save_path(document_id, save_dir)
+            return await self.session.download(r, save_path)
+
+    async def get_pdf(self, document_id: str,
+                      save_dir: str = "", file_name: str = "") -> Path:
+        return await self.get(document_id+".pdf", save_dir)
+
+    async def get_xbrl(self, document_id: str,
+                       save_dir: str = "",
+                       expand_level:Optional[str] = "dir") -> Path:
+        xbrl_dir = Path(save_dir).joinpath(document_id)
+        if xbrl_dir.is_dir():
+            return xbrl_dir
+
+        path = await self.get(document_id+".zip", save_dir)
+        return await asyncio.to_thread(self._expand_xbrl, path, xbrl_dir, expand_level)
+
+    async def close(self):
+        await self.session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
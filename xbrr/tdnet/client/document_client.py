@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import IO, Callable, Iterable, Iterator, Optional, TypeVar, cast
 
 import re
 import tempfile
@@ -6,16 +6,30 @@ from pathlib import Path
 from zipfile import ZipFile
 import requests
 
+from xbrr.base.client.document_pipeline import run_pipeline
+from xbrr.base.client.session import shared_session
+from xbrr.base.reader.zip_archive import ZipArchive
 from xbrr.xbrl.models.error_response import ErrorResponse
 
+T = TypeVar("T")
+
 
 class DocumentClient():
     """Client to get file."""
 
     BASE_URL = "https://www.release.tdnet.info/inbs/{}"
+    SPOOL_SIZE = 16 * 1024 * 1024
+    CHUNK_SIZE = 64 * 1024
 
-    def __init__(self, base_url=BASE_URL):
+    def __init__(self, base_url=BASE_URL, session: requests.Session|None = None):
+        """
+        Keyword Arguments:
+            base_url {str} -- URL format of the documents (default: {BASE_URL}).
+            session {requests.Session} -- Session to send requests, the pooled session
+                                          shared by the TDNET clients if not given (default: {None}).
+        """
         self.base_url = base_url
+        self.session = session if session is not None else shared_session("tdnet")
 
     @property
     def endpoint(self):
@@ -35,21 +49,12 @@ class DocumentClient():
         """
         url = self.endpoint.format(document_id)
 
-        with requests.get(url, stream=True) as r:
+        with self.session.get(url, stream=True) as r:
             if not r.ok:
                 r.raise_for_status()
 
-            _file_name = document_id
             chunk_size = 1024
-            if save_dir:
-                save_path = Path(save_dir).joinpath(_file_name)
-            else:
-                _file_name = Path(_file_name)
-                tmpf = tempfile.NamedTemporaryFile(
-                        prefix=_file_name.stem + "__",
-                        suffix=_file_name.suffix,
-                        delete=False)
-                save_path = Path(tmpf.name)
+            save_path = self._save_path(document_id, save_dir)
 
             with save_path.open(mode="wb") as f:
                 for chunk in r.iter_content(chunk_size):
@@ -57,6 +62,49 @@ class DocumentClient():
 
             return save_path
 
+    def get_buffer(self, document_id: str, max_size: int = 0) -> IO[bytes]:
+        """Get file of document_id into a buffer instead of a file.
+
+        Arguments:
+            document_id {str} -- Document id of TDNET.
+
+        Keyword Arguments:
+            max_size {int} -- The buffer is kept in memory up to max_size bytes,
+                              and rolled over to an anonymous temporary file beyond it
+                              (default: {0}, which means SPOOL_SIZE).
+
+        Returns:
+            IO[bytes] -- Buffer rewound to the beginning.
+        """
+        url = self.endpoint.format(document_id)
+
+        with self.session.get(url, stream=True) as r:
+            if not r.ok:
+                r.raise_for_status()
+
+            buffer = tempfile.SpooledTemporaryFile(max_size=max_size or self.SPOOL_SIZE)
+            try:
+                for chunk in r.iter_content(self.CHUNK_SIZE):
+                    buffer.write(chunk)
+            except BaseException:
+                buffer.close()
+                raise
+        buffer.seek(0)
+        return cast(IO[bytes], buffer)
+
+    @staticmethod
+    def _save_path(file_name: str, save_dir: str = "") -> Path:
+        if save_dir:
+            save_path = Path(save_dir).joinpath(file_name)
+        else:
+            _file_name = Path(file_name)
+            tmpf = tempfile.NamedTemporaryFile(
+                    prefix=_file_name.stem + "__",
+                    suffix=_file_name.suffix,
+                    delete=False)
+            save_path = Path(tmpf.name)
+        return save_path
+
     def get_pdf(self, document_id: str,
                 save_dir: str = "", file_name: str = "") -> Path:
         """Get PDF file.
@@ -95,7 +143,10 @@ class DocumentClient():
             return xbrl_dir
 
         path = self.get(document_id+".zip", save_dir)
+        return self._expand_xbrl(path, xbrl_dir, expand_level)
 
+    @staticmethod
+    def _expand_xbrl(path: Path, xbrl_dir: Path, expand_level:Optional[str] = "dir") -> Path:
         if expand_level is None or not expand_level or\
            expand_level not in ("dir", "file"):
             return path
@@ -105,3 +156,54 @@ class DocumentClient():
             zip.extractall(path=xbrl_dir)
         path.unlink()
         return xbrl_dir
+
+    def get_xbrl_archive(self, document_id: str) -> ZipArchive:
+        """Get XBRL ZIP file without saving it.
+
+        Arguments:
+            document_id {str} -- Document id of TDNET.
+
+        Returns:
+            ZipArchive -- ZIP file in memory, which is given to Doc as archive.
+        """
+        return ZipArchive(self.get_buffer(document_id+".zip"))
+
+    def iter_xbrl(self, document_ids: Iterable[str], parse: Callable[[ZipArchive], T],
+                  members: str = "XBRLData/*", buffer_size: int = 2) -> Iterator[tuple[str, T]]:
+        """Download, decompress and parse XBRL files of the documents in a pipeline.
+
+        While a document is parsed, the members of the next one are decompressed
+        and the one after is downloaded.
+
+        Arguments:
+            document_ids {Iterable[str]} -- Document ids of TDNET.
+            parse {Callable[[ZipArchive], T]} -- Function to parse a document,
+                                                 ex. lambda archive: Reader(Doc.find_report("", archive=archive)).
+
+        Keyword Arguments:
+            members {str} -- Pattern of the members decompressed before parse (default: {"XBRLData/*"}).
+            buffer_size {int} -- Number of documents waiting between the stages (default: {2}).
+
+        Returns:
+            Iterator[tuple[str, T]] -- (document id, parse result) in the order of document_ids.
+                                       The archive is closed when parse returns, so parse has to
+                                       read what the result needs from it.
+        """
+        def download(document_id: str) -> IO[bytes]:
+            return self.get_buffer(document_id+".zip")
+
+        def decompress(buffer: IO[bytes]) -> ZipArchive:
+            archive = ZipArchive(buffer)
+            try:
+                archive.load(members)
+            except Exception:
+                archive.close()
+                raise
+            return archive
+
+        def parse_archive(archive: ZipArchive) -> T:
+            with archive:
+                return parse(archive)
+
+        return run_pipeline(document_ids, [download, decompress, parse_archive], buffer_size,
+                            release=lambda value: value.close())
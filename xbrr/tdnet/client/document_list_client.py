@@ -1,11 +1,14 @@
-import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Iterator
 import requests
-import urllib3
-import urllib3.util
 from bs4 import BeautifulSoup
 
-from xbrr.tdnet.models import Documents
+from xbrr.base.client.document_range import RateLimiter, date_range, fetch_days
+from xbrr.base.client.response_cache import CachedResponse, ResponseCache
+from xbrr.base.client.session import open_session
+from xbrr.tdnet.client import listing_parser
+from xbrr.tdnet.models import Document, Documents
 
 
 class BaseDocumentListClient():
@@ -14,81 +17,118 @@ class BaseDocumentListClient():
     TDNET_INFO_PAGE = "https://www.release.tdnet.info/inbs/I_list_001_{}.html"
     TDNET_INFO_EACH_PAGE = "https://www.release.tdnet.info/inbs/{}"
 
-    def __init__(self):
-        self.session = self.open_session()
+    def __init__(self, cache: ResponseCache|None = None, session=None):
+        """
+        Keyword Arguments:
+            cache {ResponseCache} -- Cache of the listing pages per date (default: {None}).
+            session -- Session to send requests, a new session with retries if not given (default: {None}).
+        """
+        self.session = session if session is not None else self.open_session()
+        self.cache = cache
 
-    def _get(self, date:str|datetime) -> dict:
+    def _get(self, date:str|datetime, rate_limiter:RateLimiter|None=None, page_workers:int=1,
+             cache:ResponseCache|None=None) -> dict:
         """Get scraped document list.
 
         Arguments:
             date {(str, datetime)} -- Request date.
 
+        Keyword Arguments:
+            rate_limiter {RateLimiter} -- Limiter shared by parallel requests (default: {None}).
+            page_workers {int} -- Number of pager pages requested at the same time (default: {1}).
+            cache {ResponseCache} -- Cache of the pages instead of the cache of the client (default: {None}).
+
         Raises:
             Exception: Date format exception.
 
         Returns:
-            dict -- TDNET Response (JSON).
+            dict -- TDNET Response (JSON), whose metadata status is not "200" if a page failed.
         """
-        _date:datetime
+        _date = self._to_datetime(date)
+        url = self.TDNET_INFO_PAGE.format(_date.strftime("%Y%m%d"))
+        tdnet_date_page = self._get_page(url, _date, rate_limiter, cache)
+        if tdnet_date_page.status_code != requests.codes.ok:
+            return self._body([], tdnet_date_page.status_code)
+
+        page = listing_parser.parse_page(tdnet_date_page.content)
+        items_l = list(listing_parser.iter_entries(_date, page))
+
+        urls = [self.TDNET_INFO_EACH_PAGE.format(other_page) for other_page in listing_parser.page_urls(page)]
+        if page_workers > 1 and len(urls) > 1:
+            with ThreadPoolExecutor(max_workers=page_workers) as executor:
+                other_pages = executor.map(lambda url: self._get_page(url, _date, rate_limiter, cache), urls)
+        else:
+            other_pages = (self._get_page(url, _date, rate_limiter, cache) for url in urls)
+        for tdnet_other_page in other_pages:
+            if tdnet_other_page.status_code != requests.codes.ok:
+                # the items read so far are returned, but the day is not complete (the failed page is not cached)
+                return self._body(items_l, tdnet_other_page.status_code)
+            page = listing_parser.parse_page(tdnet_other_page.content)
+            items_l.extend(listing_parser.iter_entries(_date, page))
+        return self._body(items_l)
+
+    @staticmethod
+    def _body(items:list[dict], status:int=requests.codes.ok) -> dict:
+        """response of a day, status is the failed status of a page if the list is not complete"""
+        return {"metadata": {"resultset":{"count":len(items)}, "status": str(status)},
+                "results": items}
+
+    def _get_page(self, url:str, date:datetime, rate_limiter:RateLimiter|None=None,
+                  cache:ResponseCache|None=None) -> requests.Response|CachedResponse:
+        def request(url, **kwargs):
+            if rate_limiter is not None:
+                rate_limiter.wait()
+            return self.session.get(url, **kwargs)
+
+        cache = cache if cache is not None else self.cache
+        if cache is not None:
+            return cache.fetch(request, url, date=date)
+        return request(url)
+
+    @staticmethod
+    def _to_datetime(date:str|datetime) -> datetime:
         try:
-            _date = date if isinstance(date, datetime) else datetime.strptime(date, "%Y-%m-%d")
+            return date if isinstance(date, datetime) else datetime.strptime(date, "%Y-%m-%d")
         except ValueError:
             raise Exception("Date format should be yyyy-mm-dd.")
 
-        url = self.TDNET_INFO_PAGE.format(_date.strftime("%Y%m%d"))
-        tdnet_date_page = self.session.get(url)
-        if tdnet_date_page.status_code != requests.codes.ok:
-            return {"metadata": {"resultset":{"count":0}}}
-
-        soup = BeautifulSoup(tdnet_date_page.content, "html.parser")
-        items_l = self.fetch_tdnet_info_per_page(_date, soup)
-
-        others_el = soup.select("#pager-box-top > div.pager-M")
-        other_page_urls = [re.findall(r'\'(.*)\'',x["onclick"])[0] for x in others_el]  # type: ignore
-        for other_page in other_page_urls:
-            url = self.TDNET_INFO_EACH_PAGE.format(other_page)
-            tdnet_other_page = self.session.get(url)
-            if tdnet_date_page.status_code != requests.codes.ok:
-                return {"metadata": {"resultset":{"count":0}}}
-            soup = BeautifulSoup(tdnet_other_page.content, "html.parser")
-            items_l.extend(self.fetch_tdnet_info_per_page(_date, soup))
-        return {"metadata": {"resultset":{"count":len(items_l)}},
-                "results": items_l}
-
-    def fetch_tdnet_info_per_page(self, date: datetime, soup: BeautifulSoup):
-        items_l = []
-        list_el = soup.select('#main-list-table > tr')
-        for item_el in list_el:
-            entry = {}
-            entry['pubdate'] = '{} {}:00'.format(date.strftime("%Y-%m-%d"), e.text if (e:=item_el.select_one("td.kjTime")) else '')
-            entry['company_code'] = e.text if (e:=item_el.select_one("td.kjCode")) else ''
-            entry['company_name'] = e.text if (e:=item_el.select_one("td.kjName")) else ''
-            entry['title'] = e.text.strip() if (e:=item_el.select_one("td.kjTitle")) else ''
-            doc_el = item_el.select_one("td.kjTitle a")
-            doc_el = item_el.select_one("td.kjTitle a")
-            entry['document_url'] = None if doc_el is None \
-                else 'https://www.release.tdnet.info/inbs/{}'.format(doc_el['href'])
-            xbrl_el = item_el.select_one("td.kjXbrl a")
-            entry['url_xbrl'] =  None if xbrl_el is None \
-                else 'https://www.release.tdnet.info/inbs/{}'.format(xbrl_el['href'])
-            entry['markets_string'] = e.text if (e:=item_el.select_one("td.kjPlace")) else ''
-            entry['update_history'] = e.text if (e:=item_el.select_one("td.kjHistroy")) else ''
-            tdnet = {'Tdnet': entry}
-            items_l.append(tdnet)
-        return items_l
+    def fetch_tdnet_info_per_page(self, date: datetime, content: bytes|BeautifulSoup):
+        """entries of a listing page, content is the raw bytes of the page (a parsed soup is serialized)"""
+        if isinstance(content, BeautifulSoup):
+            content = content.encode("utf-8")
+        return list(listing_parser.iter_entries(date, listing_parser.parse_page(content)))
 
     def open_session(self):
-        session = requests.session()
-        retries = urllib3.util.Retry(total=3,  # リトライ回数
-                        backoff_factor=1,  # sleep時間
-                        status_forcelist=[500, 502, 503, 504])  # timeout以外でリトライするステータスコード
-        session.mount("https://", requests.adapters.HTTPAdapter(max_retries=retries))  # type: ignore
-        session.mount("http://", requests.adapters.HTTPAdapter(max_retries=retries))  # type: ignore
-        return session
+        # timeout以外でリトライするステータスコード: 500, 502, 503, 504
+        return open_session(retries=3, backoff_factor=1, status_forcelist=(500, 502, 503, 504))
 
 class DocumentListClient(BaseDocumentListClient):
     """Client to get document list."""
 
+    def iter_documents(self, date:str|datetime) -> Iterator[Document]:
+        """Yield documents of the date page by page, without waiting for the whole list.
+
+        Arguments:
+            date {(str, datetime)} -- Request date.
+
+        Returns:
+            Iterator[Document] -- Documents in listing order.
+        """
+        _date = self._to_datetime(date)
+        r = self._get_page(self.TDNET_INFO_PAGE.format(_date.strftime("%Y%m%d")), _date)
+        if r.status_code != requests.codes.ok:
+            return
+        first_page = listing_parser.parse_page(r.content)
+        for entry in listing_parser.iter_entries(_date, first_page):
+            yield Document.create(entry)
+
+        for other_page in listing_parser.page_urls(first_page):
+            r = self._get_page(self.TDNET_INFO_EACH_PAGE.format(other_page), _date)
+            if r.status_code != requests.codes.ok:
+                return
+            for entry in listing_parser.iter_entries(_date, listing_parser.parse_page(r.content)):
+                yield Document.create(entry)
+
     def get(self, date:str|datetime) -> Documents:
         """Get metadeta response.
 
@@ -101,3 +141,44 @@ class DocumentListClient(BaseDocumentListClient):
         body = self._get(date)
         instance = Documents.create(body)
         return instance
+
+    def iter_range(self, start:str|datetime, end:str|datetime, max_workers:int=4,
+                   rate:float=2, cache_dir:str="") -> Iterator[tuple[datetime, Documents]]:
+        """Get document lists from start to end, yielding them as the days complete.
+
+        Arguments:
+            start {(str, datetime)} -- First date.
+            end {(str, datetime)} -- Last date (inclusive).
+
+        Keyword Arguments:
+            max_workers {int} -- Number of days (and pager pages of a day) requested at the same time (default: {4}).
+            rate {float} -- Maximum requests per second, no limit if 0 (default: {2}).
+            cache_dir {str} -- Directory of a ResponseCache used instead of the cache of the client (default: {""}).
+
+        Returns:
+            Iterator[tuple[datetime, Documents]] -- Date and its documents in completion order.
+        """
+        rate_limiter = RateLimiter(rate)
+        cache = ResponseCache(cache_dir) if cache_dir else None
+        for date, body in fetch_days(lambda date: self._get(date, rate_limiter, max_workers, cache),
+                                     date_range(start, end), max_workers):
+            yield date, Documents.create(body)
+
+    def get_range(self, start:str|datetime, end:str|datetime, max_workers:int=4,
+                  rate:float=2, cache_dir:str="") -> Documents:
+        """Get document lists from start to end merged in date order.
+
+        Arguments:
+            start {(str, datetime)} -- First date.
+            end {(str, datetime)} -- Last date (inclusive).
+
+        Keyword Arguments:
+            max_workers {int} -- Number of days requested at the same time (default: {4}).
+            rate {float} -- Maximum requests per second, no limit if 0 (default: {2}).
+            cache_dir {str} -- Directory of a ResponseCache used instead of the cache of the client (default: {""}).
+
+        Returns:
+            Documents -- Documents of all days and their metadata.
+        """
+        days = sorted(self.iter_range(start, end, max_workers, rate, cache_dir), key=lambda x: x[0])
+        return Documents.merge([documents for _, documents in days])
@@ -0,0 +1,98 @@
+import asyncio
+import time
+from datetime import datetime
+from typing import AsyncIterator, Iterator
+
+import requests
+
+from xbrr.tdnet.client import listing_parser
+from xbrr.tdnet.client.document_list_client import BaseDocumentListClient, DocumentListClient
+from xbrr.tdnet.models import Document
+
+
+class DocumentListPoller():
+    """
+    Incremental poller of TDnet listing pages.
+
+    Rows already seen are remembered per date by (document url, update history).
+    Listing pages are ordered from the newest, so a poll reads pages only
+    until it meets a known row and emits the new or updated rows.
+    """
+
+    def __init__(self, client: BaseDocumentListClient|None = None):
+        """
+        Keyword Arguments:
+            client {BaseDocumentListClient} -- Client to request listing pages (default: {None}).
+        """
+        self.client = client if client is not None else DocumentListClient()
+        self.seen: dict[str, set[tuple[str|None, str]]] = {}
+
+    @staticmethod
+    def row_key(entry: dict) -> tuple[str|None, str]:
+        tdnet = entry['Tdnet']
+        return (tdnet['document_url'], tdnet['update_history'])
+
+    def poll(self, date: str|datetime|None = None) -> Iterator[Document]:
+        """Yield documents listed since the last poll of the date.
+
+        Keyword Arguments:
+            date {(str, datetime)} -- Listing date (default: {today}).
+
+        Returns:
+            Iterator[Document] -- New or updated documents, newest first.
+        """
+        _date = self.client._to_datetime(date if date is not None else datetime.now().strftime("%Y-%m-%d"))
+        seen = self.seen.setdefault(_date.strftime("%Y-%m-%d"), set())
+        new_keys = []
+        try:
+            url = self.client.TDNET_INFO_PAGE.format(_date.strftime("%Y%m%d"))
+            other_pages = None
+            while url:
+                r = self.client._get_page(url, _date)
+                if r.status_code != requests.codes.ok:
+                    return
+                page = listing_parser.parse_page(r.content)
+                for entry in listing_parser.iter_entries(_date, page):
+                    key = self.row_key(entry)
+                    if key in seen:
+                        return
+                    new_keys.append(key)
+                    yield Document.create(entry)
+                if other_pages is None:
+                    other_pages = listing_parser.page_urls(page)
+                url = self.client.TDNET_INFO_EACH_PAGE.format(other_pages.pop(0)) if other_pages else ""
+        finally:
+            # rows are remembered after the poll, so that a row moved to the next page
+            # by new rows in the middle of a poll is not mistaken for the boundary
+            seen.update(new_keys)
+
+    def watch(self, date: str|datetime|None = None, interval: float = 60,
+              max_polls: int|None = None) -> Iterator[Document]:
+        """Poll repeatedly and yield the new documents of each poll.
+
+        Keyword Arguments:
+            date {(str, datetime)} -- Listing date (default: {today}).
+            interval {float} -- Seconds between polls (default: {60}).
+            max_polls {int} -- Number of polls, endless if None (default: {None}).
+        """
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            yield from self.poll(date)
+            polls += 1
+            if max_polls is None or polls < max_polls:
+                time.sleep(interval)
+
+    async def stream(self, date: str|datetime|None = None, interval: float = 60,
+                     max_polls: int|None = None) -> AsyncIterator[Document]:
+        """Async version of watch, each poll runs in a worker thread."""
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            for document in await asyncio.to_thread(lambda: list(self.poll(date))):
+                yield document
+            polls += 1
+            if max_polls is None or polls < max_polls:
+                await asyncio.sleep(interval)
+
+    def forget(self, date: str|datetime):
+        """drop the rows remembered for the date"""
+        self.seen.pop(self.client._to_datetime(date).strftime("%Y-%m-%d"), None)
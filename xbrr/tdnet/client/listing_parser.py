@@ -0,0 +1,69 @@
+import re
+from datetime import datetime
+from typing import Iterator
+
+from lxml import etree, html
+
+# TDnet listing page: https://www.release.tdnet.info/inbs/I_list_001_YYYYMMDD.html
+ROWS = etree.XPath('//*[@id="main-list-table"]/tr | //*[@id="main-list-table"]/tbody/tr')
+CELLS = etree.XPath('.//td[@class]')
+HREF = etree.XPath('(.//a/@href)[1]')
+PAGER = etree.XPath('//*[@id="pager-box-top"]/div[contains(concat(" ", normalize-space(@class), " "), " pager-M ")]/@onclick')
+COLUMNS = ('kjTime', 'kjCode', 'kjName', 'kjTitle', 'kjXbrl', 'kjPlace', 'kjHistroy')
+PAGER_LINK = re.compile(r'\'(.*)\'')
+DOCUMENT_URL = 'https://www.release.tdnet.info/inbs/{}'
+CHARSET = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.I)
+
+
+def parse_page(content:bytes|str) -> html.HtmlElement:
+    """
+    parse listing page with lxml html parser.
+    The bytes of the response are passed to lxml as is, decoded by the charset of the page (utf-8 if not declared).
+    """
+    if isinstance(content, str):
+        # lxml rejects a str with an encoding declaration
+        content, encoding = content.encode("utf-8"), "utf-8"
+    else:
+        m = CHARSET.search(content, 0, 2048)
+        encoding = m.group(1).decode("ascii") if m else "utf-8"
+    try:
+        parser = html.HTMLParser(encoding=encoding)
+    except LookupError:
+        parser = html.HTMLParser(encoding="utf-8")
+    return html.fromstring(content, parser=parser)
+
+
+def page_urls(page:html.HtmlElement) -> list[str]:
+    """relative urls of the other pages of the date"""
+    return [m.group(1) for onclick in PAGER(page) if (m:=PAGER_LINK.search(str(onclick)))]
+
+
+def iter_entries(date:datetime, page:html.HtmlElement) -> Iterator[dict]:
+    """yield document list entries of the page, each row is scanned once"""
+    ymd = date.strftime("%Y-%m-%d")
+    for row in ROWS(page):
+        cells:dict[str, html.HtmlElement] = {}
+        for td in CELLS(row):
+            for name in td.get('class').split():
+                if name in COLUMNS and name not in cells:
+                    cells[name] = td
+
+        def text(name:str) -> str:
+            return cells[name].text_content() if name in cells else ''
+
+        def url(name:str) -> str|None:
+            if name not in cells or not (href:=HREF(cells[name])):
+                return None
+            return DOCUMENT_URL.format(href[0])
+
+        entry = {
+            'pubdate': '{} {}:00'.format(ymd, text('kjTime')),
+            'company_code': text('kjCode'),
+            'company_name': text('kjName'),
+            'title': text('kjTitle').strip(),
+            'document_url': url('kjTitle'),
+            'url_xbrl': url('kjXbrl'),
+            'markets_string': text('kjPlace'),
+            'update_history': text('kjHistroy'),
+        }
+        yield {'Tdnet': entry}
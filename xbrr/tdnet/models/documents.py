@@ -1,3 +1,5 @@
+from typing import Iterable
+
 from xbrr.tdnet.models.document import Document
 from xbrr.xbrl.models.metadata import MetaData
 
@@ -34,3 +36,17 @@ class Documents():
 
         instance = cls(metadata, documents)
         return instance
+
+    @classmethod
+    def merge(cls, documents_list: Iterable["Documents"]) -> "Documents":
+        """Merge document lists (ex. of several days) into one.
+
+        Arguments:
+            documents_list {Iterable[Documents]} -- Document lists to merge.
+
+        Returns:
+            Documents -- Documents and the total count.
+        """
+        documents = [d for docs in documents_list for d in docs.list]
+        instance = cls(MetaData(count=len(documents)), documents)
+        return instance
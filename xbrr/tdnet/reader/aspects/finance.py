@@ -18,9 +18,10 @@ from pandas import DataFrame
 if importlib.util.find_spec("pandas") is not None:
     import pandas as pd
 
-from xbrr.base.reader.base_parser import BaseParser
+from xbrr.base.reader.base_parser import BaseParser, memoized_property
 from xbrr.base.reader.base_reader import BaseReader
 from xbrr.xbrl.reader.element_value import ElementValue
+from xbrr.xbrl.reader.textblock import TextBlock
 
 
 class Finance(BaseParser):
@@ -37,10 +38,7 @@ class Finance(BaseParser):
             "company_name": "jpdei_cor:FilerNameInJapaneseDEI",
 
             # "_fiscal_year_end_date0": "tse-o-di:FiscalYearEnd",
-            "report_FY": "tse-o-di:TypeOfReports-Annual",
-            "report_Q1": "tse-o-di:TypeOfReports-FirstQuarter",
-            "report_Q2": "tse-o-di:TypeOfReports-SecondQuarter",
-            "report_Q3": "tse-o-di:TypeOfReports-ThirdQuarter",
+            # TypeOfReports flags are read by the period model of the reader
 
             # old style xbrl
             # "consolidated_flag": "jpfr-di:ConsolidatedBSConsolidatedFinancialStatements",
@@ -60,14 +58,14 @@ class Finance(BaseParser):
         value = self.get_value("company_name")
         return value.value if value else 'not found'
 
-    @property
+    @memoized_property
     def fiscal_year_start_date(self) -> date:
         value = self.get_value("_fiscal_year_start_date")
         if value is not None:
             return datetime.strptime(value.value, "%Y-%m-%d").date()
         return self._get_fiscal_year_start_date_from_context()
 
-    @property
+    @memoized_property
     def fiscal_year_end_date(self) -> date:
         value = self.get_value("_fiscal_year_end_date")
         if value is not None:
@@ -89,17 +87,9 @@ class Finance(BaseParser):
     def report_period_kind(self) -> ElementValue:
         if self._report_period_kind is not None:
             return self._report_period_kind
-        if self.report_Q1 and self.report_Q1.value=='true':
-            return ElementValue("jpdei_cor:TypeOfCurrentPeriodDEI", value="Q1")
-        if self.report_Q2 and self.report_Q2.value=='true':
-            return ElementValue("jpdei_cor:TypeOfCurrentPeriodDEI", value="Q2")
-        if self.report_Q3 and self.report_Q3.value=='true':
-            return ElementValue("jpdei_cor:TypeOfCurrentPeriodDEI", value="Q3")
-        if self.report_FY and self.report_FY.value=='true':
-            return ElementValue("jpdei_cor:TypeOfCurrentPeriodDEI", value="FY")
-        return ElementValue("jpdei_cor:TypeOfCurrentPeriodDEI", value="Qx")
+        return ElementValue("jpdei_cor:TypeOfCurrentPeriodDEI", value=self.reader.period_model.quarter_kind or "Qx")
 
-    @property
+    @memoized_property
     def consolidated(self) -> bool:
         return self.reader.xbrl_doc.consolidated
 
@@ -107,7 +97,7 @@ class Finance(BaseParser):
         role_uri = self.find_role_name('bs', latest2year)
         if not role_uri:
             textblock = self.read_value_by_textblock('bs')
-            return self.__read_finance_statement(textblock.html) if textblock is not None\
+            return self.__read_finance_statement(textblock.textblock) if textblock is not None\
                 else pd.DataFrame(columns=['label', 'value', 'unit', 'context', 'data_type', 'name', 'depth', 'consolidated'])
 
         bs = self.reader.read_value_by_role(role_uri, report_end=self.report_period_end_date)
@@ -124,7 +114,7 @@ class Finance(BaseParser):
         role_uri = self.find_role_name('pl', latest2year, exclusion=self._Quarter_period_role_piece)
         if not role_uri:
             textblock = self.read_value_by_textblock('pl')
-            return self.__read_finance_statement(textblock.html) if textblock is not None\
+            return self.__read_finance_statement(textblock.textblock) if textblock is not None\
                 else pd.DataFrame(columns=['label', 'value', 'unit', 'context', 'data_type', 'name', 'depth', 'consolidated'])
 
         pl = self.reader.read_value_by_role(role_uri, fix_cal_node=fix_cal, report_start=self.fiscal_year_start_date, report_end=self.report_period_end_date)
@@ -134,7 +124,7 @@ class Finance(BaseParser):
         role_uri = self.find_role_name('cf', latest2year)
         if not role_uri:
             textblock = self.read_value_by_textblock('cf')
-            return self.__read_finance_statement(textblock.html) if textblock is not None\
+            return self.__read_finance_statement(textblock.textblock) if textblock is not None\
                 else pd.DataFrame(columns=['label', 'value', 'unit', 'context', 'data_type', 'name', 'depth', 'consolidated'])
 
         cf = self.reader.read_value_by_role(role_uri, report_start=self.fiscal_year_start_date, report_end=self.report_period_end_date)
@@ -142,18 +132,14 @@ class Finance(BaseParser):
 
     def __df_duration_from_fiscal_year_start_date(self, df:DataFrame, latest2year:bool) -> DataFrame:
         if 'context' in df.columns:
-            fy_start = self.fiscal_year_start_date
-            month_day = fy_start.strftime('%m-%d')
-            df = df[(df['context'].str.endswith('Duration'))&(df['period_start'].str.endswith(month_day))]
-            if latest2year:
-                df = df[(~df['context'].str.startswith('Prior2')) & (~df['context'].str.startswith('Prior3'))]
+            df = self.reader.context_table.filter(df, 'Duration', start=self.fiscal_year_start_date,
+                                                  excluded=['Prior2','Prior3'] if latest2year else [])
         return df if not df.empty else pd.DataFrame(columns=['label', 'value', 'unit', 'context', 'data_type', 'name', 'depth', 'consolidated'])
     
     def __df_instant(self, df:DataFrame, latest2year:bool) -> DataFrame:
         if 'context' in df.columns:
-            df = df[(df['context'].str.endswith('Instant'))&(~df['context'].str.startswith('Prior1Quarter'))]
-            if latest2year:
-                df = df[(~df['context'].str.startswith('Prior2')) & (~df['context'].str.startswith('Prior3'))]
+            df = self.reader.context_table.filter(df, 'Instant',
+                                                  excluded=['Prior1Quarter','Prior2','Prior3'] if latest2year else ['Prior1Quarter'])
         return df if not df.empty else pd.DataFrame(columns=['label', 'value', 'unit', 'context', 'data_type', 'name', 'depth', 'consolidated'])
 
     def scan_presentation(self) -> list[BaseReader.PreTable|BaseReader.PreHeading]:
@@ -249,7 +235,7 @@ class Finance(BaseParser):
                 self.logger.warning("Multiple text blocks found for heading: {}".format(heading))
         return None
 
-    def __read_finance_statement(self, statement_xml):
+    def __read_finance_statement(self, statement:TextBlock):
         def myen(vtext, unit):
             if vtext in ['－', '-', '―'] or len(vtext)==0:
                 return ''
@@ -263,15 +249,15 @@ class Finance(BaseParser):
             else:
                 return True
         def label_margin(columns):
-            label = ''.join([x.text.strip() for x in columns[0].select('p')])
+            label = ''.join([x.strip() for x in columns[0].paragraphs])
             if label != '' and columns[0].get('colspan',"") == '': # column0 has label
-                style_str = columns[0].find('p').get('style',"") if label != "" else ""
+                style_str = columns[0].paragraph_style if label != "" else ""
                 m = re.match(r'.*-left: *([0-9]*).?[0-9]*p[tx].*', style_str)
                 margin = m.groups()[0] if m is not None else "0"
             else: # columns construct the label structure
                 margin = 0
                 for margin in range(0,len(columns)+prevcol):
-                    label = ''.join([x.text.strip() for x in columns[margin].select('p')])
+                    label = ''.join([x.strip() for x in columns[margin].paragraphs])
                     if label!='': break
             return (label.replace(' ','').replace('\u3000',''), margin)
         def get_value(column):
@@ -323,28 +309,18 @@ class Finance(BaseParser):
                 elif '円' in text:
                     return ''
             return unit
-        def analyze_unit_till_table(soup):
-            list = []
-            for elem in soup.find_all(True):
-                if elem.name == 'table':
-                    break
-                if elem.name is not None: list.append(elem)
-            return analyze_unit(list, '000000')
 
         thiscol, prevcol = -1, -2
-        unit = analyze_unit_till_table(statement_xml)
+        unit = analyze_unit(statement.leading, '000000')
         values = []
-        for table in statement_xml.select('table'):
-            if (thead := table.find('thead', recursive=False)):
-                for record in thead.find_all('tr', recursive=False):
-                    columns = list(record.find_all('td', recursive=False))
+        for table in statement.tables:
+            if table.head is not None:
+                for columns in table.head:
                     if len(values)==0:
                         this_str = str(self.report_period_end_date.year)
                         prev_str = str(int(this_str)-1)
                         thiscol, prevcol = analyze_title(columns, thiscol, prevcol, this_str, prev_str)
-            tbody = _tbody if (_tbody:=table.find('tbody', recursive=False)) else table
-            for record in tbody.find_all('tr', recursive=False):
-                columns = list(record.find_all('td', recursive=False))
+            for columns in table.body:
                 if len(columns) < max(abs(thiscol), abs(prevcol))+1:
                     unit = analyze_unit(columns, unit)
                     continue
@@ -7,10 +7,25 @@ from datetime import date, datetime, timedelta
 import pandas as pd
 from pandas import DataFrame
 
-from xbrr.base.reader.base_parser import BaseParser
+from xbrr.base.reader.base_parser import BaseParser, memoized_property
+from xbrr.base.reader.text_patterns import TextPatterns
 from xbrr.xbrl.reader.reader import Reader
 from xbrr.xbrl.reader.element_value import ElementValue
 
+TITLE = TextPatterns({
+    "summary": r'(第(.)四半期|中間)?.*決算短信([%#]([^%#]*)[%#])?(#(.*)#)?',
+    "period": r'(第(.)四半期|中間)',
+})
+WAREKI = {'令和': 2019, '平成': 1989, '昭和': 1926}
+WAREKI_YEARS = TextPatterns({waname: r'{}([0-9]+)年'.format(waname) for waname in WAREKI})
+REPORT_DATE = re.compile(r'([0-9]+)[年-]([0-9]+)[月-]([0-9]+)日?')
+DIVIDEND_NOTE = TextPatterns({
+    "effective_date": r"(20\d{2})年(\d{1,2})月(\d{1,2})日.{0,10}効力発生日",
+    "date": r"(20\d{2})年\s*(\d{1,2})月\s*(\d{1,2})日",
+    "split_context": r"(分割|効力発生|付|株式)",
+    "split_ratio": r"1株[^\d]{0,5}(\d{1,2})株",
+})
+
 
 class Forecast(BaseParser):
     tse_ed_t_table_candiates: dict[str, list[str]] = {
@@ -103,13 +118,14 @@ class Forecast(BaseParser):
         self.__consolidated = None
         dic = str.maketrans('１２３４５６７８９０（）()［　］〔〕[]','1234567890####% %%%%%')
         title = self.document_name.value.translate(dic).strip().replace(' ','')
-        m = re.search(r'(第(.)四半期|中間)?.*決算短信([%#]([^%#]*)[%#])?(#(.*)#)?', title)
+        found = TITLE.search(title)
+        m = found["summary"]
         if m != None:
             self.__consolidated = '連結' == m.group(6)
             self.report_period_kind = gen_report_period_kind(m) # don't know which forecast contained
             self.accounting_standards = m.group(4)
         elif ('業績予想' in title or '配当予想' in title or '配当の予想' in title):
-            m = re.search(r'(第(.)四半期|中間)', title)
+            m = found["period"]
             if m is not None:   # 9691: 2024年３月期第２四半期連結累計期間業績予想の修正に関するお知らせ
                 self.report_period_kind = gen_report_period_kind(m)
                 self.__consolidated = '連結' in title
@@ -131,7 +147,7 @@ class Forecast(BaseParser):
         value = self.get_value("company_name")
         return value.value if value else 'not found'
 
-    @property
+    @memoized_property
     def accounting_standard(self) -> Literal['jp','if','us']:
         std = 'jp'
         if self.reader.find_value_name(lambda x: x.endswith('IFRS')):
@@ -150,14 +166,12 @@ class Forecast(BaseParser):
     
     @property
     def reporting_date(self) -> ElementValue:
-        wareki = {'令和': 2019, '平成': 1989, '昭和': 1926}
         def wareki2year(elemvalue):
             date1 = elemvalue.value.replace(' ','')
-            for waname in wareki.keys():
-                m = re.search(r'{}([0-9]+)年'.format(waname), date1)
+            for waname, m in WAREKI_YEARS.search(date1).items():
                 if m != None:
                     elemvalue.value = date1.replace(
-                        waname+m.groups()[0],str(int(m.groups()[0])+wareki[waname]-1))
+                        waname+m.groups()[0],str(int(m.groups()[0])+WAREKI[waname]-1))
             return elemvalue
 
         if self.filling_date is not None:
@@ -173,7 +187,7 @@ class Forecast(BaseParser):
         file_date = self.reader.xbrl_doc.published_date[0].date().isoformat()
         try:
             report_date = self.reporting_date.value
-            m = re.search(r'([0-9]+)[年-]([0-9]+)[月-]([0-9]+)日?', report_date)
+            m = REPORT_DATE.search(report_date)
             if m is not None:
                 print_date = date(*(int(x) for x in m.groups())).isoformat()
                 if print_date > file_date:
@@ -182,7 +196,7 @@ class Forecast(BaseParser):
             pass
         return file_date
     
-    @property
+    @memoized_property
     def forecast_period(self) -> str:
         # 'Role(Quarterly)?Forecasts' for (quarterly)? report which may have 業績予想
         # 'Role(Quarterly)?Dividends' for (quarterly)? report which may have 配当予想
@@ -193,17 +207,17 @@ class Forecast(BaseParser):
             return 'Q2'
         return 'FY'
 
-    @property
+    @memoized_property
     def fiscal_year_start_date(self) -> date:
         return self._get_fiscal_year_start_date_from_context()
 
-    @property
+    @memoized_property
     def fiscal_year_end_date(self) -> date:
         value = self.get_value("fiscal_date_end")
         assert value is not None
         return datetime.strptime(value.value, "%Y-%m-%d").date()
 
-    @property
+    @memoized_property
     def consolidated(self):
         try:
             return self.__consolidated if self.__consolidated else self.reader.xbrl_doc.consolidated
@@ -213,7 +227,7 @@ class Forecast(BaseParser):
                 return False
             return True
 
-    @property
+    @memoized_property
     def forecast_year_start_date(self) -> date:
         start_date = self.fiscal_year_start_date
         assert start_date != None
@@ -223,7 +237,7 @@ class Forecast(BaseParser):
             start_date = end_date + timedelta(days=1)
         return start_date
 
-    @property
+    @memoized_property
     def forecast_year_end_date(self) -> date:
         end_date = self.fiscal_year_end_date
         assert end_date != None
@@ -326,13 +340,13 @@ class Forecast(BaseParser):
         def is_split_mentioned(text: str) -> bool:
             return "株式分割" in text
         def _parse_split_date(text) -> Optional[date]:
-            match = re.search(r"(20\d{2})年(\d{1,2})月(\d{1,2})日.{0,10}効力発生日", text)
+            match = DIVIDEND_NOTE["effective_date"].search(text)
             if match:
                 return datetime(int(match[1]), int(match[2]), int(match[3]))
             return None
         def parse_split_date(text) -> Optional[date]:
             # 日付パターンを抽出（例: 2025年4月1日）
-            date_matches = re.findall(r"(20\d{2})年\s*(\d{1,2})月\s*(\d{1,2})日", text)
+            date_matches = DIVIDEND_NOTE["date"].findall(text)
             for match in reversed(date_matches): # take the last one if multiple found, because it may be the latest one
                 y, m, d = map(int, match)
                 date_obj = datetime(y, m, d)
@@ -345,11 +359,11 @@ class Forecast(BaseParser):
                     start = max(0, match_span.start() - 10)
                     end = match_span.end() + 10
                     context = text[start:end]
-                    if re.search(r"(分割|効力発生|付|株式)", context):
+                    if DIVIDEND_NOTE["split_context"].search(context):
                         return date_obj
             return None  # 該当なし        
         def parse_split_ratio(text) -> Optional[int]:
-            matches = re.findall(r"1株[^\d]{0,5}(\d{1,2})株", text)
+            matches = DIVIDEND_NOTE["split_ratio"].findall(text)
             if matches:
                 return int(matches[-1]) # take the last one if multiple found, because it may be the latest one
             return None
@@ -444,16 +458,12 @@ class Forecast(BaseParser):
 
     def __df_duration_from_fiscal_year_start_date(self, df:DataFrame, latest2year:bool) -> DataFrame:
         if 'context' in df.columns:
-            fy_start = self.fiscal_year_start_date
-            month_day = fy_start.strftime('%m-%d')
-            df = df[(df['context'].str.endswith('Duration'))&(df['period_start'].str.endswith(month_day))]
-            if latest2year:
-                df = df[(~df['context'].str.startswith('Prior2')) & (~df['context'].str.startswith('Prior3'))]
+            df = self.reader.context_table.filter(df, 'Duration', start=self.fiscal_year_start_date,
+                                                  excluded=['Prior2','Prior3'] if latest2year else [])
         return df if not df.empty else pd.DataFrame(columns=['label', 'value', 'unit', 'context', 'data_type', 'name', 'depth', 'consolidated'])
     
     def __df_instant(self, df:DataFrame, latest2year:bool) -> DataFrame:
         if 'context' in df.columns:
-            df = df[(df['context'].str.endswith('Instant'))&(~df['context'].str.startswith('Prior1Quarter'))]
-            if latest2year:
-                df = df[(~df['context'].str.startswith('Prior2')) & (~df['context'].str.startswith('Prior3'))]
+            df = self.reader.context_table.filter(df, 'Instant',
+                                                  excluded=['Prior1Quarter','Prior2','Prior3'] if latest2year else ['Prior1Quarter'])
         return df if not df.empty else pd.DataFrame(columns=['label', 'value', 'unit', 'context', 'data_type', 'name', 'depth', 'consolidated'])
@@ -1,6 +1,6 @@
 from datetime import datetime, date
 
-from xbrr.base.reader.base_parser import BaseParser
+from xbrr.base.reader.base_parser import BaseParser, memoized_property
 from xbrr.base.reader.base_reader import BaseReader
 from xbrr.xbrl.reader.element_value import ElementValue
 from xbrr.xbrl.reader.reader import Reader
@@ -31,10 +31,8 @@ class Metadata(BaseParser):
             # "fiscal_date_start": "jpdei_cor:CurrentFiscalYearStartDateDEI",
             "fiscal_date_end": "tse-o-di:FiscalYearEnd",
             # "report_period_kind": "jpdei_cor:TypeOfCurrentPeriodDEI",
+            # whether TypeOfReports flags are reported, the kind is read by the period model of the reader
             "_annual": "tse-o-di:TypeOfReports-Annual",
-            "_firstquarter": "tse-o-di:TypeOfReports-FirstQuarter",
-            "_secondquarter": "tse-o-di:TypeOfReports-SecondQuarter",
-            "_thirdquarter": "tse-o-di:TypeOfReports-ThirdQuarter",
 
             # "address": "jpcrp_cor:AddressOfRegisteredHeadquarterCoverPage",
             # "phone_number": "jpcrp_cor:TelephoneNumberAddressOfRegisteredHeadquarterCoverPage",
@@ -53,7 +51,7 @@ class Metadata(BaseParser):
         year = datetime.strptime(value.value, "%Y-%m-%d").year if value else 1900
         return year
 
-    @property
+    @memoized_property
     def fiscal_year_start_date(self) -> date:
         # TODO: fiscal_date_startがない場合、contextから取得する
         # value = self.get_value("fiscal_date_start")
@@ -62,7 +60,7 @@ class Metadata(BaseParser):
         #     return date
         return self._get_fiscal_year_start_date_from_context()
     
-    @property
+    @memoized_property
     def fiscal_year_end_date(self) -> date:
         value = self.get_value("fiscal_date_end")
         assert value is not None
@@ -81,8 +79,7 @@ class Metadata(BaseParser):
             assert self._report_period_kind
             return self._report_period_kind.value
         elif self._annual:
-            kind = "FY" if self._annual.value=="true"\
-                else "Q1" if self._firstquarter and self._firstquarter.value=="true"\
-                else "Q2" if self._secondquarter and self._secondquarter.value=="true"\
-                else "Q3"
-            return kind
+            # the annual flag takes precedence over the quarter flags here
+            if self._annual.value == "true":
+                return "FY"
+            return self.reader.period_model.quarter_kind or "Q3"
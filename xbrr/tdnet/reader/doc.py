@@ -1,5 +1,4 @@
 import errno
-import glob
 import os
 import re
 from datetime import datetime
@@ -10,15 +9,16 @@ from bs4 import BeautifulSoup
 from bs4.element import NavigableString, Tag, PageElement
 
 from xbrr.base.reader.xbrl_doc import XbrlDoc
+from xbrr.base.reader.zip_archive import ZipArchive
 
 
 class Doc(XbrlDoc):
 
-    def __init__(self, root_dir="", xbrl_kind=""):
+    def __init__(self, root_dir="", xbrl_kind="", archive:ZipArchive|None=None):
 
         def _glob_list(patterns):
             for patn in patterns:
-                xsd_files = glob.glob(os.path.join(root_dir, patn), recursive=True)
+                xsd_files = self.glob(os.path.join(root_dir, patn))
                 if xsd_files: return xsd_files
             return []
         def _xbrl_file(root_dir, kind):
@@ -31,19 +31,20 @@ class Doc(XbrlDoc):
             xbrl_file = self._prepare_xbrl(sorted(xsd_files,reverse=True)[0])
             return xbrl_file
         
+        self.archive = archive
         xbrl_file=_xbrl_file(root_dir, xbrl_kind)
         self.xbrl_kind = xbrl_kind
         self.file_spec = os.path.splitext(xbrl_file)[0]
-        super().__init__("tdnet", root_dir=root_dir, xbrl_file=xbrl_file)
+        super().__init__("tdnet", root_dir=root_dir, xbrl_file=xbrl_file, archive=archive)
 
         self.logger = getLogger(__name__)
 
     @classmethod
-    def find_report(cls, root_dir: str) -> "Doc":
+    def find_report(cls, root_dir: str, archive:ZipArchive|None=None) -> "Doc":
         try:
-            doc = Doc(root_dir=root_dir, xbrl_kind='summary')
+            doc = Doc(root_dir=root_dir, xbrl_kind='summary', archive=archive)
         except FileNotFoundError as e:
-            doc = Doc(root_dir=root_dir, xbrl_kind='public')
+            doc = Doc(root_dir=root_dir, xbrl_kind='public', archive=archive)
         return doc
 
     def find_path(self, kind) -> str:
@@ -61,7 +62,7 @@ class Doc(XbrlDoc):
                 raise Exception(f"manifest file does not exist.")
         elif kind in suffix:
             path = self.file_spec + suffix[kind]
-            files = glob.glob(path)
+            files = self.glob(path)
             if len(files)>0: return files[0]
         else: # kind=file name case
             path = os.path.join(os.path.dirname(self.file_spec), kind)
@@ -187,22 +188,22 @@ class Doc(XbrlDoc):
 
     @property
     def xbrl(self) -> BeautifulSoup:
-        if os.path.isfile(self.xbrl_file) and os.path.getsize(self.xbrl_file)>0:
+        if self.isfile(self.xbrl_file) and self.getsize(self.xbrl_file)>0:
             return super().read_file('xbrl')
         return self.read_ixbrl_as_xbrl()
 
     def _prepare_xbrl(self, xsd_file: str) -> str:
         """process ixbrl to xbrl
         """
-        if not os.path.isfile(xsd_file):
+        if not self.isfile(xsd_file):
             raise Exception(f"XSD file does not exist.")
         # xsl_file = "/usr/local/share/inlinexbrl/processor/Main_exslt.xsl"
 
         self.file_spec = os.path.splitext(xsd_file)[0]
         manifest_file = self.find_path('man')
-        if os.path.isfile(manifest_file):
+        if self.isfile(manifest_file):
             infile = manifest_file
-            with open(manifest_file, encoding="utf-8-sig") as f:
+            with self.open(manifest_file) as f:
                 manifest_xml = BeautifulSoup(f, "lxml-xml")
             instance_tag = manifest_xml.select_one('instance')
             if not instance_tag:
@@ -299,10 +300,10 @@ class Doc(XbrlDoc):
             nsdecls = xbrl_xml.attrs
             __xlate_to_xbrl(element)
         def translate_ixbrl(infile, outbs):
-            if not os.path.isfile(infile):
+            if not self.isfile(infile):
                 self.logger.warn(f"ixbrl file does not exist: {infile}")
                 return
-            with open(infile, encoding="utf-8-sig") as f:
+            with self.open(infile) as f:
                 ixbrl = BeautifulSoup(f, "lxml-xml")
 
             ixbrl_html = ixbrl.find("html")
@@ -318,9 +319,9 @@ class Doc(XbrlDoc):
                     
         xbrlbs = BeautifulSoup("", "lxml-xml")
         manifest_file = self.find_path('man')
-        if os.path.isfile(manifest_file):
+        if self.isfile(manifest_file):
             infile = manifest_file
-            with open(manifest_file, encoding="utf-8-sig") as f:
+            with self.open(manifest_file) as f:
                 manifest_xml = BeautifulSoup(f, "lxml-xml")
             instance_tag = manifest_xml.find('instance')
             assert isinstance(instance_tag, Tag)
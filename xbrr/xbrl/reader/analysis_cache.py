@@ -0,0 +1,106 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import hashlib
+import os
+import pickle
+import weakref
+from importlib.metadata import PackageNotFoundError, version
+from logging import getLogger
+
+from xbrr.base.reader.xbrl_doc import XbrlDoc
+
+if TYPE_CHECKING:
+    from xbrr.xbrl.reader.reader import Reader
+
+
+class AnalysisCache():
+    """
+    Per-filing cache of the analysis results of Reader.
+
+    The key is the hash of the instance and the local schema/linkbase files
+    together with the xbrr version, so a cached result is never used
+    for a modified filing or by another release of xbrr.
+    The key is computed once for an XbrlDoc, and a result computed lazily after
+    the first save (ex. role_decision_info) is stored as a separate entry.
+    """
+    ENTRIES = ('role_decision_info',)
+
+    def __init__(self, cache_dir:str):
+        """
+        Arguments:
+            cache_dir -- directory to store pickled analysis results.
+        """
+        self.cache_dir = cache_dir
+        self.logger = getLogger(__name__)
+        self._keys:weakref.WeakKeyDictionary[XbrlDoc, str] = weakref.WeakKeyDictionary()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def __getstate__(self) -> dict:
+        # the memoized keys refer to XbrlDocs of this process, and a WeakKeyDictionary can't be pickled
+        state = self.__dict__.copy()
+        del state['_keys']
+        return state
+
+    def __setstate__(self, state:dict):
+        self.__dict__.update(state)
+        self._keys = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def xbrr_version() -> str:
+        try:
+            return version("xbrr")
+        except PackageNotFoundError:
+            return ""
+
+    def document_key(self, xbrl_doc:XbrlDoc) -> str:
+        hash = hashlib.sha256(self.xbrr_version().encode())
+        paths = [xbrl_doc.xbrl_file]
+        if xbrl_doc.dirname or xbrl_doc.archive is not None:
+            paths += sorted([path for ext in ("xsd", "xml")
+                             for path in xbrl_doc.glob(os.path.join(xbrl_doc.dirname, f"*.{ext}"))])
+        for path in dict.fromkeys(paths):
+            if not xbrl_doc.isfile(path): continue
+            hash.update(os.path.basename(path).encode())
+            with xbrl_doc.open(path, "rb") as f:
+                while (chunk:=f.read(1 << 20)):
+                    hash.update(chunk)
+        return hash.hexdigest()
+
+    def cache_path(self, xbrl_doc:XbrlDoc, entry:str="") -> str:
+        """path of the analysis results of the filing, or of its entry"""
+        if (key:=self._keys.get(xbrl_doc)) is None:
+            key = self._keys[xbrl_doc] = self.document_key(xbrl_doc)
+        return os.path.join(self.cache_dir, f"{key}.{entry}.pickle" if entry else f"{key}.pickle")
+
+    def load(self, reader:Reader) -> bool:
+        """restore the analysis results into reader, return False if no cache is found"""
+        path = self.cache_path(reader.xbrl_doc)
+        if not os.path.isfile(path):
+            return False
+        try:
+            with open(path, "rb") as f:
+                state = pickle.load(f)
+            for entry in self.ENTRIES:
+                if os.path.isfile(entry_path:=self.cache_path(reader.xbrl_doc, entry)):
+                    with open(entry_path, "rb") as f:
+                        state[entry] = pickle.load(f)
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            self.logger.warning(f"broken analysis cache {path} is ignored: {e}")
+            return False
+        reader.restore_analysis(state)
+        return True
+
+    def save(self, reader:Reader):
+        self._dump(self.cache_path(reader.xbrl_doc), reader.analysis_state())
+
+    def save_entry(self, reader:Reader, entry:str, value):
+        """save an entry of the analysis results without saving the others"""
+        assert entry in self.ENTRIES
+        self._dump(self.cache_path(reader.xbrl_doc, entry), value)
+
+    def _dump(self, path:str, obj):
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
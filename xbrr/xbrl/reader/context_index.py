@@ -0,0 +1,69 @@
+from typing import Iterable
+
+from xbrr.xbrl.reader.context_table import ContextTable
+
+
+class IndexedContext():
+    """Axes, consolidated flag and period class of a context"""
+    __slots__ = ('id', 'axes', 'consolidated_axis', 'nonconsolidated', 'quarter_duration', 'ytd_duration')
+
+    def __init__(self, id:str, axes:dict[str,str]):
+        self.id = id
+        self.axes = axes
+        self.consolidated_axis = any(["Consolidated" in k for k in self.axes])
+        self.nonconsolidated = 'NonConsolidated' in self.id
+        self.quarter_duration = "QuarterDuration" in self.id
+        self.ytd_duration = "YTDDuration" in self.id
+
+
+class ContextIndex():
+    """
+    Index of the contexts of a filing, which is built once per filing
+    and selects the contexts of a role by its axis members.
+    """
+
+    def __init__(self, table:ContextTable):
+        """
+        Arguments:
+            table -- context table of a filing.
+        """
+        self.contexts = {id: IndexedContext(id, axes) for id, axes in table.axes.items()}
+        self._selections:dict[tuple, frozenset[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.contexts)
+
+    def select(self, axisdict:dict[str,list[str]|str], role_link:str) -> frozenset[str]:
+        """ids of the contexts whose axis members are in axisdict for the role"""
+        key = (role_link, tuple([(k, tuple(v) if isinstance(v, list) else v) for k,v in axisdict.items()]))
+        if (selection:=self._selections.get(key)) is None:
+            selection = frozenset([id for id, context in self.contexts.items()
+                                   if self.accepts(context, axisdict, role_link)])
+            self._selections[key] = selection
+        return selection
+
+    @staticmethod
+    def accepts(context:IndexedContext, axisdict:dict[str,list[str]|str], role_link:str) -> bool:
+        axes = context.axes
+        # assign consolidatedMember at the case not provided cons-noncons Axis, if it is required
+        if (consaxiss:=[k for k in axisdict if k.startswith("Consolidated")]) and not context.consolidated_axis:
+            axes = axes | {consaxiss[0]: "ConsolidatedMember" if not context.nonconsolidated else "NonConsolidatedMember"}
+        if set(axisdict.keys()) != set([x for x in axes.keys() if x.endswith("Axis")]):
+            return False
+        for key in axisdict:
+            if axes[key] not in axisdict[key]:
+                return False
+        # non-axis comparison like IncomeQuarterly, IncomeYTD
+        if any([period in role_link for period in ["YearToQuarterEnd","QuarterPeriod"]]) and context.quarter_duration:
+            return False
+        if any([period in role_link for period in ["QuarterPeriod","IncomeQuater"]]) and context.ytd_duration:
+            return False
+        return True
+
+    def dedupe(self, values:Iterable, selection:frozenset[str]) -> list:
+        """values in the selected contexts, the first one for each context id"""
+        by_id = {}
+        for value in values:
+            if (id:=value.context_ref.get('id', '')) in selection and id not in by_id:
+                by_id[id] = value
+        return list(by_id.values())
@@ -0,0 +1,107 @@
+import functools
+import re
+from datetime import date
+from typing import Iterable, Literal, Optional
+
+import pandas as pd
+from pandas import DataFrame
+
+from xbrr.xbrl.reader.element_value import ElementValue
+
+# ex. Prior1YTDDuration_NonConsolidatedMember: relative Prior1, span YTD, kind Duration
+CONTEXT_NAME = re.compile(r'^(Current|Next|Prior\d+)?(.*?)(Duration|Instant)?$')
+
+
+class ContextTable():
+    """
+    Contexts of a filing in a typed table, which is built once per filing.
+
+    A context is referred by its integer code, the row of frame, which has
+    id, context (name), relative (Current, Prior1, ...), span (Year, YTD, Quarter, ...),
+    instant, period_start and period (datetime64).
+    The period model and the context index of the filing are built from this table,
+    so the contexts are parsed once.
+    """
+
+    def __init__(self, context_dic:dict[str,dict[str,str]]):
+        """
+        Arguments:
+            context_dic -- context id to context (id, period, period_start and axes) of a filing.
+        """
+        self.ids = list(context_dic.keys())
+        self.codes = {id: code for code, id in enumerate(self.ids)}
+        # columns of ElementValue.to_dict() for each context
+        self.fields = {id: ElementValue.context_fields(context_ref) for id, context_ref in context_dic.items()
+                       if 'id' in context_ref and 'period' in context_ref}
+        self.axes = {id: {k:v for k,v in context_ref.items() if k.endswith("Axis")}
+                     for id, context_ref in context_dic.items()}
+
+        rows = []
+        for id in self.ids:
+            fields = self.fields.get(id, {})
+            relative, span, kind = self.classify(id.split('_')[0])
+            rows.append((id, id.split('_')[0], relative, span, kind == 'Instant',
+                         self.parse_date(fields.get('period_start')), self.parse_date(fields.get('period'))))
+        frame = pd.DataFrame(rows, columns=['id','context','relative','span','instant','period_start','period'])
+        frame['period_start'] = pd.to_datetime(frame['period_start'])
+        frame['period'] = pd.to_datetime(frame['period'])
+        frame = frame.astype({'instant': bool})
+        self.frame = frame
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def classify(context:str) -> tuple[str, str, str]:
+        """(relative, span, Duration or Instant) of a context name, ex. ('Prior1', 'YTD', 'Duration')"""
+        m = CONTEXT_NAME.match(context)
+        assert m is not None
+        return m.group(1) or '', m.group(2), m.group(3) or ''
+
+    @staticmethod
+    def parse_date(value) -> Optional[date]:
+        """date of a period, which may have the time (YYYY-MM-DDThh:mm:ss), None if it's not a date"""
+        if not value or not isinstance(value, str):
+            return None
+        try:
+            return date.fromisoformat(value[:10])
+        except ValueError:
+            return None
+
+    def code(self, id:str) -> int:
+        return self.codes[id]
+
+    def periods(self, ids:Iterable[str]) -> DataFrame:
+        """rows of the contexts"""
+        return self.frame.iloc[[self.codes[id] for id in ids]]
+
+    def filter(self, df:DataFrame, kind:Literal['Duration','Instant'],
+               start:Optional[date]=None, excluded:Iterable[str]=()) -> DataFrame:
+        """
+        Filter the values of read_value_by_role by the context name and the period_start of each row.
+        The conditions are evaluated once for each distinct pair of them, and period_start is parsed.
+
+        Arguments:
+            df -- DataFrame which has context and period_start columns.
+            kind -- Duration or Instant.
+
+        Keyword Arguments:
+            start -- month and day of the period start of durations, ex. fiscal year start (default: {None}).
+            excluded -- prefixes of the excluded context names, ex. Prior2 or Prior1Quarter (default: {()}).
+
+        Returns:
+            DataFrame -- rows of df.
+        """
+        excluded = tuple(excluded)
+        def accepts(context:str, period_start) -> bool:
+            if self.classify(context)[2] != kind or context.startswith(excluded):
+                return False
+            if start is None:
+                return True
+            parsed = self.parse_date(period_start)
+            return parsed is not None and (parsed.month, parsed.day) == (start.month, start.day)
+
+        keys = list(zip(df['context'], df['period_start'] if 'period_start' in df.columns else [None] * len(df)))
+        accepted = {key: accepts(*key) for key in set(keys)}
+        return df[pd.Series([accepted[key] for key in keys], index=df.index, dtype=bool)]
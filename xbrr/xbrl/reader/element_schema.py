@@ -1,12 +1,31 @@
-from typing import TYPE_CHECKING, cast
+from typing import IO, TYPE_CHECKING, Iterable, cast
 
 import os
+from logging import getLogger
+
 import bs4
 from bs4.element import NavigableString, Tag
+from lxml import etree
 
 from xbrr.base.reader.base_element_schema import BaseElementSchema
 from xbrr.base.reader.base_reader import BaseReader
 
+LABEL_ROLES = ("http://www.xbrl.org/2003/role/label", "http://www.xbrl.org/2003/role/verboseLabel")
+XLINK_NS = "http://www.w3.org/1999/xlink"
+XLINK_HREF = f"{{{XLINK_NS}}}href"
+XLINK_LABEL = f"{{{XLINK_NS}}}label"
+XLINK_ROLE = f"{{{XLINK_NS}}}role"
+XLINK_FROM = f"{{{XLINK_NS}}}from"
+XLINK_TO = f"{{{XLINK_NS}}}to"
+XML_LANG = "{http://www.w3.org/XML/1998/namespace}lang"
+LINKBASE_NS = "http://www.xbrl.org/2003/linkbase"
+LABEL_LINK = f"{{{LINKBASE_NS}}}labelLink"
+LOC = f"{{{LINKBASE_NS}}}loc"
+LABEL = f"{{{LINKBASE_NS}}}label"
+LABEL_ARC = f"{{{LINKBASE_NS}}}labelArc"
+
+logger = getLogger(__name__)
+
 
 class ElementSchema(BaseElementSchema):
 
@@ -46,6 +65,16 @@ class ElementSchema(BaseElementSchema):
         instance.reference = reference
         return instance
 
+    @classmethod
+    def create_from_references(cls, reader:BaseReader, references:Iterable[str]) -> dict[str,'ElementSchema']:
+        """batch version of create_from_reference, which reads each xsd and its labels only once"""
+        if not reader.xbrl_doc.has_schema: # for test purpose only
+            return {reference: cls(name=reference.split("#")[-1], reference=reference) for reference in references}
+
+        instances = reader.get_schemas_by_links(references)
+        for reference, instance in instances.items():
+            instance.reference = reference
+        return instances
 
     @classmethod
     def read_schema(cls, reader:BaseReader, xsduri:str):
@@ -80,7 +109,79 @@ class ElementSchema(BaseElementSchema):
         return xsd_dic
 
     @classmethod
-    def read_label_taxonomy(cls, reader:BaseReader, laburi:str, xsd_dic:dict[str,'ElementSchema']):
+    def read_label_taxonomy(cls, reader:BaseReader, laburi:str, xsd_dic:dict[str,'ElementSchema'],
+                            roles:Iterable[str]=LABEL_ROLES, lang:str|None=None, ids:Iterable[str]|None=None):
+        """
+        Set the labels of a label linkbase to the ElementSchemas.
+        The linkbase is parsed in a single streaming pass, and only the labels of the roles
+        (and the language) are kept, so a huge taxonomy label file is never loaded as a tree.
+        A linkbase which can't be streamed (ex. malformed xml) is read with BeautifulSoup.
+
+        Arguments:
+            reader -- reader of the filing.
+            laburi -- uri of the label linkbase.
+            xsd_dic -- element id to ElementSchema to set the labels.
+
+        Keyword Arguments:
+            roles -- label roles to keep, the first label of an xlink:label is used (default: {LABEL_ROLES}).
+            lang -- xml:lang of the labels to keep (default: {None} for all the languages).
+            ids -- element ids to set the labels (default: {None} for all the elements in xsd_dic).
+        """
+        roles = frozenset(roles)
+        targets = xsd_dic if ids is None else {id: xsd_dic[id] for id in ids if id in xsd_dic}
+        if (f:=reader.open_uri(laburi)) is not None:
+            try:
+                with f:
+                    cls.stream_label_taxonomy(f, targets, roles, lang)
+                return
+            except etree.XMLSyntaxError as e:
+                logger.warning(f"label linkbase {laburi} is read without streaming: {e}")
+        cls.read_label_taxonomy_soup(reader, laburi, targets, roles, lang)
+
+    @staticmethod
+    def stream_label_taxonomy(f:IO[bytes], xsd_dic:dict[str,'ElementSchema'], roles:frozenset[str], lang:str|None):
+        # as read_label_taxonomy_soup(), the locs and the labels of a labelLink are read before its labelArcs,
+        # the locs are found by the last one and the labels by the first one in the document.
+        loc_dic:dict[str,str] = {}
+        resource_dic:dict[str,tuple[str,str]] = {}
+        arcs:list[tuple[str,str]] = []
+        in_link = 0
+        for event, elem in etree.iterparse(f, events=("start", "end"), tag=[LABEL_LINK, LOC, LABEL, LABEL_ARC],
+                                           remove_comments=True, huge_tree=True):
+            if elem.tag == LABEL_LINK:
+                if event == 'start':
+                    in_link += 1
+                    continue
+                in_link -= 1
+                for arc_from, arc_to in arcs:
+                    if arc_to in resource_dic and arc_from in loc_dic and loc_dic[arc_from] in xsd_dic:
+                        role, text = resource_dic[arc_to]
+                        xsd_dic[loc_dic[arc_from]].set_label(role, text)
+                arcs = []
+            elif event == 'start' or not in_link:
+                continue
+            elif elem.tag == LOC:
+                href, label = elem.get(XLINK_HREF), elem.get(XLINK_LABEL)
+                assert href is not None and label is not None
+                v = href.split('#')
+                assert len(v) == 2
+                loc_dic[label] = v[1]
+            elif elem.tag == LABEL:
+                label, role = elem.get(XLINK_LABEL), elem.get(XLINK_ROLE)
+                if label is not None and role in roles and label not in resource_dic\
+                    and (lang is None or elem.get(XML_LANG) == lang):
+                    resource_dic[label] = (role, "".join(elem.itertext()))
+            else:
+                arc_from, arc_to = elem.get(XLINK_FROM), elem.get(XLINK_TO)
+                if arc_from is not None and arc_to is not None:
+                    arcs.append((arc_from, arc_to))
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+    @classmethod
+    def read_label_taxonomy_soup(cls, reader:BaseReader, laburi:str, xsd_dic:dict[str,'ElementSchema'],
+                                 roles:frozenset[str], lang:str|None):
         label_xml = reader.read_uri(laburi)
         loc_dic = {}
         resource_dic = {}
@@ -99,10 +200,8 @@ class ElementSchema(BaseElementSchema):
             attrs = elem.attrs
 
             if 'xlink:label' in attrs and 'xlink:role' in attrs:
-                label_role = "http://www.xbrl.org/2003/role/label"
-                verboseLabel_role = "http://www.xbrl.org/2003/role/verboseLabel"                    
-                if elem['xlink:role'] in [label_role, verboseLabel_role]\
-                    and elem['xlink:label'] not in resource_dic:
+                if elem['xlink:role'] in roles and elem['xlink:label'] not in resource_dic\
+                    and (lang is None or elem.get('xml:lang') == lang):
                     resource_dic[elem['xlink:label']] = {'role': elem['xlink:role'], 'text': elem.text}
 
         def read_label_labelArc(elem:Tag):
@@ -1,4 +1,4 @@
-from typing import Callable, cast
+from typing import Callable, Iterable, Optional, cast
 
 from bs4 import BeautifulSoup
 from bs4.element import NavigableString, Tag
@@ -6,6 +6,8 @@ from bs4.element import NavigableString, Tag
 from xbrr.base.reader.base_element_value import BaseElementValue
 from xbrr.base.reader.base_reader import BaseReader
 from xbrr.xbrl.reader.element_schema import ElementSchema
+from xbrr.xbrl.reader.html_cache import HtmlCache, html_to_text
+from xbrr.xbrl.reader.textblock import TextBlock
 
 
 class ElementValue(BaseElementValue):
@@ -17,7 +19,8 @@ class ElementValue(BaseElementValue):
     def __init__(self, name:str, reference="",
                  value:str="", unit="", decimals="",
                  context_ref:dict[str,str]={},
-                 lazy_schema:Callable[[], ElementSchema]=lambda:ElementSchema()):
+                 lazy_schema:Callable[[], ElementSchema]=lambda:ElementSchema(),
+                 html_cache:HtmlCache|None=None):
         super().__init__()
         self.name = name
         self.reference = reference
@@ -26,17 +29,55 @@ class ElementValue(BaseElementValue):
         self.decimals = decimals
         self.context_ref = context_ref
         self.lazy_schema = lazy_schema
+        self.html_cache = html_cache
+
+    def __getstate__(self):
+        # lazy_schema closure refers to the reader, it is rebound by bind()
+        state = self.__dict__.copy()
+        state.pop('lazy_schema', None)
+        state.pop('html_cache', None)
+        state.pop('_textblock', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lazy_schema = lambda:ElementSchema()
+        self.html_cache = None
+
+    def bind(self, reader:BaseReader):
+        reference = self.reference
+        self.lazy_schema = lambda :ElementSchema.create_from_reference(reader, reference)
+        self.html_cache = getattr(reader, 'html_cache', None)
 
     @property
     def normalized_text(self) -> str:
-        return self.normalize(self.html.text)
+        return self.normalize(self.text)
+
+    @property
+    def text(self) -> str:
+        "text of the html, which is read without parsing the html"
+        return html_to_text(self.html_text)
+
+    @property
+    def html_text(self) -> str:
+        return self.value.strip().replace("&lt;", "<").replace("&gt;", ">") if self.value else ''
 
     @property
     def html(self) -> BeautifulSoup:
-        html_text = self.value.strip().replace("&lt;", "<").replace("&gt;", ">") if self.value else ''
-        html = BeautifulSoup(html_text, "html.parser")
+        "parsed html, which is cached by the reader and must not be modified"
+        if self.html_cache is not None:
+            return self.html_cache.get(self, self.html_text)
+        html = BeautifulSoup(self.html_text, "html.parser")
         return html
 
+    @property
+    def textblock(self) -> TextBlock:
+        "tables of the html, which are parsed once for each element value"
+        attr_name = '_textblock'
+        if not hasattr(self, attr_name):
+            setattr(self, attr_name, TextBlock(self.html_text))
+        return getattr(self, attr_name)
+
     @property
     def context(self) -> str:
         return self.context_ref['id'].split('_')[0]
@@ -55,6 +96,23 @@ class ElementValue(BaseElementValue):
             setattr(self, attr_name, self.lazy_schema())
         return getattr(self, attr_name).data_type
 
+    @property
+    def has_schema(self) -> bool:
+        return hasattr(self, '_lazy_schema')
+
+    def set_schema(self, schema:ElementSchema):
+        setattr(self, '_lazy_schema', schema)
+
+    @classmethod
+    def resolve_schemas(cls, reader:BaseReader, values:Iterable['ElementValue']):
+        """fill the schemas (label, data_type) of values in bulk instead of one lazy_schema call per value"""
+        pending = [v for v in values if not v.has_schema]
+        if not pending:
+            return
+        schemas = ElementSchema.create_from_references(reader, dict.fromkeys([v.reference for v in pending]))
+        for v in pending:
+            v.set_schema(schemas[v.reference])
+
     @classmethod
     def create_element_value(cls, reader:BaseReader, xml_el:Tag, context_dic:dict[str,dict[str,str]]) -> 'ElementValue':
         name = xml_el.name
@@ -82,6 +140,7 @@ class ElementValue(BaseElementValue):
             value=value, unit=unit, decimals=decimals,
             context_ref=context_ref,
             lazy_schema=lambda :ElementSchema.create_from_reference(reader, reference),
+            html_cache=getattr(reader, 'html_cache', None),
         )
         return instance
 
@@ -132,25 +191,38 @@ class ElementValue(BaseElementValue):
                 read_value(child, nsdecls)
         return context_dic, value_dic, namespace_dic
     
-    def to_dict(self) -> dict[str,str|bool|None]:
-        context_id = self.context_ref['id']
+    @staticmethod
+    def context_fields(context_ref:dict[str,str]) -> dict[str,str|bool|None]:
+        "columns of a value which are derived from its context"
+        context_id = context_ref['id']
         id_parts = context_id.split("_", 1)
         member = ''
         if len(id_parts) > 1:
             member = "_".join([x.replace("Member","") for x in id_parts[1].split("_") if x!="NonConsolidatedMember"])
 
+        return {
+            "consolidated": "NonConsolidated" not in context_id,
+            "context": id_parts[0],
+            "member": member,
+            "dimension": ",".join([x for x in context_ref.keys() if x.endswith("Axis")]),
+            "period": context_ref['period'],
+            "period_start": context_ref['period_start'] if 'period_start' in context_ref else None,
+        }
+
+    def to_dict(self, context_fields:Optional[dict[str,str|bool|None]]=None) -> dict[str,str|bool|None]:
+        """
+        Keyword Arguments:
+            context_fields -- context_fields() of the context of this value, which are computed once per context by ContextTable.
+        """
+        if context_fields is None:
+            context_fields = self.context_fields(self.context_ref)
         return {
             "name": self.name,
             "reference": self.reference,
             "value": self.value,
             "unit": self.unit,
             "decimals": self.decimals,
-            "consolidated": "NonConsolidated" not in context_id,
-            "context": id_parts[0],
-            "member": member,
-            "dimension": ",".join([x for x in self.context_ref.keys() if x.endswith("Axis")]),
-            "period": self.context_ref['period'],
-            "period_start": self.context_ref['period_start'] if 'period_start' in self.context_ref else None,
+            **context_fields,
             "label": self.label,
         }
         # context string fragment:
@@ -0,0 +1,65 @@
+import html
+import re
+import threading
+from collections import OrderedDict
+
+from bs4 import BeautifulSoup
+
+MARKUPS = re.compile(r'<!--.*?-->|<[!/?]?[A-Za-z][^>]*>', re.S)
+ASCII_SPACES = '\x20\x0a\x09\x0c\x0d'
+
+
+def html_to_text(html_text:str) -> str:
+    """text of html without building its DOM, same as BeautifulSoup(html_text).text for TextBlock html"""
+    if '<' not in html_text and '&' not in html_text:
+        return html_text
+    texts = []
+    for text in MARKUPS.split(html_text):
+        if not text:
+            continue
+        text = html.unescape(text)
+        if not text.strip(ASCII_SPACES):
+            # whitespace between tags is collapsed as BeautifulSoup does
+            text = '\n' if '\n' in text else ' '
+        texts.append(text)
+    return ''.join(texts)
+
+
+class HtmlCache():
+    """
+    Bounded cache of the parsed html of facts, which is shared by the facts of a reader.
+    The least recently used html is dropped when maxsize facts are cached.
+    The cached html is shared by the callers, so that it must not be modified.
+    """
+
+    def __init__(self, maxsize:int=32):
+        """
+        Keyword Arguments:
+            maxsize {int} -- number of facts whose html is cached (default: {32}).
+        """
+        self.maxsize = maxsize
+        self._htmls:OrderedDict[int, tuple[object, BeautifulSoup]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._htmls)
+
+    def get(self, fact:object, html_text:str) -> BeautifulSoup:
+        """parsed html_text of the fact, keyed by the identity of the fact"""
+        key = id(fact)
+        with self._lock:
+            # the fact is held with its html, so its id is not reused while cached
+            if (entry:=self._htmls.get(key)) is not None and entry[0] is fact:
+                self._htmls.move_to_end(key)
+                return entry[1]
+        parsed = BeautifulSoup(html_text, "html.parser")
+        with self._lock:
+            self._htmls[key] = (fact, parsed)
+            self._htmls.move_to_end(key)
+            while len(self._htmls) > self.maxsize:
+                self._htmls.popitem(last=False)
+        return parsed
+
+    def clear(self):
+        with self._lock:
+            self._htmls.clear()
@@ -0,0 +1,129 @@
+import functools
+import os
+import pickle
+import sys
+from logging import getLogger
+from urllib.parse import urljoin
+
+from lxml import etree
+
+from xbrr.xbrl.reader.role_arcs import LINKBASE_NS, RoleArc
+
+XLINK_NS = "http://www.w3.org/1999/xlink"
+XLINK_LABEL = f"{{{XLINK_NS}}}label"
+XLINK_HREF = f"{{{XLINK_NS}}}href"
+XLINK_ROLE = f"{{{XLINK_NS}}}role"
+XLINK_FROM = f"{{{XLINK_NS}}}from"
+XLINK_TO = f"{{{XLINK_NS}}}to"
+
+
+class LinkbaseIndex():
+    """
+    Arcs of all the roles of a taxonomy linkbase, indexed in one streaming pass of the file.
+
+    The index is pickled beside the linkbase (<linkbase>.index.pickle), so the standard
+    linkbases are indexed once for a taxonomy, and is shared in a process by LinkbaseIndex.of().
+    """
+
+    FORMAT = 1
+
+    def __init__(self, roles:dict[tuple[str,str,str], tuple[RoleArc, ...]]):
+        """
+        Arguments:
+            roles -- (link element, arc element, role uri) to the arcs of the role.
+        """
+        self.roles = roles
+
+    def __len__(self) -> int:
+        return len(self.roles)
+
+    def arcs(self, role_link:str, link_node:str, arc_node:str) -> tuple[RoleArc, ...]:
+        """arcs of the role in the order of the document, the element names may have the prefix"""
+        return self.roles.get((link_node.split(':')[-1], arc_node.split(':')[-1], role_link), ())
+
+    @staticmethod
+    def index_path(path:str) -> str:
+        return f"{path}.index.pickle"
+
+    @classmethod
+    @functools.lru_cache(maxsize=100)
+    def of(cls, path:str, docuri:str) -> "LinkbaseIndex":
+        """index of the linkbase file, which is loaded from the stored index if it's not older than the file"""
+        if not os.path.isfile(path):
+            return cls({})
+        index_path = cls.index_path(path)
+        if os.path.isfile(index_path) and os.path.getmtime(index_path) >= os.path.getmtime(path):
+            if (index:=cls.load(index_path)) is not None:
+                return index
+        index = cls.parse(path, docuri)
+        index.save(index_path)
+        return index
+
+    @classmethod
+    def parse(cls, path:str, docuri:str) -> "LinkbaseIndex":
+        """
+        Index a presentation, calculation or definition linkbase.
+
+        Arguments:
+            path -- linkbase file.
+            docuri -- uri of the linkbase, which the relative hrefs of the locs are resolved against.
+
+        Returns:
+            LinkbaseIndex -- the index.
+        """
+        # a loc is found by its label in the whole document (the last one wins), as read_role_arcs() does
+        locs:dict[str,str] = {}
+        links:list[tuple[tuple[str,str,str], list[tuple[str,...]]]] = []
+        link_arcs:dict[str, list[tuple[str,...]]] = {}
+        for _, elem in etree.iterparse(path, events=("end",), remove_comments=True):
+            if not isinstance(elem.tag, str): continue
+            qname = etree.QName(elem)
+            if qname.localname == "loc":
+                locs[elem.get(XLINK_LABEL)] = elem.get(XLINK_HREF)
+            elif qname.namespace == LINKBASE_NS and qname.localname.endswith("Arc"):
+                link_arcs.setdefault(qname.localname, []).append((
+                    elem.get(XLINK_FROM), elem.get(XLINK_TO), elem.get('use', ''),
+                    elem.get('priority', '0'), elem.get('order', '0'),
+                    elem.get('weight', '') if qname.localname == "calculationArc" else ''))
+            elif qname.namespace == LINKBASE_NS and qname.localname.endswith("Link"):
+                for arc_node, arcs in link_arcs.items():
+                    links.append(((qname.localname, arc_node, elem.get(XLINK_ROLE, '')), arcs))
+                link_arcs = {}
+            else:
+                continue
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+        hrefs:dict[str,str] = {}
+        def resolve(label:str) -> str:
+            href = locs[label]
+            if href not in hrefs:
+                hrefs[href] = sys.intern(href if href.startswith('http') else urljoin(docuri, href))
+            return hrefs[href]
+
+        roles:dict[tuple[str,str,str], list[RoleArc]] = {}
+        for key, arcs in links:
+            roles.setdefault(key, []).extend(
+                RoleArc(resolve(parent), resolve(child), *attrs) for parent, child, *attrs in arcs)
+        return cls({key: tuple(arcs) for key, arcs in roles.items()})
+
+    @classmethod
+    def load(cls, index_path:str) -> "LinkbaseIndex|None":
+        try:
+            with open(index_path, "rb") as f:
+                format, roles = pickle.load(f)
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, ValueError, OSError) as e:
+            getLogger(__name__).warning(f"broken linkbase index {index_path} is ignored: {e}")
+            return None
+        return cls(roles) if format == cls.FORMAT else None
+
+    def save(self, index_path:str):
+        tmp_path = f"{index_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump((self.FORMAT, self.roles), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, index_path)
+        except OSError as e:
+            # read-only taxonomy directory, the index is kept only in this process
+            getLogger(__name__).warning(f"linkbase index {index_path} is not stored: {e}")
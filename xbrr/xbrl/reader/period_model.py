@@ -0,0 +1,72 @@
+import threading
+from datetime import date, datetime
+from typing import Optional
+
+import pandas as pd
+
+from xbrr.base.reader.base_reader import BaseReader
+from xbrr.xbrl.reader.context_table import ContextTable
+
+# in order of precedence when several flags are true (the quarters before the annual report)
+QUARTER_KIND_FLAGS = {
+    "Q1": "tse-o-di:TypeOfReports-FirstQuarter",
+    "Q2": "tse-o-di:TypeOfReports-SecondQuarter",
+    "Q3": "tse-o-di:TypeOfReports-ThirdQuarter",
+    "FY": "tse-o-di:TypeOfReports-Annual",
+}
+
+
+class ContextPeriod():
+    """period of a context as dates, start is None for instant"""
+    __slots__ = ('id', 'start', 'end', 'months')
+
+    def __init__(self, id:str, start:Optional[date], end:date):
+        self.id = id
+        self.end = end
+        self.start = start
+        self.months = min(round((end - start).days / 30.44), 12) if start is not None else 0
+
+
+class PeriodModel():
+    """
+    Periods of a filing, which are computed once for a reader and shared by the aspects.
+    """
+
+    def __init__(self, reader:BaseReader, table:ContextTable):
+        """
+        Arguments:
+            reader -- reader of the filing.
+            table -- context table of the filing, whose parsed periods are used.
+        """
+        self.reader = reader
+        frame = table.frame[table.frame['period'].notna()]
+        self.contexts = {id: ContextPeriod(id, start.date() if not pd.isna(start) else None, end.date())
+                         for id, start, end in zip(frame['id'], frame['period_start'], frame['period'])}
+        # latest end, longest and latest start first
+        self.durations = sorted([c for c in self.contexts.values() if c.start is not None],
+                                key=lambda c: (c.end, c.months, c.start), reverse=True)
+        self._fiscal_year_start_dates:dict[date, Optional[date]] = {}
+        self._lock = threading.Lock()
+
+    def fiscal_year_start_date(self, fiscal_year_end_date:date) -> Optional[date]:
+        """start of the latest and longest duration ending by fiscal_year_end_date, None if no duration"""
+        if isinstance(fiscal_year_end_date, datetime):
+            fiscal_year_end_date = fiscal_year_end_date.date()
+        with self._lock:
+            if fiscal_year_end_date not in self._fiscal_year_start_dates:
+                self._fiscal_year_start_dates[fiscal_year_end_date] = next(
+                    (c.start for c in self.durations if c.end <= fiscal_year_end_date), None)
+            return self._fiscal_year_start_dates[fiscal_year_end_date]
+
+    @property
+    def quarter_kind(self) -> Optional[str]:
+        """Q1, Q2, Q3 or FY of TypeOfCurrentPeriodDEI or TypeOfReports flags, None if not reported"""
+        if not hasattr(self, '_quarter_kind'):
+            value = self.reader.findv("jpdei_cor:TypeOfCurrentPeriodDEI")
+            kind = value.value if value is not None else None
+            if kind is None:
+                flags = self.reader.findvs(QUARTER_KIND_FLAGS.values())
+                kind = next((k for k, tag in QUARTER_KIND_FLAGS.items()
+                             if (flag:=flags[tag]) is not None and flag.value == 'true'), None)
+            self._quarter_kind = kind
+        return self._quarter_kind
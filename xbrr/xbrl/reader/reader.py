@@ -1,14 +1,14 @@
 from __future__ import annotations
-from typing import Optional, Literal, Callable, cast
+from typing import IO, Optional, Literal, Callable, Iterable, cast
 
 import importlib.util
 import os
 import math
 import itertools
+import threading
 from datetime import date, datetime, timedelta
 from pathlib import Path
 from enum import Enum, auto
-from urllib.parse import urljoin
 from logging import getLogger
 
 from bs4 import BeautifulSoup, Tag
@@ -18,8 +18,14 @@ from pandas import DataFrame
 
 from xbrr.base.reader.base_reader import BaseReader
 from xbrr.base.reader.xbrl_doc import XbrlDoc
+from xbrr.xbrl.reader.analysis_cache import AnalysisCache
+from xbrr.xbrl.reader.context_index import ContextIndex
+from xbrr.xbrl.reader.context_table import ContextTable
 from xbrr.xbrl.reader.element_schema import ElementSchema
 from xbrr.xbrl.reader.element_value import ElementValue
+from xbrr.xbrl.reader.html_cache import HtmlCache
+from xbrr.xbrl.reader.period_model import PeriodModel
+from xbrr.xbrl.reader.role_arcs import read_role_arcs
 from xbrr.xbrl.reader.role_schema import RoleSchema
 from xbrr.xbrl.reader.schema_tree import SchemaTree
 from xbrr.xbrl.reader.schema_dicts import SchemaDicts
@@ -28,21 +34,29 @@ from xbrr.xbrl.reader.taxonomy_repository import TaxonomyRepository
 
 class Reader(BaseReader):
 
-    def __init__(self, xbrl_doc: XbrlDoc, taxonomy_repo:TaxonomyRepository|None=None, save_dir: str = ""):
+    def __init__(self, xbrl_doc: XbrlDoc, taxonomy_repo:TaxonomyRepository|None=None, save_dir: str = "",
+                 cache:AnalysisCache|None=None):
         super().__init__("edinet", xbrl_doc)
         self.taxonomy_repo = taxonomy_repo if taxonomy_repo is not None\
             else TaxonomyRepository(save_dir)
         self.save_dir = save_dir
+        self.cache = cache
 
-        self.context_value_dic:dict[str, list[ElementValue]]
+        # state of the role being read, which is per thread to read roles concurrently
+        self._role_state = threading.local()
+        # guards the caches of the filing built lazily, which threads reading roles share
+        self._lock = threading.RLock()
         self._role_dic = {}
         self._context_dic:dict[str,dict[str,str]] = {}
         self._value_dic:dict[str, list[ElementValue]] = {}
         self._namespace_dic:dict[str, str] = {}
+        self._context_index:ContextIndex|None = None
+        self._context_table:ContextTable|None = None
+        self._period_model:PeriodModel|None = None
+        self.html_cache = HtmlCache()
         self.schema_dic:SchemaDicts
         self.schema_tree:SchemaTree
-        self._scans_presentation:list[BaseReader.PreTable|BaseReader.PreHeading] = []
-        self.epsilon_value:int = 0
+        self._scans_presentation:list[BaseReader.PreTable|BaseReader.PreHeading]|None = None
 
         self.logger = getLogger(__name__)
         self.debug_print = []
@@ -54,24 +68,91 @@ class Reader(BaseReader):
         return type(self), (self.xbrl_doc, self.taxonomy_repo, )
 
     def setup_initial_environment(self, save_dir:str):
+        if self.cache is not None and self.cache.load(self):
+            self.schema_dic = self.taxonomy_repo.load_schema_files(self._namespace_dic)
+            return
         self._context_dic, self._value_dic, self._namespace_dic =\
             ElementValue.read_xbrl_values(self, self.xbrl_doc.xbrl)
 
         self.schema_dic = self.taxonomy_repo.load_schema_files(self._namespace_dic)
         self.schema_tree = SchemaTree(self, self.xbrl_doc.find_path('xsd'))
-    
+        if self.cache is not None:
+            self.cache.save(self)
+
+    def analysis_state(self) -> dict:
+        """analysis results of this filing to be persisted by AnalysisCache"""
+        return {
+            'context_dic': self._context_dic,
+            'value_dic': self._value_dic,
+            'namespace_dic': self._namespace_dic,
+            'schema_tree': self.schema_tree,
+            'role_decision_info': self._scans_presentation,
+        }
+
+    def restore_analysis(self, state:dict):
+        self._context_dic = state['context_dic']
+        self._context_index = None
+        self._context_table = None
+        self._period_model = None
+        self._value_dic = state['value_dic']
+        self._namespace_dic = state['namespace_dic']
+        self.schema_tree = state['schema_tree']
+        self.schema_tree.bind(self)
+        self._scans_presentation = state['role_decision_info']
+        for values in self._value_dic.values():
+            for value in values:
+                value.bind(self)
+
     @property
     def context_dic(self) -> dict[str,dict[str,str]]:
         return self._context_dic
+
+    @property
+    def context_index(self) -> ContextIndex:
+        with self._lock:
+            if self._context_index is None:
+                self._context_index = ContextIndex(self.context_table)
+            return self._context_index
+
+    @property
+    def context_table(self) -> ContextTable:
+        with self._lock:
+            if self._context_table is None:
+                self._context_table = ContextTable(self._context_dic)
+            return self._context_table
+
+    @property
+    def period_model(self) -> PeriodModel:
+        with self._lock:
+            if self._period_model is None:
+                self._period_model = PeriodModel(self, self.context_table)
+            return self._period_model
+
+    @property
+    def context_value_dic(self) -> dict[str, list[ElementValue]]:
+        return self._role_state.context_value_dic
+
+    @context_value_dic.setter
+    def context_value_dic(self, context_value_dic:dict[str, list[ElementValue]]):
+        self._role_state.context_value_dic = context_value_dic
+
+    @property
+    def epsilon_value(self) -> int:
+        return getattr(self._role_state, 'epsilon_value', 0)
+
+    @epsilon_value.setter
+    def epsilon_value(self, epsilon_value:int):
+        self._role_state.epsilon_value = epsilon_value
     
     @property
     def custom_roles(self) -> dict[str,RoleSchema]:
-        if len(self._role_dic) == 0:
-            linkbase = self.xbrl_doc.default_linkbase
-            xml = self.read_uri(self.schema_tree.find_kind_uri(linkbase['doc']))
-            link_node, roleRef = self.get_linkbase_tag(xml, linkbase['link_node'], linkbase['roleRef'])
-            self._role_dic.update(RoleSchema.read_role_ref(xml, link_node, roleRef, lambda uri: self.read_uri(uri)))
-        return self._role_dic
+        with self._lock:
+            if len(self._role_dic) == 0:
+                linkbase = self.xbrl_doc.default_linkbase
+                xml = self.read_uri(self.schema_tree.find_kind_uri(linkbase['doc']))
+                link_node, roleRef = self.get_linkbase_tag(xml, linkbase['link_node'], linkbase['roleRef'])
+                self._role_dic.update(RoleSchema.read_role_ref(xml, link_node, roleRef, lambda uri: self.read_uri(uri)))
+            return self._role_dic
 
     @property
     def namespaces(self) -> dict[str, str]:
@@ -84,15 +165,52 @@ class Reader(BaseReader):
         assert "#" in link                  # http://disclosure.edinet-fsa.go.jp/taxonomy/jppfs/2020-11-01/jppfs_rt_2020-11-01.xsd#rol_ConsolidatedLabel
         ns_or_xsduri = link.split("#")[0]   # http://...(edinet|tdnet).../...
         element = link.split("#")[-1]       # tse-acedjpfr-36450_PromotionReturnIncomeNOI
+        if (elemschema:=self.schema_dic.lookup(link)) is not None:
+            return elemschema
         xsd_dic = self.schema_dic.get_dict(ns_or_xsduri, element)
 
         elemschema = xsd_dic.get(element, None)
         if elemschema is None:
             xsduri = self.find_xsduri(ns_or_xsduri) if not ns_or_xsduri.endswith('.xsd') else ns_or_xsduri
             xsd_dic.update(ElementSchema.read_schema(self, xsduri))
-            elemschema = xsd_dic.get(element, ElementSchema(name=element, reference=link)) # avoid reference error
+            if (elemschema:=xsd_dic.get(element, None)) is None:
+                return ElementSchema(name=element, reference=link) # avoid reference error
+        self.schema_dic.register(link, elemschema)
         return elemschema
 
+    def get_schemas_by_links(self, links:Iterable[str]) -> dict[str, ElementSchema]:
+        # group links by xsd uri, and read each xsd(+label linkbase) at most once
+        xsd_elements:dict[str, list[str]] = {}
+        for link in dict.fromkeys(links):
+            assert "#" in link
+            ns_or_xsduri, element = link.split("#")[0], link.split("#")[-1]
+            xsd_elements.setdefault(ns_or_xsduri, []).append(element)
+
+        schemas:dict[str, ElementSchema] = {}
+        for ns_or_xsduri, elements in xsd_elements.items():
+            unresolved = []
+            for element in elements:
+                if (schema:=self.schema_dic.lookup(f"{ns_or_xsduri}#{element}")) is not None:
+                    schemas[f"{ns_or_xsduri}#{element}"] = schema
+                else:
+                    unresolved.append(element)
+            if not (elements:=unresolved): continue
+            xsd_dic = self.schema_dic.get_dict(ns_or_xsduri, elements[0])
+            if any(element not in xsd_dic for element in elements):
+                xsduri = self.find_xsduri(ns_or_xsduri) if not ns_or_xsduri.endswith('.xsd') else ns_or_xsduri
+                xsd_dic.update(ElementSchema.read_schema(self, xsduri))
+            for element in elements:
+                link = f"{ns_or_xsduri}#{element}"
+                if (schema:=xsd_dic.get(element, None)) is not None:
+                    self.schema_dic.register(link, schema)
+                schemas[link] = schema if schema is not None else ElementSchema(name=element, reference=link) # avoid reference error
+        return schemas
+
+    def resolve_value_schemas(self, names:Optional[Iterable[str]]=None):
+        """resolve labels of the values specified by names (default: all values in this filing) at once"""
+        names = self._value_dic.keys() if names is None else [name.replace(':', '_') for name in names]
+        ElementValue.resolve_schemas(self, [v for name in names for v in self._value_dic.get(name, [])])
+
     # def get_role(self, role_name) -> RoleSchema:
     #     if '/' in role_name:
     #         role_name = role_name.rsplit('/', 1)[-1]
@@ -111,8 +229,20 @@ class Reader(BaseReader):
         assert uri.endswith('.xsd') or uri.endswith('.xml') or uri.startswith('http:'), "no xsduri found:{}".format(uri)
         if not uri.startswith('http'):
             uri = os.path.join(self.xbrl_doc.dirname, uri)
+            if self.xbrl_doc.archive is not None:
+                return self.xbrl_doc.read_uri(uri)
         return self.taxonomy_repo.read_uri(uri)
     
+    def open_uri(self, uri:str) -> IO[bytes] | None:
+        "open xsd or xml specified by uri as a binary file, None if no content"
+        if not uri.startswith('http'):
+            path = os.path.join(self.xbrl_doc.dirname, uri)
+            if self.xbrl_doc.archive is not None:
+                return self.xbrl_doc.open(path, "rb") if self.xbrl_doc.isfile(path) else None
+        else:
+            path = self.taxonomy_repo.taxonomy_path(uri)
+        return open(path, "rb") if os.path.isfile(path) else None
+
     def get_linkbase_tag(self, doc:BeautifulSoup, *args) -> tuple[str,str]:
         ns_prefixes = {v: k for k,v in doc._namespaces.items()}
         if (link_prefix:=ns_prefixes.get("http://www.xbrl.org/2003/linkbase")) is not None:
@@ -126,10 +256,31 @@ class Reader(BaseReader):
 
     @property
     def role_decision_info(self) -> list[BaseReader.PreTable|BaseReader.PreHeading]:
-        if len(self._scans_presentation)==0:
-            self._scans_presentation = self.__scan_presentation()
-        return self._scans_presentation
-    
+        with self._lock:
+            if self._scans_presentation is None:
+                self._scans_presentation = self.__scan_presentation()
+                if self.cache is not None:
+                    self.cache.save_entry(self, 'role_decision_info', self._scans_presentation)
+            return self._scans_presentation
+
+    @role_decision_info.setter
+    def role_decision_info(self, scans:list[BaseReader.PreTable|BaseReader.PreHeading]):
+        # restore the scan result persisted for this filing
+        self._scans_presentation = scans
+
+    @staticmethod
+    def index_presentation_link(link:Tag, arc_node:str) -> tuple[dict[str,Tag], dict[str,Tag]]:
+        """build label->loc and to->arc maps of a presentation link in one pass (first occurrence wins)"""
+        label_locs:dict[str,Tag] = {}
+        to_arcs:dict[str,Tag] = {}
+        for tag in link.find_all(["loc", arc_node]):
+            assert isinstance(tag, Tag)
+            if tag.name == "loc":
+                label_locs.setdefault(cast(str,tag.get("xlink:label")), tag)
+            else:
+                to_arcs.setdefault(cast(str,tag.get("xlink:to")), tag)
+        return label_locs, to_arcs
+
     def __scan_presentation(self) -> list[BaseReader.PreTable|BaseReader.PreHeading]:
         scans:list[BaseReader.PreTable|BaseReader.PreHeading] = []
         linkbase = self.xbrl_doc.default_linkbase
@@ -146,6 +297,8 @@ class Reader(BaseReader):
                 table = ''
                 cons_noncons = ''
                 locs_after_cons = 5
+                label_locs:dict[str,Tag]|None = None
+                to_arcs:dict[str,Tag] = {}
                 for loc in link.find_all("loc"):
                     if table and cons_noncons and locs_after_cons <= 0:
                         break
@@ -167,10 +320,11 @@ class Reader(BaseReader):
                     # role_name=="http://www.xbrl.tdnet.info/jp/tse/tdnet/role/RoleAttachedDocument"
                     #             US-GAAP? http://disclosure.edinet-fsa.go.jp/role/jpcrp/rol_CabinetOfficeOrdinanceOnDisclosureOfCorporateInformationEtcFormNo3AnnualSecuritiesReport
                     if href.endswith("TextBlock"):
+                        if label_locs is None:
+                            label_locs, to_arcs = self.index_presentation_link(link, arc_node)
                         tolabel = cast(str,loc["xlink:label"])
-                        if not (arc:=link.find(arc_node, attrs={"xlink:to":tolabel})): continue
-                        assert isinstance(arc, Tag)
-                        headingloc = link.find("loc", attrs={"xlink:label": arc["xlink:from"]})
+                        if not (arc:=to_arcs.get(tolabel)): continue
+                        headingloc = label_locs.get(cast(str,arc["xlink:from"]))
                         assert isinstance(headingloc, Tag)
                         heading = cast(str,headingloc["xlink:href"]).split("#")[-1].split("_")[-1]
                         if not heading.endswith("Heading"): continue
@@ -181,7 +335,7 @@ class Reader(BaseReader):
                 scans.append(Reader.PreTable(table=table, cons_nocons=cons_noncons, xlink_role=role_name)) # type: ignore
         return scans
 
-    def read_schema_by_role(self, role_link:str, fix_cal_node:list[str]=[], report_start:Optional[date]=None, report_end:Optional[date]=None) -> DataFrame:
+    def read_schema_by_role(self, role_link:str, fix_cal_node:list[str]|NameMatcher=[], report_start:Optional[date]=None, report_end:Optional[date]=None) -> DataFrame:
         assert role_link.startswith("http"), "role must be full uri: {}".format(role_link)
         if not self.xbrl_doc.has_schema:
             raise Exception("XBRL directory is required.")
@@ -199,30 +353,14 @@ class Reader(BaseReader):
             self.logger.debug("-------------- Section calculation ------------------")
             for docuri in self.schema_tree.linkbaseRef_iterator('cal'):
                 self.make_node_tree(nodes, role_link, docuri, "calculationLink", "calculationArc", "summation-item")
-            if fix_cal_node:                
-                self.patch_calc_node_tree(current_vdic, nodes, fix_cal_node)
+            if fix_cal_node:
+                matcher = fix_cal_node if isinstance(fix_cal_node, NameMatcher) else NameMatcher(fix_cal_node)
+                self.patch_calc_node_tree(current_vdic, nodes, matcher)
         return self.flatten_to_schemas(nodes)
     
     def select_value_dic(self, nodes:dict[str, Node], role_link:str) -> dict[str, list[ElementValue]]:
         # key: element name, which includes namespace prefix following _
         # list[ElementValue]: Current, Prior1, Prior2 order of ElementValues in this role context
-        def axis_member(dict:dict[str,str], value:ElementValue) -> bool:
-            # assign consolidatedMember at the case not provided cons-noncons Axis, if it is required
-            contexts = {k:v for k,v in value.context_ref.items() if k.endswith("Axis")}
-            if (consaxiss:=[k for k in dict if k.startswith("Consolidated")]):
-                if not any(["Consolidated" in k for k in contexts]):
-                    contexts[consaxiss[0]] = "ConsolidatedMember" if 'NonConsolidated' not in value.context_ref['id'] else "NonConsolidatedMember"
-            if set(dict.keys()) == set([x for x in contexts.keys() if x.endswith("Axis")]):
-                for key in dict:
-                    if contexts[key] not in dict[key]:
-                        return False
-                # non-axis comparison like IncomeQuarterly, IncomeYTD
-                if any([period in role_link for period in ["YearToQuarterEnd","QuarterPeriod"]]) and "QuarterDuration" in value.context_ref['id']:
-                    return False
-                if any([period in role_link for period in ["QuarterPeriod","IncomeQuater"]]) and "YTDDuration" in value.context_ref['id']:
-                    return False
-                return True
-            return False
         axisdict = {}
         for name in [nm for nm in nodes if nm.endswith("Member")]:
             member = name.split('_')[-1]
@@ -234,59 +372,54 @@ class Reader(BaseReader):
             consaxis = "ConsolidatedOrNonConsolidatedAxis" if 'edinet' in role_link else "ConsolidatedNonconsolidatedAxis"
             axisdict[consaxis] = "NonConsolidatedMember" if "NonConsolidated" in role_link else "ConsolidatedMember"
 
+        selection = self.context_index.select(axisdict, role_link)
         context_value_dic:dict[str, list[ElementValue]] = {}
         for key in nodes:
-            if key not in self._value_dic or not (values:=[v for v in self._value_dic[key] if axis_member(axisdict,v)]):
+            if key not in self._value_dic or not (values:=self.context_index.dedupe(self._value_dic[key], selection)):
                 continue
-            seen = []
-            values = [v for v in values if not (v.context_ref['id'] in seen or seen.append(v.context_ref['id']))] # remove duplicated context_ref id
             context_value_dic[key] = sorted(values, key=lambda x: x.context_ref['id']) # Current, Prior1, Prior2 order
         return context_value_dic
 
     def current_value_dic(self, report_start:Optional[date]=None, report_end:Optional[date]=None) -> dict[str,ElementValue]:
-        # filter context by period_start and period_end
-        def filter_period(vlist:list[ElementValue]) -> Optional[ElementValue]:
-            for v in vlist:
-                if 'period_start' in v.context_ref:
-                    if v.context_ref['period_start'] == period_start and \
-                        v.context_ref['period'] == period_end:
-                        return v
-                elif v.context_ref['period'] == period_end: # and v.value!='NaN' and v.unit!='':
-                    return v
-            return None
-
-        current_vdic:dict[str,ElementValue] = {}
         context_ids = set([v.context_ref['id'] for vlist in self.context_value_dic.values() for v in vlist])
-        if any(['period_start' in self._context_dic[x] for x in context_ids]):
-            context_ids = sorted([x for x in context_ids if 'period_start' in self._context_dic[x]], key=lambda x: self._context_dic[x]['period_start'], reverse= False)
-        sorted_context_ids = sorted(context_ids, key=lambda x: self._context_dic[x]['period'], reverse=True)
-        if not sorted_context_ids:
+        if not context_ids:
             self.logger.warn("No context ids found.")
             return {}
+        periods = self.context_table.periods(context_ids)
+        if (durations:=periods[periods['period_start'].notna()]).shape[0] > 0:
+            periods = durations.sort_values('period_start', kind='stable')
+        sorted_context_ids = list(periods.sort_values('period', ascending=False, kind='stable')['id'])
+        latest = self.context_table.fields[sorted_context_ids[0]]
 
         period_start = "2009-01-01"
-        if 'period_start' in self._context_dic[sorted_context_ids[0]]:
-            if report_start is not None and report_start.strftime("%Y-%m-%d") != self._context_dic[sorted_context_ids[0]]['period_start']:
+        if latest['period_start'] is not None:
+            if report_start is not None and report_start.strftime("%Y-%m-%d") != latest['period_start']:
                 self.logger.info("report_start {} does not match period_start {}: {}".format(
-                    report_start.strftime("%Y-%m-%d"), self._context_dic[sorted_context_ids[0]]['period_start'], sorted_context_ids))
+                    report_start.strftime("%Y-%m-%d"), latest['period_start'], sorted_context_ids))
             if len(sorted_context_ids) > 1:
                 assert not (sorted_context_ids[0].startswith('Prior') and sorted_context_ids[1].startswith('Current')), "invalid context ids: {}".format(sorted_context_ids)
-            period_start = self._context_dic[sorted_context_ids[0]]['period_start']
-        if report_end is not None and report_end.strftime("%Y-%m-%d") != self._context_dic[sorted_context_ids[0]]['period']:
+            period_start = cast(str, latest['period_start'])
+        if report_end is not None and report_end.strftime("%Y-%m-%d") != latest['period']:
             self.logger.info("report_end {} does not match period_end {}: {}".format(
-                report_end.strftime("%Y-%m-%d"), self._context_dic[sorted_context_ids[0]]['period'], sorted_context_ids))
+                report_end.strftime("%Y-%m-%d"), latest['period'], sorted_context_ids))
             if len(sorted_context_ids) > 1:
                 assert not (sorted_context_ids[0].startswith('Prior') and sorted_context_ids[1].startswith('Current')), "invalid context ids: {}".format(sorted_context_ids)
-        period_end = self._context_dic[sorted_context_ids[0]]['period']
-        
-        current_vdic = {k:v for (k,vlist) in self.context_value_dic.items() if (v:=filter_period(vlist))}
+        period_end = latest['period']
+
+        # filter context by period_start and period_end, once for each context
+        frame = self.context_table.frame
+        in_period = (frame['period']==pd.Timestamp(cast(str, period_end))) &\
+            (frame['period_start'].isna() | (frame['period_start']==pd.Timestamp(period_start)))
+        current_ids = set(frame['id'][in_period])
+        current_vdic = {k:v for (k,vlist) in self.context_value_dic.items()
+                        if (v:=next((v for v in vlist if v.context_ref['id'] in current_ids), None))}
         self.prepare_epsilon(current_vdic)
         return current_vdic
 
     def prepare_epsilon(self, current_vdic:dict[str,ElementValue]):
         moneys = [x for x in current_vdic.values() if x.data_type=='monetary' and x.value!='NaN']
         if not moneys:
-            Node.epsilon_value = 0
+            self.epsilon_value = 0
             return
         eps1 = min([epsilon(float(x.value)) for x in moneys])
         self.epsilon_value = eps1
@@ -314,7 +447,7 @@ class Reader(BaseReader):
             if len(parent_children[name]) >= 1:
                 nodes[name].mark_subtotal(parent_children[name], current_vdic, lambda x: epsval(self.epsilon_value, x))
 
-    def patch_calc_node_tree(self, context_value_dic:dict[str,ElementValue], nodes:dict[str,Node], fix_cal_node:list[str]):
+    def patch_calc_node_tree(self, context_value_dic:dict[str,ElementValue], nodes:dict[str,Node], fix_cal_node:NameMatcher):
         self.eliminate_non_value_calc_leaf(nodes, context_value_dic)
 
         if self.validate_calc_node_tree(context_value_dic, nodes, fix_cal_node):
@@ -329,7 +462,7 @@ class Reader(BaseReader):
         self.fix_extra_calc_link(nodes, fix_cal_node, context_value_dic)
         self.fix_missing_calc_link(nodes, fix_cal_node, context_value_dic)
 
-    def validate_calc_node_tree(self, context_value_dic:dict[str,ElementValue], nodes:dict[str,Node], fix_cal_node:list[str]) -> bool:
+    def validate_calc_node_tree(self, context_value_dic:dict[str,ElementValue], nodes:dict[str,Node], fix_cal_node:NameMatcher) -> bool:
         has_derived = False
         leaf_nodes = []
         orphans = []
@@ -366,49 +499,36 @@ class Reader(BaseReader):
         return has_derived
 
     def make_node_tree(self, nodes:dict[str,Node], role_link:str, docuri:str, link_node:str, arc_node:str, arc_role:str):
-        def get_name(loc):
-            return loc["xlink:href"].split("#")[-1]
-        def get_absxsduri(docuri, xsduri):
-            if xsduri.startswith('http'): return xsduri
-            return urljoin(docuri, xsduri)
-
-        doc = self.read_uri(docuri)
-        link_node, arc_node = self.get_linkbase_tag(doc, link_node, arc_node)
-        assert len(doc.contents)==0 or "xlink" in doc._namespaces
-        
-        locs = {}
-        for loc in doc.find_all("loc"):
-            if not isinstance(loc, Tag): continue
-            locs[loc["xlink:label"]] = loc
-
-        for role in doc.find_all(link_node, {"xlink:role": role_link}):
-            if not isinstance(role, Tag): continue
-            for i, arc in enumerate(role.find_all(arc_node, recursive=False)):
-                if not isinstance(arc, Tag): continue
-                assert str(arc["xlink:arcrole"]).split('/')[-1] in ['parent-child','summation-item','domain-member', 'dimension-domain', 'all', 'hypercube-dimension']
-                # if not str(arc["xlink:arcrole"]).endswith(arc_role):
-                #     continue
-
-                arctype = arc_node.split(':')[-1]
-                parent = locs[arc["xlink:from"]]
-                child = locs[arc["xlink:to"]]
-
-                if get_name(child) not in nodes:
-                    xsduri = get_absxsduri(docuri, child["xlink:href"])
-                    c = ElementSchema.create_from_reference(self, xsduri)
-                    nodes[get_name(child)] = Node(c)
-
-                if get_name(parent) not in nodes:
-                    xsduri = get_absxsduri(docuri, parent["xlink:href"])
-                    p = ElementSchema.create_from_reference(self, xsduri)
-                    nodes[get_name(parent)] = Node(p)
-
-                if arctype == "calculationArc":
-                    self.logger.debug("{}:{} --> {}:w{} p{} o{} {}".format(nodes[get_name(parent)].label,get_name(parent),get_name(child),arc.get("weight","0"),arc.get("priority","0"),arc.get("order","0"),arc.get("use",'')))
-                    nodes[get_name(child)].add_derive(nodes[get_name(parent)], str(arc.get('use','')), str(arc.get('priority','0')), str(arc.get('order','0')), str(arc['weight']))
-                else:
-                    self.logger.debug("{}:{} --> {}:p{} o{} {}".format(nodes[get_name(parent)].label,get_name(parent),get_name(child),arc.get("priority","0"),arc.get("order","0"),arc.get("use",'')))
-                    nodes[get_name(child)].add_parent(nodes[get_name(parent)], str(arc.get('use','')), str(arc.get('priority','0')), str(arc.get('order','0')))
+        def get_name(href):
+            return href.split("#")[-1]
+
+        if docuri.startswith('http'):
+            # taxonomy linkbase, which is indexed once for the taxonomy and shared by the filings
+            arcs = self.taxonomy_repo.read_role_arcs(docuri, role_link, link_node, arc_node)
+        else:
+            arcs = read_role_arcs(self.read_uri(docuri), docuri, role_link, link_node, arc_node)
+
+        arctype = arc_node.split(':')[-1]
+        for arc in arcs:
+            # if not str(arc["xlink:arcrole"]).endswith(arc_role):
+            #     continue
+            parent = get_name(arc.parent_href)
+            child = get_name(arc.child_href)
+
+            if child not in nodes:
+                c = ElementSchema.create_from_reference(self, arc.child_href)
+                nodes[child] = Node(c)
+
+            if parent not in nodes:
+                p = ElementSchema.create_from_reference(self, arc.parent_href)
+                nodes[parent] = Node(p)
+
+            if arctype == "calculationArc":
+                self.logger.debug("{}:{} --> {}:w{} p{} o{} {}".format(nodes[parent].label,parent,child,arc.weight,arc.priority,arc.order,arc.use))
+                nodes[child].add_derive(nodes[parent], arc.use, arc.priority, arc.order, arc.weight)
+            else:
+                self.logger.debug("{}:{} --> {}:p{} o{} {}".format(nodes[parent].label,parent,child,arc.priority,arc.order,arc.use))
+                nodes[child].add_parent(nodes[parent], arc.use, arc.priority, arc.order)
 
     def fix_not_preserve_link(self, type:Literal['cal','pre'], nodes:dict[str,Node], preserve_dict:dict):
         for name in nodes:
@@ -431,7 +551,7 @@ class Reader(BaseReader):
                 if type=='cal':
                     nodes[name].omit_deleted_derives()
 
-    def fix_missing_calc_link(self, nodes:dict[str,Node], fix_cal_node:list[str], current_vdic:dict[str,ElementValue]):
+    def fix_missing_calc_link(self, nodes:dict[str,Node], fix_cal_node:NameMatcher, current_vdic:dict[str,ElementValue]):
         def make_missing_link(derived, orphans):
             if derived is None or not orphans:
                 return
@@ -477,7 +597,7 @@ class Reader(BaseReader):
                 orphans = ordered_candidates[ordered_candidates.index(derived)+1:]
                 make_missing_link(derived, orphans)
     
-    def fix_extra_calc_link(self, nodes:dict[str,Node], fix_cal_node:list[str], current_vdic:dict[str,ElementValue]):
+    def fix_extra_calc_link(self, nodes:dict[str,Node], fix_cal_node:NameMatcher, current_vdic:dict[str,ElementValue]):
         def eliminate_extra_link(node):
             derives = sorted([v for v in node.get_derived() if v.name in current_vdic], reverse=True, key=lambda x: x.derivation_order)
             node_value, diff, epsilon = node.cvalue(current_vdic, lambda x: epsval(self.epsilon_value, x))
@@ -650,6 +770,8 @@ class Reader(BaseReader):
         if len(schemas) == 0:
             return pd.DataFrame()
         
+        ElementValue.resolve_schemas(self, [v for name in schemas['name'] for v in self.context_value_dic.get(name, [])
+                                            if v.context.startswith(scope)])
         xbrl_data = []
         for i, row in schemas.iterrows():
             tag_name = row['name']
@@ -663,7 +785,7 @@ class Reader(BaseReader):
                 if not value.context.startswith(scope):
                     continue
                 item = row.to_dict()
-                for k, v in value.to_dict().items():
+                for k, v in value.to_dict(self.context_table.fields.get(value.context_ref['id'])).items():
                     if k not in ['name','label']:
                         item[k] = v
                 results.append(item)
@@ -672,9 +794,10 @@ class Reader(BaseReader):
                 xbrl_data += results
 
         xbrl_df = pd.DataFrame(xbrl_data)
-        if self.debug_print:
-            self.logger.info('\n'.join(list(set(self.debug_print))))
-            self.debug_print = []
+        with self._lock:
+            debug_print, self.debug_print = self.debug_print, []
+        if debug_print:
+            self.logger.info('\n'.join(list(set(debug_print))))
         return xbrl_df
 
     def flatten_depth(self, depth: pd.Series) -> pd.Series:
@@ -715,6 +838,11 @@ class Reader(BaseReader):
         id = name.replace(':', '_')
         return self._value_dic.get(id, [None])[0] # find returns the first element value only.
 
+    def findvs(self, names:Iterable[str]) -> dict[str, Optional[ElementValue]]:
+        value_dic = self._value_dic
+        return {name: values[0] if (values:=value_dic.get(name.replace(':', '_'))) else None
+                for name in names}
+
 
 class Node():
     base_node:Optional[Node] = None
@@ -1004,7 +1132,7 @@ class Node():
     def no_derive(self) -> bool:
         return len(self.clinks.active_src) == 0
 
-    def need_to_derive_value(self, current_vdic:dict[str, ElementValue], fix_cal_node:list[str]):
+    def need_to_derive_value(self, current_vdic:dict[str, ElementValue], fix_cal_node:NameMatcher):
         parents = self.get_parent()
         # omit quasi subtotal that subtotal is not fix_cal_node
         if self.is_subtotal_fewer_child() and not nmmatch(parents[0].name, fix_cal_node): # requires not nmmatch: 64180 日金銭　　　　　　　　　　　2014-02-12 15:30:00: 平成26年3月期 第3四半期決算短信
@@ -1177,31 +1305,58 @@ def subtotal(target, children, vdic) -> list[float]:
 def t(name:str) -> str:
     return name.split('_')[-1]
 
-def nmmatch(tagname:str, matcher:list[str]) -> bool:
-    name = t(tagname)
-    simple, complex = [],[]
-    for x in matcher:
-        (simple, complex)[x[0] in '<~>'].append(x)
-    if name in simple:
-        return True
-    return any([nmmatch1(name, x) for x in complex])
+def nmmatch(tagname:str, matcher:list[str]|NameMatcher) -> bool:
+    if not isinstance(matcher, NameMatcher):
+        matcher = NameMatcher(matcher)
+    return matcher.match(tagname)
 
 import re
 
-def nmmatch1(name:str, matcher:str) -> bool:
-    if matcher[0]=='<':
-        return name.startswith(matcher[1:])
-    if matcher[0]=='>':
-        return name.endswith(matcher[1:])
-    if matcher[0]=='~':
-        return re.search(matcher[1:], name) is not None
-    return name==matcher
-
-def nmshortest_match(names:list[str], matcher:list[str]) -> list[str]:
+def nmshortest_match(names:list[str], matcher:list[str]|NameMatcher) -> list[str]:
+    if not isinstance(matcher, NameMatcher):
+        matcher = NameMatcher(matcher)
     results:set = set()
-    for m in matcher:
-        matchs = [name for name in names if nmmatch(name, [m])]
+    for m in matcher.each():
+        matchs = [name for name in names if m.match(name)]
         if matchs:
             shortest_name = min(matchs, key=lambda x: len(t(x)))
             results.add(shortest_name)
-    return list(results)
\ No newline at end of file
+    return list(results)
+
+class NameMatcher():
+    """
+    fix_cal_node matchers compiled once:
+    'Name' (exact), '<Name' (prefix), '>Name' (suffix) and '~regex' of the element name without namespace prefix.
+    """
+
+    def __init__(self, matcher:list[str]):
+        self.matcher = list(matcher)
+        self.simple = frozenset([x for x in self.matcher if x[0] not in '<~>'])
+        self.prefixes = tuple([x[1:] for x in self.matcher if x[0]=='<'])
+        self.suffixes = tuple([x[1:] for x in self.matcher if x[0]=='>'])
+        self.regexes = [re.compile(x[1:]) for x in self.matcher if x[0]=='~']
+        # one alternation instead of each regex, unless group numbers are referred
+        if len(self.regexes) > 1 and not any([re.search(r'\\[1-9]|\(\?P=', r.pattern) for r in self.regexes]):
+            self.regexes = [re.compile('|'.join(['(?:{})'.format(r.pattern) for r in self.regexes]))]
+        self._results:dict[str, bool] = {}
+        self._each:list[NameMatcher]|None = None
+
+    def __bool__(self) -> bool:
+        return len(self.matcher) > 0
+
+    def __iter__(self):
+        return iter(self.matcher)
+
+    def match(self, tagname:str) -> bool:
+        if (result:=self._results.get(tagname)) is None:
+            name = t(tagname)
+            result = name in self.simple or name.startswith(self.prefixes) or name.endswith(self.suffixes)\
+                or any([r.search(name) is not None for r in self.regexes])
+            self._results[tagname] = result
+        return result
+
+    def each(self) -> list[NameMatcher]:
+        "matcher of each pattern in order"
+        if self._each is None:
+            self._each = [NameMatcher([x]) for x in self.matcher]
+        return self._each
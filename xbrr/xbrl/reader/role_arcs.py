@@ -0,0 +1,62 @@
+from typing import NamedTuple, cast
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, Tag
+
+LINKBASE_NS = "http://www.xbrl.org/2003/linkbase"
+ARCROLES = ['parent-child','summation-item','domain-member', 'dimension-domain', 'all', 'hypercube-dimension']
+
+
+class RoleArc(NamedTuple):
+    """an arc of a role in a linkbase, hrefs are absolute xsd uri with element name"""
+    parent_href: str
+    child_href: str
+    use: str
+    priority: str
+    order: str
+    weight: str     # calculationArc only
+
+
+def read_role_arcs(doc:BeautifulSoup, docuri:str, role_link:str, link_node:str, arc_node:str) -> list[RoleArc]:
+    """
+    Read the arcs of a role in a presentation or calculation linkbase, in the order of the document.
+
+    Arguments:
+        doc -- linkbase document.
+        docuri -- uri of the linkbase, which the relative hrefs of the locs are resolved against.
+        role_link -- role uri.
+        link_node -- link element name without prefix, ex. presentationLink.
+        arc_node -- arc element name without prefix, ex. presentationArc.
+
+    Returns:
+        list[RoleArc] -- arcs of the role.
+    """
+    def get_absxsduri(href:str) -> str:
+        if href.startswith('http'): return href
+        return urljoin(docuri, href)
+
+    ns_prefixes = {v: k for k,v in doc._namespaces.items()}
+    if (link_prefix:=ns_prefixes.get(LINKBASE_NS)) is not None:
+        link_node, arc_node = f"{link_prefix}:{link_node}", f"{link_prefix}:{arc_node}"
+    assert len(doc.contents)==0 or "xlink" in doc._namespaces
+
+    locs:dict[str,str] = {}
+    for loc in doc.find_all("loc"):
+        if not isinstance(loc, Tag): continue
+        locs[cast(str,loc["xlink:label"])] = cast(str,loc["xlink:href"])
+
+    is_calculation = arc_node.split(':')[-1] == "calculationArc"
+    arcs:list[RoleArc] = []
+    for role in doc.find_all(link_node, {"xlink:role": role_link}):
+        if not isinstance(role, Tag): continue
+        for arc in role.find_all(arc_node, recursive=False):
+            if not isinstance(arc, Tag): continue
+            assert str(arc["xlink:arcrole"]).split('/')[-1] in ARCROLES
+            arcs.append(RoleArc(
+                parent_href=get_absxsduri(locs[cast(str,arc["xlink:from"])]),
+                child_href=get_absxsduri(locs[cast(str,arc["xlink:to"])]),
+                use=str(arc.get('use','')),
+                priority=str(arc.get('priority','0')),
+                order=str(arc.get('order','0')),
+                weight=str(arc['weight']) if is_calculation else ''))
+    return arcs
@@ -1,4 +1,6 @@
 import datetime
+from collections import Counter
+from collections.abc import MutableMapping
 from datetime import timedelta
 
 from xbrr.xbrl.reader.element_schema import ElementSchema
@@ -7,18 +9,32 @@ from xbrr.xbrl.reader.element_schema import ElementSchema
 class SchemaDicts():
 
     def __init__(self):
-        self.schema_dicts: dict[str, dict[str, ElementSchema]] = {}
+        self.schema_dicts: dict[str, MutableMapping[str, ElementSchema]] = {}
         self.custom_dict: dict[str, ElementSchema] = {}
+        # memoized routes: (xsduri, nsprefix) -> resolved dictionary
+        self._routes: dict[tuple[str, str], MutableMapping[str, ElementSchema]] = {}
+        # flat lookup table merged across loaded taxonomy versions: link -> ElementSchema
+        self.link_table: dict[str, ElementSchema] = {}
+        self._stats: Counter = Counter()
 
-    def add(self, family:str, schema_dict:dict[str, ElementSchema]):
+    def add(self, family:str, schema_dict:MutableMapping[str, ElementSchema]):
         if family not in self.schema_dicts.keys():
             self.schema_dicts[family] = schema_dict
+            self._routes.clear()
 
-    def get_dict(self, xsduri:str, element:str) -> dict[str, ElementSchema]:
+    def get_dict(self, xsduri:str, element:str) -> MutableMapping[str, ElementSchema]:
         # element: tse-acedjpfr-36450_XXXXX, jpcrp030000-asr_E05739-000_XXXXX
+        nsprefix = element.rsplit('_', 1)[0]    # tse-acedjpfr-36450, jpcrp030000-asr_E05739-000
+        if (route:=self._routes.get((xsduri, nsprefix))) is not None:
+            self._stats['route_hit'] += 1
+            return route
+        self._stats['route_miss'] += 1
+        route = self._routes[(xsduri, nsprefix)] = self._resolve_dict(xsduri, nsprefix)
+        return route
+
+    def _resolve_dict(self, xsduri:str, nsprefix:str) -> MutableMapping[str, ElementSchema]:
         def isStockCode(code:str):             # 銘柄コード for 130A0 or E05739-000
             return code[0:2].isdigit() and len(code)==5 or code.startswith('E') and len(code)==10
-        nsprefix = element.rsplit('_', 1)[0]    # tse-acedjpfr-36450, jpcrp030000-asr_E05739-000
         nsp_code = nsprefix.split('-')[-1] if '_' not in nsprefix else nsprefix.split('_')[-1]   # 36450, E05739-000
 
         if isStockCode(nsp_code):
@@ -28,3 +44,24 @@ class SchemaDicts():
                 if family in xsduri:
                     return self.schema_dicts[family]
         raise Exception(f"Unknown schema:{xsduri} provided")
+
+    def lookup(self, link:str) -> ElementSchema|None:
+        """find ElementSchema by link (ns_or_xsduri#element) with a single hash probe"""
+        if (schema:=self.link_table.get(link)) is not None:
+            self._stats['link_hit'] += 1
+        else:
+            self._stats['link_miss'] += 1
+        return schema
+
+    def register(self, link:str, schema:ElementSchema):
+        self.link_table[link] = schema
+
+    @property
+    def statistics(self) -> dict[str, int|float]:
+        """hit counts and hit ratios of route and link lookups"""
+        stats:dict[str, int|float] = {key: self._stats[key] for key in
+                                      ['route_hit', 'route_miss', 'link_hit', 'link_miss']}
+        for kind in ['route', 'link']:
+            total = stats[f'{kind}_hit'] + stats[f'{kind}_miss']
+            stats[f'{kind}_hit_ratio'] = stats[f'{kind}_hit'] / total if total else 0.0
+        return stats
@@ -0,0 +1,160 @@
+import mmap
+import os
+import struct
+from collections.abc import MutableMapping
+from typing import Iterator, Mapping
+
+from xbrr.xbrl.reader.element_schema import ElementSchema
+
+MAGIC = b"XBRRSCH2"
+# magic, number of strings, number of records, in the native byte order as memoryview.cast() reads
+HEADER = struct.Struct("=8sII")
+FIELDS = ('name', 'reference', 'label', 'alias', 'abstract', 'data_type', 'period_type', 'balance', 'verbose_label')
+# a record is the string indices of the key and the fields
+RECORD = ('key',) + FIELDS
+# string index of a None field value
+NONE = 0xFFFFFFFF
+
+
+class SchemaStore(MutableMapping):
+    """
+    Read-only ElementSchema dictionary of a taxonomy version in a flat file, which is mmapped.
+
+    The file has a string table and a record of string indices for each element sorted by key,
+    so worker processes attaching to the same file share its pages without copying them,
+    and an ElementSchema is materialized only when it's looked up.
+    The materialized and added ElementSchemas are kept in an overlay dict of the process.
+    """
+
+    def __init__(self, path:str):
+        """
+        Arguments:
+            path -- file written by SchemaStore.write().
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, n_strings, n_records = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a schema store.")
+        view = memoryview(self._mmap)
+        offset = HEADER.size
+        self._offsets = view[offset:offset + (n_strings + 1) * 4].cast('I')
+        offset += (n_strings + 1) * 4
+        self._records = view[offset:offset + n_records * len(RECORD) * 4].cast('I')
+        offset += n_records * len(RECORD) * 4
+        self._strings_offset = offset
+        self._n_records = n_records
+
+        self._overlay:dict[str, ElementSchema] = {}
+        self._added:set[str] = set()
+        self._deleted:set[str] = set()
+
+    def __reduce__(self):
+        # a worker attaches to the file, the overlay is not passed
+        return type(self), (self.path,)
+
+    @classmethod
+    def write(cls, path:str, schemas:Mapping[str, ElementSchema]):
+        """
+        Write ElementSchemas into a file.
+
+        Arguments:
+            path -- file to write.
+            schemas -- key (element id) to ElementSchema.
+        """
+        strings:dict[str, int] = {}
+        def index(value) -> int:
+            if value is None:
+                return NONE     # kept as None, not as ""
+            value = str(value)
+            if value not in strings:
+                strings[value] = len(strings)
+            return strings[value]
+
+        keys = sorted(schemas.keys(), key=lambda key: key.encode())
+        records = [index(key) if field == 'key' else index(getattr(schemas[key], field, ""))
+                   for key in keys for field in RECORD]
+        blobs = [string.encode() for string in strings]
+        offsets = [0]
+        for blob in blobs:
+            offsets.append(offsets[-1] + len(blob))
+
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, len(blobs), len(keys)))
+            f.write(struct.pack(f"={len(offsets)}I", *offsets))
+            f.write(struct.pack(f"={len(records)}I", *records))
+            f.write(b"".join(blobs))
+        os.replace(tmp_path, path)
+
+    def close(self):
+        self._offsets.release()
+        self._records.release()
+        self._mmap.close()
+
+    def _value(self, i:int) -> str|None:
+        return None if i == NONE else self._bytes(i).decode()
+
+    def _bytes(self, i:int) -> bytes:
+        return self._mmap[self._strings_offset + self._offsets[i]:self._strings_offset + self._offsets[i+1]]
+
+    def _key(self, record:int) -> bytes:
+        return self._bytes(self._records[record * len(RECORD)])
+
+    def _find(self, key:str) -> int:
+        """record of the key by binary search, -1 if not found"""
+        target = key.encode()
+        lo, hi = 0, self._n_records
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo if lo < self._n_records and self._key(lo) == target else -1
+
+    def _materialize(self, record:int) -> ElementSchema:
+        base = record * len(RECORD)
+        values = {field: self._value(self._records[base + i]) for i, field in enumerate(RECORD) if field != 'key'}
+        verbose_label = values.pop('verbose_label')
+        instance = ElementSchema(**values)
+        instance.verbose_label = verbose_label
+        return instance
+
+    def __getitem__(self, key:str) -> ElementSchema:
+        if (instance:=self._overlay.get(key)) is not None:
+            return instance
+        if key in self._deleted or (record:=self._find(key)) < 0:
+            raise KeyError(key)
+        instance = self._overlay[key] = self._materialize(record)
+        return instance
+
+    def __contains__(self, key) -> bool:
+        if not isinstance(key, str):
+            return False
+        return key in self._overlay or (key not in self._deleted and self._find(key) >= 0)
+
+    def __setitem__(self, key:str, instance:ElementSchema):
+        if key not in self._overlay and self._find(key) < 0:
+            self._added.add(key)
+        self._deleted.discard(key)
+        self._overlay[key] = instance
+
+    def __delitem__(self, key:str):
+        if key not in self:
+            raise KeyError(key)
+        self._overlay.pop(key, None)
+        if key in self._added:
+            self._added.discard(key)
+        else:
+            self._deleted.add(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for record in range(self._n_records):
+            if (key:=self._key(record).decode()) not in self._deleted:
+                yield key
+        yield from list(self._added)
+
+    def __len__(self) -> int:
+        return self._n_records - len(self._deleted) + len(self._added)
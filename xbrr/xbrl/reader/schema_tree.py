@@ -1,11 +1,25 @@
 import os
+import threading
+import time
+from typing import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 from bs4 import BeautifulSoup, Tag
 
 from xbrr.base.reader.base_reader import BaseReader
 
 class SchemaTree():
-    def __init__(self, reader:BaseReader, base_xsd:str):
+    def __init__(self, reader:BaseReader, base_xsd:str, breadth_first:bool=False, max_workers:int=0):
+        """
+        Arguments:
+            reader -- reader to read xsd files.
+            base_xsd -- xsd file of the submitted document.
+
+        Keyword Arguments:
+            breadth_first {bool} -- traverse imports level by level (default: {False}).
+            max_workers {int} -- number of threads to prefetch the imports of
+                                 a level in breadth first traversal (default: {0}).
+        """
         self.reader = reader
         self.base_xsduri = os.path.basename(base_xsd)
         base_namespace = self.get_targetNamespace(self.base_xsduri)
@@ -13,7 +27,21 @@ class SchemaTree():
         self.namespace_uri[base_namespace] = self.base_xsduri
         self.namespace_linkbaseRef = {}
         self.linkbaseRefs = []
-        self.read_import_tree(base_namespace, self.base_xsduri)
+        # import DAG: xsduri -> imported xsduris, and reading time of each xsduri
+        self.import_graph:dict[str, list[str]] = {}
+        self.import_timings:dict[str, float] = {}
+        if breadth_first:
+            self.read_import_tree_bfs(base_namespace, self.base_xsduri, max_workers)
+        else:
+            self.read_import_tree(base_namespace, self.base_xsduri)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('reader', None)
+        return state
+
+    def bind(self, reader:BaseReader):
+        self.reader = reader
 
     def get_targetNamespace(self, xsduri:str):
         xsd_xml = self.reader.read_uri(xsduri)
@@ -22,20 +50,67 @@ class SchemaTree():
             return ''
         return str(schema['targetNamespace'])
 
-    def read_import_tree(self, xsd_ns:str, xsduri:str):
+    def read_import_tree(self, xsd_ns:str, xsduri:str, xmls:dict[str, BeautifulSoup]|None=None):
+        # depth first traversal which visits each xsd only once
+        if xsduri in self.import_graph:
+            return
+        xsd_xml = xmls[xsduri] if xmls is not None else self.timed_read_uri(xsduri)
+        for ref_ns, ref_xsduri in self.read_imports(xsd_ns, xsduri, xsd_xml):
+            self.read_import_tree(ref_ns, ref_xsduri, xmls)
+
+    def read_import_tree_bfs(self, xsd_ns:str, xsduri:str, max_workers:int=0):
+        # breadth first traversal, reading the independent imports of a level in parallel.
+        # the reader (lru caches, taxonomy downloads) is not thread safe, so the reads are
+        # serialized by a lock, and the tree is then walked depth first over the fetched
+        # xsds, which keeps the discovery order of the linkbaseRefs (first match wins).
+        lock = threading.Lock()
+        def read(uri:str) -> BeautifulSoup:
+            with lock:
+                return self.timed_read_uri(uri)
+
+        xmls:dict[str, BeautifulSoup] = {}
+        level = [xsduri]
+        executor = ThreadPoolExecutor(max_workers) if max_workers > 0 else None
+        try:
+            while level:
+                fetched = list(executor.map(read, level)) if executor is not None\
+                    else [read(uri) for uri in level]
+                next_level = []
+                for uri, xsd_xml in zip(level, fetched):
+                    xmls[uri] = xsd_xml
+                    for ref in xsd_xml.find_all('import'):
+                        if not isinstance(ref, Tag): continue
+                        ref_xsduri = urljoin(uri, str(ref['schemaLocation']))
+                        if ref_xsduri not in xmls and ref_xsduri not in next_level:
+                            next_level.append(ref_xsduri)
+                level = [uri for uri in next_level if uri not in xmls]
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        self.read_import_tree(xsd_ns, xsduri, xmls)
+
+    def timed_read_uri(self, xsduri:str) -> BeautifulSoup:
+        start = time.perf_counter()
+        xsd_xml = self.reader.read_uri(xsduri)
+        self.import_timings[xsduri] = time.perf_counter() - start
+        return xsd_xml
+
+    def read_imports(self, xsd_ns:str, xsduri:str, xsd_xml:BeautifulSoup) -> Iterator[tuple[str,str]]:
+        """yield imported (namespace, xsduri) in document order while recording linkbaseRefs"""
         def get_absxsduri(docuri, xsduri):
             if xsduri.startswith('http'): return xsduri
             return urljoin(docuri, xsduri)
         self.namespace_linkbaseRef[xsd_ns] = []
+        self.import_graph[xsduri] = []
 
-        xsd_xml = self.reader.read_uri(xsduri)
         for ref in xsd_xml.find_all(['import','link:linkbaseRef']):
             if not isinstance(ref, Tag): continue
             if ref.name=='import':
                 ref_ns = str(ref['namespace'])
                 ref_xsduri = urljoin(xsduri, str(ref['schemaLocation']))
                 self.namespace_uri[ref_ns] = ref_xsduri
-                self.read_import_tree(ref_ns, ref_xsduri)
+                self.import_graph[xsduri].append(ref_xsduri)
+                yield ref_ns, ref_xsduri
             else: # link:linkbaseRef
                 # ex.: <link:linkbaseRef xlink:type="simple" xlink:href="jpcrp030000-asr-001_E00436-000_2018-03-31_01_2018-06-26_pre.xml" xlink:role="http://www.xbrl.org/2003/role/presentationLinkbaseRef" xlink:arcrole="http://www.w3.org/1999/xlink/properties/linkbase" />
                 linkrole_uri = str(ref.get('xlink:role'))
@@ -1,5 +1,6 @@
 import os
 import re
+from collections.abc import MutableMapping
 from datetime import datetime
 from functools import lru_cache
 
@@ -9,15 +10,18 @@ from xbrr.base.reader.base_taxonomy import BaseTaxonomy
 from xbrr.edinet.reader.taxonomy import Taxonomy as EdinetTaxonomy
 from xbrr.tdnet.reader.taxonomy import Taxonomy as TdnetTaxonomy
 from xbrr.xbrl.reader.element_schema import ElementSchema
+from xbrr.xbrl.reader.linkbase_index import LinkbaseIndex
+from xbrr.xbrl.reader.role_arcs import RoleArc
 from xbrr.xbrl.reader.schema_dicts import SchemaDicts
+from xbrr.xbrl.reader.schema_store import SchemaStore
 
 
 class TaxonomyRepository():
     def __init__(self, save_dir: str = ""):
         self.taxonomies_root = os.path.join(save_dir, "external")
 
-        # taxonomy_repo: xsd_dic for taxonomy_year
-        self.taxonomy_repo:dict[str, dict[str, ElementSchema]] = {}
+        # taxonomy_repo: xsd_dic for taxonomy_year, which is a dict or an attached SchemaStore
+        self.taxonomy_repo:dict[str, MutableMapping[str, ElementSchema]] = {}
 
         self.taxonomies:list[BaseTaxonomy] = [
             EdinetTaxonomy(self.taxonomies_root), TdnetTaxonomy(self.taxonomies_root),
@@ -37,6 +41,55 @@ class TaxonomyRepository():
                 schema_dicts.add(version, dict)
         return schema_dicts
 
+    def schema_store_path(self, version:str) -> str:
+        return os.path.join(self.taxonomies_root, "schemas", f"{version}.schemas")
+
+    def export_schemas(self, versions:list[str]|None=None) -> list[str]:
+        """
+        Write the ElementSchemas loaded for taxonomy versions into schema stores,
+        which worker processes attach to by attach_schemas().
+
+        Keyword Arguments:
+            versions -- taxonomy versions (default: {None} for all the loaded versions).
+
+        Returns:
+            list[str] -- paths of the schema stores.
+        """
+        paths = []
+        for version in (versions if versions is not None else list(self.taxonomy_repo.keys())):
+            path = self.schema_store_path(version)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            SchemaStore.write(path, self.taxonomy_repo[version])
+            paths.append(path)
+        return paths
+
+    def attach_schemas(self, versions:list[str]|None=None) -> list[str]:
+        """
+        Use the schema stores of taxonomy versions instead of loading ElementSchemas in this process.
+        The ElementSchemas which are not in a store are read from the taxonomy as usual.
+        It should be called before reading filings, the SchemaDicts of readers are not updated.
+
+        Keyword Arguments:
+            versions -- taxonomy versions (default: {None} for all the exported versions).
+
+        Returns:
+            list[str] -- attached versions.
+        """
+        if versions is None:
+            store_dir = os.path.dirname(self.schema_store_path(""))
+            versions = [os.path.splitext(f)[0] for f in sorted(os.listdir(store_dir)) if f.endswith(".schemas")]\
+                if os.path.isdir(store_dir) else []
+        attached = []
+        for version in versions:
+            if os.path.isfile(path:=self.schema_store_path(version)):
+                store = SchemaStore(path)
+                for key, schema in self.taxonomy_repo.get(version, {}).items():
+                    if key not in store:
+                        store[key] = schema
+                self.taxonomy_repo[version] = store
+                attached.append(version)
+        return attached
+
     def uri_to_path(self, uri:str) -> list[str]:
         return [t.uri_to_path(uri) for t in self.taxonomies if t.is_defined(uri)]
     
@@ -55,14 +108,26 @@ class TaxonomyRepository():
         return self.read_uri_taxonomy(uri)
     
     def __read_uri_taxonomy(self, uri) -> BeautifulSoup:
+        return self.read_file(self.taxonomy_path(uri))
+
+    def taxonomy_path(self, uri:str) -> str:
+        "local path of a taxonomy file, '' for the xbrl.org files which are not downloaded"
         path = ''
         paths = self.uri_to_path(uri)
         if len(paths) > 0:
             path = paths[0]
         elif not uri.startswith('http://www.xbrl.org/'):
             raise Exception("_uri_to_path", uri)
-        return self.read_file(path)
+        return path
     
+    def read_linkbase_index(self, uri:str) -> LinkbaseIndex:
+        "index of a taxonomy linkbase, which is shared by the filings"
+        return LinkbaseIndex.of(self.taxonomy_path(uri), uri)
+
+    def read_role_arcs(self, uri:str, role_link:str, link_node:str, arc_node:str) -> tuple[RoleArc, ...]:
+        "arcs of a role in a taxonomy linkbase"
+        return self.read_linkbase_index(uri).arcs(role_link, link_node, arc_node)
+
     def read_file(self, path:str) -> BeautifulSoup:
         if (not os.path.isfile(path)):
             return BeautifulSoup()  # no content
@@ -0,0 +1,65 @@
+import re
+from typing import Optional
+
+from lxml import etree, html
+
+PARAGRAPHS = etree.XPath('.//p')
+XML_DECLARATION = re.compile(r'^\s*<\?xml[^>]*\?>')
+DOCUMENT_TAGS = re.compile(r'<(html|body)[\s/>]', re.I)
+
+
+class TextBlockElement():
+    """text, attributes and paragraphs of an element of TextBlock html"""
+    __slots__ = ('text', 'attrib', 'paragraphs', 'paragraph_style')
+
+    def __init__(self, elem:html.HtmlElement, paragraphs:bool=False):
+        self.text = str(elem.text_content())
+        self.attrib = dict(elem.attrib)
+        ps = PARAGRAPHS(elem) if paragraphs else []
+        self.paragraphs = [str(p.text_content()) for p in ps]
+        self.paragraph_style = ps[0].get('style', '') if ps else ''
+
+    def get(self, name:str, default=None):
+        return self.attrib.get(name, default)
+
+
+class TextBlockTable():
+    """rows of td cells of a table, thead rows are separated from the body rows"""
+    __slots__ = ('head', 'body', 'nested')
+
+    def __init__(self, table:html.HtmlElement):
+        def rows(parent) -> list[list[TextBlockElement]]:
+            return [[TextBlockElement(td, paragraphs=True) for td in tr if td.tag == 'td']
+                    for tr in parent if tr.tag == 'tr']
+        thead = next((e for e in table if e.tag == 'thead'), None)
+        tbody = next((e for e in table if e.tag == 'tbody'), None)
+        self.head:Optional[list[list[TextBlockElement]]] = rows(thead) if thead is not None else None
+        self.body = rows(tbody if tbody is not None else table)
+        self.nested = next(table.iterancestors('table'), None) is not None
+
+
+class TextBlock():
+    """
+    Tables of TextBlock html as grids of cells, which are read in one pass by lxml.
+    """
+
+    def __init__(self, html_text:str):
+        """
+        Arguments:
+            html_text -- unescaped html of TextBlock.
+        """
+        text = XML_DECLARATION.sub('', html_text)
+        root = html.fragment_fromstring(text, create_parent='div')
+
+        # elements before the first table, where the unit of the statements is written
+        # html and body are dropped by lxml, the whole text is kept as one leading element
+        # when they are present, which keeps the old unit detection that scanned the whole document text
+        self.leading:list[TextBlockElement] = [TextBlockElement(root)] if DOCUMENT_TAGS.search(text) else []
+        self.tables:list[TextBlockTable] = []
+        for elem in root.iterdescendants():
+            if not isinstance(elem.tag, str):
+                continue    # comment or processing instruction
+            if elem.tag == 'table':
+                self.tables.append(TextBlockTable(elem))
+            elif not self.tables:
+                self.leading.append(TextBlockElement(elem))
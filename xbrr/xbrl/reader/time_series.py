@@ -0,0 +1,179 @@
+from typing import Iterable, Literal, Optional, Sequence
+
+import importlib
+import importlib.util
+import os
+from logging import getLogger
+
+import pandas as pd
+from pandas import DataFrame
+
+from xbrr.base.reader.xbrl_doc import XbrlDoc
+from xbrr.xbrl.reader.analysis_cache import AnalysisCache
+from xbrr.xbrl.reader.reader import Reader
+from xbrr.xbrl.reader.taxonomy_repository import TaxonomyRepository
+
+if importlib.util.find_spec("joblib") is not None:
+    from joblib import Parallel, delayed
+else:
+    Parallel = None
+
+Statement = Literal['bs','pl','cf']
+
+
+class TimeSeries():
+    """
+    Long-format panel of the financial statements (bs, pl and cf) of the filings of issuers.
+
+    The filings are read with one TaxonomyRepository, so the taxonomy schemas and
+    the arcs of the taxonomy linkbases are loaded once and shared by all the filings.
+    The values are aligned by statement, element name, period and member,
+    and the value of the latest published filing is kept for restated periods.
+    """
+
+    COLUMNS = ['issuer', 'statement', 'name', 'label', 'consolidated', 'context', 'member',
+               'period_start', 'period', 'value', 'unit', 'decimals', 'published_date', 'filing']
+    KEYS = ['issuer', 'statement', 'name', 'consolidated', 'member', 'period_start', 'period']
+
+    def __init__(self, taxonomy_repo:Optional[TaxonomyRepository]=None, save_dir:str="",
+                 cache:Optional[AnalysisCache]=None, statements:Sequence[Statement]=('bs','pl','cf'),
+                 errors:Literal['raise','ignore']='raise'):
+        """
+        Keyword Arguments:
+            taxonomy_repo -- repository shared by the filings (default: {None} to create one for save_dir).
+            save_dir -- directory of the downloaded taxonomies (default: {""}).
+            cache -- analysis cache of the filings (default: {None}).
+            statements -- financial statements of the panel (default: {('bs','pl','cf')}).
+            errors -- 'raise' the error of a filing, or 'ignore' (log) it and skip the filing (default: {'raise'}).
+        """
+        self.taxonomy_repo = taxonomy_repo if taxonomy_repo is not None else TaxonomyRepository(save_dir)
+        self.save_dir = save_dir
+        self.cache = cache
+        self.statements = tuple(statements)
+        self.errors = errors
+        self.logger = getLogger(__name__)
+
+    def reader(self, xbrl_doc:XbrlDoc) -> Reader:
+        return Reader(xbrl_doc, taxonomy_repo=self.taxonomy_repo, save_dir=self.save_dir, cache=self.cache)
+
+    @staticmethod
+    def finance_class(xbrl_doc:XbrlDoc) -> type:
+        return getattr(importlib.import_module(f"xbrr.{xbrl_doc.package}.reader.aspects.finance"), "Finance")
+
+    def read_filing(self, xbrl_doc:XbrlDoc, issuer:str="") -> DataFrame:
+        """
+        Read the statements of a filing.
+
+        Arguments:
+            xbrl_doc -- filing.
+
+        Keyword Arguments:
+            issuer -- issuer column of the rows (default: {""}).
+
+        Returns:
+            DataFrame -- rows in COLUMNS.
+        """
+        finance = self.reader(xbrl_doc).extract(self.finance_class(xbrl_doc))
+        published_date = xbrl_doc.published_date[0]
+        frames = []
+        for statement in self.statements:
+            df = getattr(finance, statement)()
+            if len(df) == 0: continue
+            df = df.reindex(columns=self.COLUMNS)
+            df['issuer'] = issuer
+            df['statement'] = statement
+            df['published_date'] = published_date
+            df['filing'] = os.path.basename(xbrl_doc.xbrl_file)
+            frames.append(df)
+        return pd.concat(frames, ignore_index=True) if frames else DataFrame(columns=self.COLUMNS)
+
+    def build(self, xbrl_docs:Iterable[XbrlDoc], issuer:str="") -> DataFrame:
+        """
+        Build the panel of the filings of an issuer.
+
+        Arguments:
+            xbrl_docs -- filings of the issuer, in any order.
+
+        Keyword Arguments:
+            issuer -- issuer column of the rows (default: {""}).
+
+        Returns:
+            DataFrame -- rows in COLUMNS, one row for each KEYS, sorted by KEYS.
+        """
+        frames = []
+        for xbrl_doc in xbrl_docs:
+            try:
+                frames.append(self.read_filing(xbrl_doc, issuer))
+            except Exception as ex:
+                if self.errors == 'raise':
+                    raise
+                self.logger.warning(f"{xbrl_doc.xbrl_file} is skipped: {ex}")
+        return self.align(frames)
+
+    @classmethod
+    def align(cls, frames:list[DataFrame]) -> DataFrame:
+        """
+        Concat the rows of filings, and keep the row of the latest published filing for each KEYS.
+        The rows without period (ex. read from a textblock) can't be aligned, and are dropped.
+        """
+        frames = [df for df in frames if len(df) > 0]
+        if not frames:
+            return DataFrame(columns=cls.COLUMNS)
+        panel = pd.concat(frames, ignore_index=True)
+        panel['period_start'] = pd.to_datetime(panel['period_start'])
+        panel['period'] = pd.to_datetime(panel['period'])
+        panel = panel[panel['period'].notna()]
+        # stable sort keeps the order of the rows in a filing
+        panel = panel.sort_values('published_date', kind='stable')
+        panel = panel.drop_duplicates(subset=cls.KEYS, keep='last')
+        return panel.sort_values(cls.KEYS, kind='stable').reset_index(drop=True)
+
+    def build_issuers(self, issuers:dict[str, list[XbrlDoc]], n_jobs:int=1) -> DataFrame:
+        """
+        Build the panel of issuers.
+
+        With n_jobs other than 1, the issuers are split into batches which are built in
+        worker processes by joblib (when installed), each worker shares its own
+        TaxonomyRepository with the filings of its batch.
+        The first issuer is built in this process before dispatching, which loads the ElementSchemas
+        of its taxonomy versions. They are exported to schema stores, which the workers attach to
+        instead of loading their own copies. The schemas of the other versions (ex. filings of
+        other years) are loaded by each worker, so preload them by reading a filing of each version
+        with taxonomy_repo beforehand to share them as well.
+
+        Arguments:
+            issuers -- issuer to its filings.
+
+        Keyword Arguments:
+            n_jobs -- number of worker processes, -1 for the number of cpus (default: {1}).
+
+        Returns:
+            DataFrame -- rows in COLUMNS.
+        """
+        items = list(issuers.items())
+        if n_jobs == 1 or len(items) <= 1 or Parallel is None:
+            return self.build_batch(items)
+
+        frames = [self.build_batch(items[:1])]
+        self.taxonomy_repo.export_schemas()
+        items = items[1:]
+        n_batches = min(len(items), n_jobs if n_jobs > 0 else os.cpu_count() or 1)
+        batches = [items[i::n_batches] for i in range(n_batches)]
+        frames += Parallel(n_jobs=n_batches)(
+            delayed(_build_batch)(batch, self.save_dir, self.cache.cache_dir if self.cache is not None else "",
+                                  self.statements, self.errors) for batch in batches)
+        return pd.concat([df for df in frames if len(df) > 0] or [DataFrame(columns=self.COLUMNS)], ignore_index=True)
+
+    def build_batch(self, items:list[tuple[str, list[XbrlDoc]]]) -> DataFrame:
+        frames = [self.build(xbrl_docs, issuer) for issuer, xbrl_docs in items]
+        return pd.concat([df for df in frames if len(df) > 0] or [DataFrame(columns=self.COLUMNS)], ignore_index=True)
+
+
+def _build_batch(items:list[tuple[str, list[XbrlDoc]]], save_dir:str, cache_dir:str,
+                 statements:Sequence[Statement], errors:Literal['raise','ignore']) -> DataFrame:
+    # a worker process creates its repository, which is not picklable, and attaches to the exported schema stores
+    # the analysis cache is rebuilt from its directory as well
+    taxonomy_repo = TaxonomyRepository(save_dir)
+    taxonomy_repo.attach_schemas()
+    cache = AnalysisCache(cache_dir) if cache_dir else None
+    return TimeSeries(taxonomy_repo, save_dir=save_dir, cache=cache, statements=statements, errors=errors).build_batch(items)